@@ -21,6 +21,7 @@ class MultimodalQueryRequest(BaseModel):
     query: str
     mode: str = "hybrid"
     multimodal_content: List[Dict[str, Any]] = []
+    pipelined: Optional[bool] = None
 
 
 @router.post("/")
@@ -51,6 +52,7 @@ async def execute_query(request: QueryRequest):
                     "sources": [],  # TODO: Extract sources from result
                     "metadata": {
                         "vlm_enhanced": request.vlm_enhanced,
+                        **result.get("metadata", {}),
                     },
                 },
             )
@@ -74,6 +76,7 @@ async def execute_multimodal_query(request: MultimodalQueryRequest):
             query=request.query,
             multimodal_content=request.multimodal_content,
             mode=request.mode,
+            pipelined=request.pipelined,
         )
 
         if result.get("success"):
@@ -85,6 +88,7 @@ async def execute_multimodal_query(request: MultimodalQueryRequest):
                     "answer": result.get("answer", ""),
                     "multimodal_content_count": len(request.multimodal_content),
                     "sources": [],  # TODO: Extract sources
+                    "metadata": result.get("metadata", {}),
                 },
             )
         else:
@@ -9,6 +9,7 @@ import asyncio
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from raganything import RAGAnything, RAGAnythingConfig
+from raganything.image_prep import detect_base64_image_mime_type
 from lightrag import LightRAG
 from lightrag.utils import EmbeddingFunc
 from lightrag.llm.openai import openai_complete_if_cache, openai_embed
@@ -54,6 +55,8 @@ class RAGService:
                 enable_image_processing=settings.ENABLE_IMAGE_PROCESSING,
                 enable_table_processing=settings.ENABLE_TABLE_PROCESSING,
                 enable_equation_processing=settings.ENABLE_EQUATION_PROCESSING,
+                text_model_name=settings.DEFAULT_LLM_MODEL,
+                vision_model_name=settings.DEFAULT_VISION_MODEL,
             )
 
             # Define LLM model function
@@ -107,7 +110,7 @@ class RAGService:
                                     {
                                         "type": "image_url",
                                         "image_url": {
-                                            "url": f"data:image/jpeg;base64,{image_data}"
+                                            "url": f"data:{detect_base64_image_mime_type(image_data)};base64,{image_data}"
                                         },
                                     },
                                 ],
@@ -229,11 +232,13 @@ class RAGService:
             Dict with query results
         """
         try:
-            # Execute query
-            result = await self.rag.aquery(
+            # Execute query; metadata reports images sent and dropped by the
+            # VLM image budget
+            result, metadata = await self.rag.aquery(
                 query=query,
                 mode=mode,
                 vlm_enhanced=vlm_enhanced,
+                return_metadata=True,
                 **kwargs
             )
 
@@ -243,6 +248,7 @@ class RAGService:
                 "mode": mode,
                 "answer": result,
                 "vlm_enhanced": vlm_enhanced,
+                "metadata": metadata,
             }
 
         except Exception as e:
@@ -273,10 +279,12 @@ class RAGService:
             Dict with query results
         """
         try:
-            result = await self.rag.aquery_with_multimodal(
+            # Execute query; metadata holds the latency breakdown
+            result, metadata = await self.rag.aquery_with_multimodal(
                 query=query,
                 multimodal_content=multimodal_content,
                 mode=mode,
+                return_metadata=True,
                 **kwargs
             )
 
@@ -286,6 +294,7 @@ class RAGService:
                 "mode": mode,
                 "answer": result,
                 "multimodal_content_count": len(multimodal_content),
+                "metadata": metadata,
             }
 
         except Exception as e:
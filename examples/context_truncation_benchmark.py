@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+"""
+Context Truncation Micro-Benchmark for RAG-Anything
+
+Runs ImageModalProcessor.generate_description_only for every figure of a
+synthetic document with a stubbed vision model, comparing:
+
+- Encode/decode: the page-window context is joined, fully encoded, cut to the
+  token budget and decoded back (previous behaviour)
+- Block assembly: whole blocks are taken using cached token counts and only
+  the block crossing the budget is tokenized
+
+Both modes use the same prebuilt context index, so the difference is the
+truncation cost alone.
+
+Usage:
+    python examples/context_truncation_benchmark.py --pages 300 --figures 600
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lightrag import LightRAG
+from lightrag.utils import EmbeddingFunc, Tokenizer
+
+from context_index_benchmark import build_content_list, load_tokenizer
+from raganything.modalprocessors import (
+    ContextConfig,
+    ContextExtractor,
+    ImageModalProcessor,
+)
+
+# 1x1 transparent PNG
+PNG_BYTES = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082"
+)
+
+
+class EncodeDecodeExtractor(ContextExtractor):
+    """Context extractor using the previous join, encode, cut and decode truncation"""
+
+    def _extract_page_context_indexed(self, context_index, current_item_info):
+        current_page = current_item_info.get("page_idx", 0)
+        window_size = self.config.context_window
+        start_page = max(0, current_page - window_size)
+        end_page = current_page + window_size + 1
+
+        self._render_index_pages(context_index, start_page, end_page)
+        context_texts = []
+        for offset in context_index.blocks_in_pages(start_page, end_page):
+            if offset not in context_index.blocks:
+                continue
+            item_page = context_index.content_list[offset].get("page_idx", 0)
+            text_content = context_index.blocks[offset][0]
+            if item_page != current_page:
+                context_texts.append(f"[Page {item_page}] {text_content}")
+            else:
+                context_texts.append(text_content)
+        return self._truncate_context("\n".join(context_texts))
+
+
+async def stub_vision_model(prompt, image_data=None, system_prompt=None, **kwargs):
+    return json.dumps(
+        {
+            "detailed_description": "A benchmark figure.",
+            "entity_info": {
+                "entity_name": "Benchmark Figure",
+                "entity_type": "image",
+                "summary": "Synthetic figure used for benchmarking.",
+            },
+        }
+    )
+
+
+async def stub_llm(prompt, **kwargs):
+    return ""
+
+
+async def stub_embedding(texts):
+    import numpy as np
+
+    return np.zeros((len(texts), 8))
+
+
+async def run_mode(processor, figures) -> tuple:
+    """Describe every figure and return (seconds, mean context characters)"""
+    context_chars = 0
+    start = time.perf_counter()
+    for item_info, modal_content in figures:
+        await processor.generate_description_only(
+            modal_content, "image", item_info=item_info
+        )
+    elapsed = time.perf_counter() - start
+
+    for item_info, _ in figures:
+        context_chars += len(processor._get_context_for_item(item_info))
+    return elapsed, context_chars / max(len(figures), 1)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Context truncation benchmark")
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--figures", type=int, default=600)
+    parser.add_argument("--texts-per-page", type=int, default=12)
+    parser.add_argument("--window", type=int, default=1, help="Context window")
+    parser.add_argument("--max-tokens", type=int, default=500)
+    args = parser.parse_args()
+
+    tokenizer, tokenizer_name = load_tokenizer()
+    content_list = build_content_list(args.pages, args.figures, args.texts_per_page)
+
+    with tempfile.TemporaryDirectory(prefix="truncation_bench_") as workdir:
+        image_path = Path(workdir) / "figure.png"
+        image_path.write_bytes(PNG_BYTES)
+        for item in content_list:
+            if item["type"] == "image":
+                item["img_path"] = str(image_path)
+
+        figures = [
+            ({"page_idx": item["page_idx"], "index": i, "type": "image"}, item)
+            for i, item in enumerate(content_list)
+            if item["type"] == "image"
+        ]
+
+        lightrag = LightRAG(
+            working_dir=workdir,
+            llm_model_func=stub_llm,
+            embedding_func=EmbeddingFunc(
+                embedding_dim=8, max_token_size=8192, func=stub_embedding
+            ),
+            tokenizer=Tokenizer(model_name=tokenizer_name, tokenizer=tokenizer),
+        )
+        config = ContextConfig(
+            context_window=args.window, max_context_tokens=args.max_tokens
+        )
+
+        print(
+            f"{len(content_list)} blocks, {len(figures)} figures, "
+            f"budget {args.max_tokens} tokens, tokenizer: {tokenizer_name}"
+        )
+        print(f"\n{'mode':<18}{'total s':>10}{'per item ms':>14}{'ctx chars':>12}")
+        results = {}
+        for mode, extractor_cls in (
+            ("encode/decode", EncodeDecodeExtractor),
+            ("block assembly", ContextExtractor),
+        ):
+            processor = ImageModalProcessor(
+                lightrag=lightrag,
+                modal_caption_func=stub_vision_model,
+                context_extractor=extractor_cls(config, tokenizer=tokenizer),
+            )
+            processor.set_content_source(content_list, "minerU")
+            elapsed, mean_chars = await run_mode(processor, figures)
+            results[mode] = elapsed
+            print(
+                f"{mode:<18}{elapsed:>10.2f}"
+                f"{elapsed / len(figures) * 1000:>14.3f}{mean_chars:>12.0f}"
+            )
+
+        print(
+            f"\nSpeedup: "
+            f"{results['encode/decode'] / max(results['block assembly'], 1e-9):.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
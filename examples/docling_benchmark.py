@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+"""
+Docling Conversion Benchmark for RAG-Anything
+
+Compares Docling parse time on a mixed PDF/DOCX/HTML set when:
+
+- Two-pass: the docling CLI is run twice per document (--to json, then --to md)
+- Single-pass: one docling run writes both the JSON and Markdown exports
+- In-process: one DocumentConverter is kept in the process and reused
+
+Documents can be passed on the command line; otherwise a small synthetic set
+of PDF and HTML files (plus DOCX files if python-docx is installed) is
+generated.
+
+With --docx-throughput N, N small DOCX files are also parsed through
+BatchParser, comparing CLI workers against worker processes that each keep an
+in-process converter (requires python-docx).
+
+Requires Docling to be installed (pip install docling).
+
+Usage:
+    python examples/docling_benchmark.py
+    python examples/docling_benchmark.py report.pdf notes.docx page.html
+    python examples/docling_benchmark.py --docx-throughput 500 --workers 4
+"""
+
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from raganything.batch_parser import BatchParser
+from raganything.parser import DoclingParser
+
+
+def write_pdf(path: Path, lines: list) -> None:
+    """Write a minimal single-page PDF containing a few lines of text"""
+    text_ops = " ".join(f"({line}) Tj 0 -24 Td" for line in lines)
+    stream = f"BT /F1 14 Tf 72 720 Td {text_ops} ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>",
+        b"<< /Length "
+        + str(len(stream)).encode()
+        + b" >>\nstream\n"
+        + stream
+        + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n".encode() + obj + b"\nendobj\n"
+    xref_offset = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n"
+    ).encode()
+    path.write_bytes(bytes(out))
+
+
+def write_html(path: Path, index: int) -> None:
+    """Write a small HTML page with a heading, paragraphs, and a table"""
+    rows = "".join(
+        f"<tr><td>Item {i}</td><td>{i * index}</td></tr>" for i in range(1, 6)
+    )
+    path.write_text(
+        f"<html><body><h1>Benchmark page {index}</h1>"
+        f"<p>This page exercises the Docling HTML backend.</p>"
+        f"<p>Second paragraph for document {index}.</p>"
+        f"<table><tr><th>Name</th><th>Value</th></tr>{rows}</table>"
+        f"</body></html>",
+        encoding="utf-8",
+    )
+
+
+def write_docx(path: Path, index: int) -> bool:
+    """Write a small DOCX file, returning False if python-docx is unavailable"""
+    try:
+        import docx
+    except ImportError:
+        return False
+
+    document = docx.Document()
+    document.add_heading(f"Benchmark document {index}", level=1)
+    document.add_paragraph("This document exercises the Docling DOCX backend.")
+    table = document.add_table(rows=3, cols=2)
+    for i, row in enumerate(table.rows):
+        row.cells[0].text = f"Item {i}"
+        row.cells[1].text = str(i * index)
+    document.save(str(path))
+    return True
+
+
+def build_corpus(corpus_dir: Path, count: int) -> list:
+    """Generate a mixed set of PDF, HTML, and (if possible) DOCX documents"""
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    files = []
+    for i in range(count):
+        pdf_path = corpus_dir / f"doc_{i:03d}.pdf"
+        write_pdf(pdf_path, [f"Benchmark document {i}", "Docling single pass test"])
+        files.append(pdf_path)
+
+        html_path = corpus_dir / f"page_{i:03d}.html"
+        write_html(html_path, i)
+        files.append(html_path)
+
+        docx_path = corpus_dir / f"memo_{i:03d}.docx"
+        if write_docx(docx_path, i):
+            files.append(docx_path)
+    return files
+
+
+def convert_two_pass(input_path: Path, output_dir: Path) -> None:
+    """Previous behaviour: one docling run per output format"""
+    for fmt in ("json", "md"):
+        subprocess.run(
+            ["docling", "--output", str(output_dir), "--to", fmt, str(input_path)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+
+def convert_single_pass(input_path: Path, output_dir: Path) -> None:
+    """Current behaviour: one docling run writing both formats"""
+    DoclingParser()._run_docling_command(input_path, output_dir, input_path.stem)
+
+
+def convert_in_process(input_path: Path, output_dir: Path) -> None:
+    """In-process conversion with the process-wide DocumentConverter"""
+    DoclingParser(inprocess=True)._convert_in_process(
+        input_path, output_dir, input_path.stem
+    )
+
+
+def time_mode(convert, files: list, output_dir: Path) -> dict:
+    """Convert every file and return per-suffix latencies"""
+    latencies = {}
+    for path in files:
+        file_output_dir = output_dir / path.stem
+        file_output_dir.mkdir(parents=True, exist_ok=True)
+        start = time.perf_counter()
+        convert(path, file_output_dir)
+        latencies.setdefault(path.suffix.lower(), []).append(
+            time.perf_counter() - start
+        )
+    return latencies
+
+
+def docx_throughput(workdir: Path, count: int, workers: int) -> None:
+    """Parse many small DOCX files through BatchParser with CLI and in-process Docling"""
+    corpus_dir = workdir / "docx_corpus"
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    files = []
+    for i in range(count):
+        path = corpus_dir / f"memo_{i:04d}.docx"
+        if not write_docx(path, i):
+            print("python-docx is not installed; skipping DOCX throughput run")
+            return
+        files.append(str(path))
+
+    print(f"\nParsing {count} DOCX files with {workers} workers")
+    print(f"{'mode':<14}{'ok':>7}{'failed':>8}{'wall s':>10}{'files/s':>10}")
+    for mode, inprocess in (("cli", False), ("in-process", True)):
+        batch_parser = BatchParser(
+            parser_type="docling",
+            max_workers=workers,
+            show_progress=False,
+            timeout_per_file=3600,
+            skip_installation_check=True,
+            docling_inprocess=inprocess,
+        )
+        result = batch_parser.process_batch(
+            files, str(workdir / f"docx_{mode}"), recursive=False
+        )
+        print(
+            f"{mode:<14}{len(result.successful_files):>7}"
+            f"{len(result.failed_files):>8}{result.processing_time:>10.1f}"
+            f"{count / max(result.processing_time, 1e-9):>10.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Docling conversion benchmark")
+    parser.add_argument("files", nargs="*", help="Documents to convert")
+    parser.add_argument(
+        "--generate",
+        type=int,
+        default=5,
+        help="Documents per type to generate when no files are given",
+    )
+    parser.add_argument(
+        "--docx-throughput",
+        type=int,
+        default=0,
+        help="Also parse this many generated DOCX files through BatchParser",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Workers for the DOCX throughput run"
+    )
+    args = parser.parse_args()
+
+    if not DoclingParser().check_installation():
+        print("Docling is not installed; install it with: pip install docling")
+        return
+
+    workdir = Path(tempfile.mkdtemp(prefix="docling_bench_"))
+    try:
+        if args.files:
+            files = [Path(f).resolve() for f in args.files]
+        else:
+            files = build_corpus(workdir / "corpus", args.generate)
+        print(f"Converting {len(files)} documents")
+
+        results = {
+            "two-pass": time_mode(convert_two_pass, files, workdir / "two_pass"),
+            "single-pass": time_mode(
+                convert_single_pass, files, workdir / "single_pass"
+            ),
+            "in-process": time_mode(convert_in_process, files, workdir / "in_process"),
+        }
+
+        print(f"\n{'mode':<14}{'type':<8}{'files':>7}{'mean s':>10}{'total s':>10}")
+        for mode, by_suffix in results.items():
+            for suffix, latencies in sorted(by_suffix.items()):
+                print(
+                    f"{mode:<14}{suffix:<8}{len(latencies):>7}"
+                    f"{statistics.mean(latencies):>10.2f}{sum(latencies):>10.1f}"
+                )
+
+        totals = {
+            mode: sum(sum(v) for v in by_suffix.values())
+            for mode, by_suffix in results.items()
+        }
+        print(
+            "\nTotal: "
+            + ", ".join(f"{mode} {total:.1f}s" for mode, total in totals.items())
+        )
+        print(
+            "In-process timings include model loading on the first document of "
+            "each format."
+        )
+
+        if args.docx_throughput > 0:
+            docx_throughput(workdir, args.docx_throughput, args.workers)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
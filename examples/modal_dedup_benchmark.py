@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+"""
+Multimodal Deduplication Benchmark for RAG-Anything
+
+Builds a synthetic corpus resembling corporate decks: every page repeats the
+same logo (re-encoded at varying JPEG quality) and a boilerplate table with
+formatting differences, next to unique charts and tables. Each item is then
+described with a counting stub model, with and without ModalDeduplicator, and
+the model calls saved are reported along with any unique items that were
+wrongly grouped together.
+
+Requires Pillow (pip install raganything[image]).
+
+Usage:
+    python examples/modal_dedup_benchmark.py --docs 20 --pages 15
+    python examples/modal_dedup_benchmark.py --threshold 4
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lightrag import LightRAG
+from lightrag.utils import EmbeddingFunc, Tokenizer
+
+from context_index_benchmark import WordTokenizer
+from raganything.modal_dedup import ModalDeduplicator
+from raganything.modalprocessors import ImageModalProcessor, TableModalProcessor
+
+BOILERPLATE_TABLES = [
+    "<table><tr><td>Confidential</td><td>Internal use only</td></tr></table>",
+    "| Region | Owner |\n|---|---|\n| EMEA | Sales |\n| APAC | Sales |",
+]
+
+
+class CountingModel:
+    """Stub model returning a fixed JSON description and counting calls"""
+
+    def __init__(self, entity_type: str):
+        self.entity_type = entity_type
+        self.calls = 0
+
+    async def __call__(self, prompt, image_data=None, system_prompt=None, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.001)
+        return json.dumps(
+            {
+                "detailed_description": f"{self.entity_type} description {self.calls}",
+                "entity_info": {
+                    "entity_name": f"{self.entity_type} {self.calls}",
+                    "entity_type": self.entity_type,
+                    "summary": "Synthetic benchmark content.",
+                },
+            }
+        )
+
+
+def draw_logo(path: Path, quality: int) -> None:
+    from PIL import Image, ImageDraw
+
+    img = Image.new("RGB", (240, 80), "white")
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([10, 10, 70, 70], fill=(200, 30, 30))
+    draw.ellipse([90, 15, 140, 65], fill=(30, 30, 200))
+    draw.text((155, 30), "ACME", fill="black")
+    img.save(path, "JPEG", quality=quality)
+
+
+def draw_chart(path: Path, rng: random.Random) -> None:
+    from PIL import Image, ImageDraw
+
+    img = Image.new("RGB", (400, 300), "white")
+    draw = ImageDraw.Draw(img)
+    bars = rng.randint(3, 8)
+    width = 360 // bars
+    for i in range(bars):
+        height = rng.randint(20, 260)
+        color = tuple(rng.randint(0, 200) for _ in range(3))
+        draw.rectangle(
+            [20 + i * width, 280 - height, 10 + (i + 1) * width, 280], fill=color
+        )
+    img.save(path, "PNG")
+
+
+def vary_table(table: str, rng: random.Random) -> str:
+    """Apply formatting-only changes a parser might produce"""
+    if table.startswith("<table>"):
+        return table.replace("<td>", f'<td class="c{rng.randint(0, 9)}">')
+    return table.replace("|", " | " if rng.random() < 0.5 else "|")
+
+
+def build_corpus(workdir: Path, docs: int, pages: int) -> list:
+    """Return (item, label) pairs; equal labels mark genuinely equal content"""
+    rng = random.Random(0)
+    items = []
+    for doc in range(docs):
+        for page in range(pages):
+            logo = workdir / f"logo_{doc}_{page}.jpg"
+            draw_logo(logo, quality=rng.randint(70, 95))
+            items.append(({"type": "image", "img_path": str(logo)}, "logo"))
+
+            chart = workdir / f"chart_{doc}_{page}.png"
+            draw_chart(chart, rng)
+            items.append(
+                ({"type": "image", "img_path": str(chart)}, f"chart_{doc}_{page}")
+            )
+
+            index = rng.randrange(len(BOILERPLATE_TABLES))
+            items.append(
+                (
+                    {
+                        "type": "table",
+                        "table_body": vary_table(BOILERPLATE_TABLES[index], rng),
+                    },
+                    f"boilerplate_{index}",
+                )
+            )
+
+            rows = "".join(
+                f"<tr><td>{rng.random():.4f}</td></tr>"
+                for _ in range(rng.randint(2, 6))
+            )
+            items.append(
+                (
+                    {"type": "table", "table_body": f"<table>{rows}</table>"},
+                    f"table_{doc}_{page}",
+                )
+            )
+    return items
+
+
+async def run(processors: dict, items: list, dedup) -> tuple:
+    """Describe every item; returns (seconds, description per item)"""
+    descriptions = []
+    start = time.perf_counter()
+    for item, _ in items:
+        processor = processors[item["type"]]
+
+        async def generate():
+            return await processor.generate_description_only(item, item["type"])
+
+        if dedup is None:
+            description, _ = await generate()
+        else:
+            description, _, _ = await dedup.describe(item, generate)
+        descriptions.append(description)
+    return time.perf_counter() - start, descriptions
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Multimodal deduplication benchmark")
+    parser.add_argument("--docs", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=15)
+    parser.add_argument(
+        "--threshold", type=int, default=2, help="Image dHash Hamming threshold"
+    )
+    args = parser.parse_args()
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("Pillow is not installed; install it with: pip install Pillow")
+        return
+
+    with tempfile.TemporaryDirectory(prefix="dedup_bench_") as workdir:
+        items = build_corpus(Path(workdir), args.docs, args.pages)
+
+        async def embed(texts):
+            import numpy as np
+
+            return np.zeros((len(texts), 8))
+
+        async def llm(prompt, **kwargs):
+            return ""
+
+        lightrag = LightRAG(
+            working_dir=workdir,
+            llm_model_func=llm,
+            embedding_func=EmbeddingFunc(
+                embedding_dim=8, max_token_size=8192, func=embed
+            ),
+            tokenizer=Tokenizer(model_name="word", tokenizer=WordTokenizer()),
+        )
+
+        print(
+            f"{len(items)} items ({args.docs} documents x {args.pages} pages), "
+            f"image threshold {args.threshold}"
+        )
+        print(f"\n{'mode':<10}{'image calls':>13}{'table calls':>13}{'seconds':>10}")
+        results = {}
+        for mode in ("baseline", "dedup"):
+            vision_model = CountingModel("image")
+            text_model = CountingModel("table")
+            processors = {
+                "image": ImageModalProcessor(lightrag, vision_model),
+                "table": TableModalProcessor(lightrag, text_model),
+            }
+            dedup = (
+                ModalDeduplicator(image_hash_threshold=args.threshold)
+                if mode == "dedup"
+                else None
+            )
+            elapsed, descriptions = await run(processors, items, dedup)
+            results[mode] = (vision_model.calls + text_model.calls, descriptions)
+            print(
+                f"{mode:<10}{vision_model.calls:>13}{text_model.calls:>13}"
+                f"{elapsed:>10.2f}"
+            )
+
+        baseline_calls = results["baseline"][0]
+        dedup_calls, descriptions = results["dedup"]
+        # Items with different labels that ended up sharing a description
+        labels_by_description = {}
+        for (_, label), description in zip(items, descriptions):
+            labels_by_description.setdefault(description, set()).add(label)
+        false_merges = sum(len(labels) - 1 for labels in labels_by_description.values())
+
+        print(
+            f"\nModel calls: {baseline_calls} -> {dedup_calls} "
+            f"({(baseline_calls - dedup_calls) / baseline_calls:.0%} saved)"
+        )
+        print(f"Distinct items wrongly grouped: {false_merges}")
+        print(f"Deduplicator stats: {dedup.get_stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,6 +10,7 @@ from lightrag.llm.openai import openai_complete_if_cache, openai_embed
 from lightrag.utils import EmbeddingFunc
 from lightrag.kg.shared_storage import initialize_pipeline_status
 from lightrag import LightRAG
+from raganything.image_prep import detect_base64_image_mime_type
 from raganything.modalprocessors import (
     ImageModalProcessor,
     TableModalProcessor,
@@ -56,7 +57,7 @@ def get_vision_model_func(api_key: str, base_url: str = None):
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/jpeg;base64,{image_data}"
+                                "url": f"data:{detect_base64_image_mime_type(image_data)};base64,{image_data}"
                             },
                         },
                     ],
@@ -24,6 +24,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 from lightrag.llm.openai import openai_complete_if_cache, openai_embed
 from lightrag.utils import EmbeddingFunc, logger, set_verbose_debug
 from raganything import RAGAnything, RAGAnythingConfig
+from raganything.image_prep import detect_base64_image_mime_type
 
 from dotenv import load_dotenv
 
@@ -166,7 +167,7 @@ async def process_with_rag(
                                 {
                                     "type": "image_url",
                                     "image_url": {
-                                        "url": f"data:image/jpeg;base64,{image_data}"
+                                        "url": f"data:{detect_base64_image_mime_type(image_data)};base64,{image_data}"
                                     },
                                 },
                             ],
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+"""
+VLM Enhanced Query Load Test for RAG-Anything
+
+Fires many aquery_vlm_enhanced calls at once against one RAGAnything
+instance, the way the backend's singleton RAGService does. Retrieval is
+replaced by a stub that returns a prompt referencing images owned by the
+request, each with a size unique to that request. A stub vision model reads
+the images back out of the messages and reports their sizes, so any image
+that leaked from another request is detected.
+
+Runs the same load once serialized behind a lock and once fully concurrent,
+and reports wall time and integrity failures for each.
+
+Requires Pillow (pip install raganything[image]).
+
+Usage:
+    python examples/vlm_query_load_test.py --requests 200 --images 3
+    python examples/vlm_query_load_test.py --latency 0.1
+"""
+
+import argparse
+import asyncio
+import base64
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lightrag.utils import EmbeddingFunc, Tokenizer
+
+from context_index_benchmark import WordTokenizer
+from raganything import RAGAnything, RAGAnythingConfig
+
+
+def image_size(request_id: int, image_index: int) -> tuple:
+    """Size that identifies the request and image it belongs to"""
+    return 64 + request_id, 64 + image_index
+
+
+def write_images(workdir: Path, requests: int, images: int) -> None:
+    from PIL import Image, ImageDraw
+
+    for request_id in range(requests):
+        for image_index in range(images):
+            size = image_size(request_id, image_index)
+            img = Image.new("RGB", size, "white")
+            draw = ImageDraw.Draw(img)
+            draw.rectangle([4, 4, size[0] - 4, size[1] - 4], outline="black")
+            draw.text((8, 8), f"{request_id}/{image_index}", fill="black")
+            img.save(workdir / f"r{request_id}_i{image_index}.png")
+
+
+class StubRetrieval:
+    """Stands in for LightRAG.aquery(only_need_prompt=True)"""
+
+    def __init__(self, workdir: Path, images: int, latency: float):
+        self.workdir = workdir
+        self.images = images
+        self.latency = latency
+
+    async def __call__(self, query: str, param=None):
+        await asyncio.sleep(self.latency * 0.2)
+        request_id = int(query.split()[-1])
+        blocks = [
+            f"Chunk {i} of request {request_id}.\n"
+            f"Image Path: {self.workdir / f'r{request_id}_i{i}.png'}"
+            for i in range(self.images)
+        ]
+        return "\n\n".join(blocks)
+
+
+def make_vision_model(latency: float):
+    from PIL import Image
+
+    async def vision_model(prompt, messages=None, image_data=None, **kwargs):
+        # Decode before yielding so the images are the ones passed in
+        sizes = []
+        for part in messages[1]["content"] if messages else []:
+            if part.get("type") == "image_url":
+                data = part["image_url"]["url"].split(",", 1)[1]
+                with Image.open(io.BytesIO(base64.b64decode(data))) as img:
+                    sizes.append(list(img.size))
+        await asyncio.sleep(latency)
+        return json.dumps(sizes)
+
+    return vision_model
+
+
+async def run(rag: RAGAnything, requests: int, images: int, lock) -> tuple:
+    """Run all queries; returns (seconds, requests with wrong or missing images)"""
+
+    async def one(request_id: int) -> bool:
+        query = f"What do the figures show for request {request_id}"
+        if lock is None:
+            answer = await rag.aquery_vlm_enhanced(query, mode="mix")
+        else:
+            async with lock:
+                answer = await rag.aquery_vlm_enhanced(query, mode="mix")
+        expected = [list(image_size(request_id, i)) for i in range(images)]
+        return json.loads(answer) == expected
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[one(i) for i in range(requests)])
+    return time.perf_counter() - start, results.count(False)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="VLM enhanced query load test")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--images", type=int, default=3, help="Images per request")
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="Stub VLM latency in seconds"
+    )
+    args = parser.parse_args()
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("Pillow is not installed; install it with: pip install Pillow")
+        return
+
+    with tempfile.TemporaryDirectory(prefix="vlm_load_") as workdir:
+        workdir = Path(workdir)
+        write_images(workdir, args.requests, args.images)
+
+        async def embed(texts):
+            import numpy as np
+
+            return np.zeros((len(texts), 8))
+
+        async def llm(prompt, **kwargs):
+            return ""
+
+        rag = RAGAnything(
+            config=RAGAnythingConfig(
+                working_dir=str(workdir / "rag_storage"),
+                # Every request runs at once; do not queue on the scheduler
+                vision_max_concurrency=args.requests,
+            ),
+            llm_model_func=llm,
+            vision_model_func=make_vision_model(args.latency),
+            embedding_func=EmbeddingFunc(
+                embedding_dim=8, max_token_size=8192, func=embed
+            ),
+            lightrag_kwargs={
+                "tokenizer": Tokenizer(model_name="word", tokenizer=WordTokenizer())
+            },
+        )
+        # Query only; no parser is needed
+        rag._parser_installation_checked = True
+        await rag._ensure_lightrag_initialized()
+        rag.lightrag.aquery = StubRetrieval(workdir, args.images, args.latency)
+
+        print(
+            f"{args.requests} requests x {args.images} images, "
+            f"stub VLM latency {args.latency * 1000:.0f} ms"
+        )
+        print(f"\n{'mode':<12}{'seconds':>10}{'queries/s':>12}{'mismatched':>12}")
+        for mode, lock in (("serialized", asyncio.Lock()), ("concurrent", None)):
+            elapsed, failures = await run(rag, args.requests, args.images, lock)
+            print(
+                f"{mode:<12}{elapsed:>10.2f}{args.requests / elapsed:>12.1f}"
+                f"{failures:>12}"
+            )
+
+        await rag.finalize_storages()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -26,6 +26,109 @@ class BatchMixin:
     # Type hints for methods that will be available from other mixins
     async def _ensure_lightrag_initialized(self) -> None: ...
     async def process_document_complete(self, file_path: str, **kwargs) -> None: ...
+    def _get_doc_parser(self): ...
+    async def _get_file_content_hash(self, file_path: Path) -> str: ...
+    def _generate_cache_key(
+        self, file_path: Path, parse_method: str = None, **kwargs
+    ) -> str: ...
+    def _generate_content_based_doc_id(
+        self, content_list: List[Dict[str, Any]]
+    ) -> str: ...
+    async def _store_cached_result(
+        self,
+        cache_key: str,
+        content_list: List[Dict[str, Any]],
+        doc_id: str,
+        file_path: Path,
+        parse_method: str = None,
+        **kwargs,
+    ) -> None: ...
+
+    async def _prefetch_grouped_parses(
+        self,
+        file_paths: List[Path],
+        output_dir: str,
+        parse_method: str,
+        max_workers: int,
+    ) -> None:
+        """
+        Parse uncached PDFs in grouped MinerU invocations and store the results in the parse cache
+
+        Subsequent per-file parse_document calls then hit the cache, so model
+        loading is paid once per group instead of once per file. Does nothing
+        unless MinerU grouping is enabled (config.mineru_group_max_files > 1).
+
+        Args:
+            file_paths: Files about to be processed
+            output_dir: Output directory for parsed files
+            parse_method: Parsing method to use
+            max_workers: Maximum number of groups parsed concurrently
+        """
+        if (
+            self.config.parser != "mineru"
+            or self.config.mineru_group_max_files <= 1
+            or getattr(self, "parse_cache", None) is None
+        ):
+            return
+
+        # Find PDFs without a cached parse result
+        pending = {}
+        for file_path in file_paths:
+            if file_path.suffix.lower() != ".pdf":
+                continue
+            content_hash = await self._get_file_content_hash(file_path)
+            cache_key = self._generate_cache_key(
+                file_path, parse_method, content_hash=content_hash
+            )
+            if await self.parse_cache.get_by_id(cache_key) is None:
+                pending[file_path] = (cache_key, content_hash)
+
+        if len(pending) < 2:
+            return
+
+        doc_parser = self._get_doc_parser()
+        groups = await asyncio.to_thread(
+            doc_parser.plan_pdf_groups,
+            list(pending),
+            self.config.mineru_group_max_files,
+            self.config.mineru_group_max_pages,
+        )
+        groups = [group for group in groups if len(group) > 1]
+        self.logger.info(
+            f"Prefetching {sum(len(g) for g in groups)} PDFs in {len(groups)} MinerU groups"
+        )
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def parse_group(group: List[Path]):
+            async with semaphore:
+                try:
+                    content_lists = await asyncio.to_thread(
+                        doc_parser.parse_pdf_batch,
+                        group,
+                        output_dir=output_dir,
+                        method=parse_method,
+                    )
+                except Exception as e:
+                    # Files fall back to individual parsing in process_document_complete
+                    self.logger.warning(f"Grouped MinerU parse failed: {e}")
+                    return
+
+            for file_path in group:
+                content_list = content_lists.get(str(file_path))
+                if not content_list:
+                    continue
+                cache_key, content_hash = pending[file_path]
+                await self._store_cached_result(
+                    cache_key,
+                    content_list,
+                    self._generate_content_based_doc_id(content_list),
+                    file_path,
+                    parse_method,
+                    content_hash=content_hash,
+                )
+
+        await asyncio.gather(*(parse_group(group) for group in groups))
 
     # ==========================================
     # ORIGINAL BATCH PROCESSING METHOD (RESTORED)
@@ -98,6 +201,11 @@ class BatchMixin:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
+        # Parse PDFs in MinerU groups up front when grouping is enabled
+        await self._prefetch_grouped_parses(
+            files_to_process, output_dir, parse_method, max_workers
+        )
+
         # Process files with controlled concurrency
         semaphore = asyncio.Semaphore(max_workers)
         tasks = []
@@ -193,6 +301,9 @@ class BatchMixin:
             max_workers=max_workers,
             show_progress=show_progress,
             skip_installation_check=True,  # Skip installation check for better UX
+            group_max_files=self.config.mineru_group_max_files,
+            group_max_pages=self.config.mineru_group_max_pages,
+            docling_inprocess=self.config.docling_inprocess,
         )
 
         # Process batch
@@ -245,6 +356,9 @@ class BatchMixin:
             max_workers=max_workers,
             show_progress=show_progress,
             skip_installation_check=True,  # Skip installation check for better UX
+            group_max_files=self.config.mineru_group_max_files,
+            group_max_pages=self.config.mineru_group_max_pages,
+            docling_inprocess=self.config.docling_inprocess,
         )
 
         # Process batch asynchronously
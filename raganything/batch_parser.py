@@ -7,7 +7,8 @@ with progress reporting and error handling.
 
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
@@ -63,6 +64,9 @@ class BatchParser:
         show_progress: bool = True,
         timeout_per_file: int = 300,
         skip_installation_check: bool = False,
+        group_max_files: int = 1,
+        group_max_pages: int = 200,
+        docling_inprocess: bool = False,
     ):
         """
         Initialize batch parser
@@ -73,18 +77,26 @@ class BatchParser:
             show_progress: Whether to show progress bars
             timeout_per_file: Timeout in seconds for each file
             skip_installation_check: Skip parser installation check (useful for testing)
+            group_max_files: Maximum PDFs parsed per MinerU invocation (1 disables grouping)
+            group_max_pages: Maximum total pages per grouped MinerU invocation
+            docling_inprocess: Convert with an in-process Docling converter; with
+                more than one worker, files are spread over worker processes that
+                each keep their own converter
         """
         self.parser_type = parser_type
         self.max_workers = max_workers
         self.show_progress = show_progress
         self.timeout_per_file = timeout_per_file
+        self.group_max_files = group_max_files
+        self.group_max_pages = group_max_pages
+        self.docling_inprocess = docling_inprocess
         self.logger = logging.getLogger(__name__)
 
         # Initialize parser
         if parser_type == "mineru":
             self.parser = MineruParser()
         elif parser_type == "docling":
-            self.parser = DoclingParser()
+            self.parser = DoclingParser(inprocess=docling_inprocess)
         else:
             raise ValueError(f"Unsupported parser type: {parser_type}")
 
@@ -200,6 +212,117 @@ class BatchParser:
             self.logger.error(error_msg)
             return False, file_path, error_msg
 
+    def process_file_group(
+        self,
+        file_paths: List[str],
+        output_dir: str,
+        parse_method: str = "auto",
+        **kwargs,
+    ) -> List[Tuple[bool, str, Optional[str]]]:
+        """
+        Process a group of PDFs with a single MinerU invocation
+
+        Args:
+            file_paths: Paths to the PDF files in the group
+            output_dir: Output directory
+            parse_method: Parsing method
+            **kwargs: Additional parser arguments
+
+        Returns:
+            List of (success, file_path, error_message) tuples, one per file
+        """
+        try:
+            start_time = time.time()
+
+            group_output_dir = Path(output_dir)
+            group_output_dir.mkdir(parents=True, exist_ok=True)
+
+            content_lists = self.parser.parse_pdf_batch(
+                pdf_paths=file_paths,
+                output_dir=str(group_output_dir),
+                method=parse_method,
+                **kwargs,
+            )
+
+            processing_time = time.time() - start_time
+            self.logger.info(
+                f"Processed group of {len(file_paths)} files in {processing_time:.2f}s"
+            )
+
+            results = []
+            for file_path in file_paths:
+                if str(Path(file_path)) in content_lists:
+                    results.append((True, file_path, None))
+                else:
+                    results.append((False, file_path, f"Failed to process {file_path}"))
+            return results
+
+        except Exception as e:
+            error_msg = f"Failed to process group: {str(e)}"
+            self.logger.error(error_msg)
+            return [(False, file_path, error_msg) for file_path in file_paths]
+
+    def _plan_work_items(self, supported_files: List[str]) -> List[List[str]]:
+        """
+        Split files into work items: MinerU PDF groups when grouping is enabled,
+        otherwise one file per item
+        """
+        if self.parser_type != "mineru" or self.group_max_files <= 1:
+            return [[file_path] for file_path in supported_files]
+
+        pdf_files = [f for f in supported_files if Path(f).suffix.lower() == ".pdf"]
+        other_files = [f for f in supported_files if Path(f).suffix.lower() != ".pdf"]
+
+        groups = self.parser.plan_pdf_groups(
+            pdf_files, self.group_max_files, self.group_max_pages
+        )
+        # Map planned Paths back to the caller's path strings
+        original_paths = {Path(f): f for f in pdf_files}
+        work_items = [[original_paths[p] for p in group] for group in groups]
+        work_items.extend([file_path] for file_path in other_files)
+
+        self.logger.info(
+            f"Planned {len(groups)} MinerU groups for {len(pdf_files)} PDFs"
+        )
+        return work_items
+
+    def _process_work_item(
+        self, work_item: List[str], output_dir: str, parse_method: str, **kwargs
+    ) -> List[Tuple[bool, str, Optional[str]]]:
+        """Process a single file or a MinerU PDF group"""
+        if len(work_item) > 1:
+            return self.process_file_group(
+                work_item, output_dir, parse_method, **kwargs
+            )
+        return [
+            self.process_single_file(work_item[0], output_dir, parse_method, **kwargs)
+        ]
+
+    def _uses_process_pool(self) -> bool:
+        """Whether work items run in worker processes instead of threads"""
+        return (
+            self.parser_type == "docling"
+            and self.docling_inprocess
+            and self.max_workers > 1
+        )
+
+    def _create_executor(self):
+        """
+        Create the executor for work items
+
+        In-process Docling conversion is CPU bound, so it runs on a process pool
+        whose workers each build one converter up front and reuse it for every
+        file they receive. Other parsers run external tools and use threads.
+        """
+        if self._uses_process_pool():
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker_parser,
+                initargs=(self.parser_type, self.docling_inprocess),
+            )
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
     def process_batch(
         self,
         file_paths: List[str],
@@ -257,45 +380,59 @@ class BatchParser:
                 unit="file",
             )
 
+        work_fn = (
+            _process_work_item_in_worker
+            if self._uses_process_pool()
+            else self._process_work_item
+        )
+        future_to_files = {}
+
         try:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            with self._create_executor() as executor:
                 # Submit all tasks
-                future_to_file = {
+                future_to_files = {
                     executor.submit(
-                        self.process_single_file,
-                        file_path,
+                        work_fn,
+                        work_item,
                         output_dir,
                         parse_method,
                         **kwargs,
-                    ): file_path
-                    for file_path in supported_files
+                    ): work_item
+                    for work_item in self._plan_work_items(supported_files)
                 }
 
                 # Process completed tasks
                 for future in as_completed(
-                    future_to_file, timeout=self.timeout_per_file
+                    future_to_files, timeout=self.timeout_per_file
                 ):
-                    success, file_path, error_msg = future.result()
+                    for success, file_path, error_msg in future.result():
+                        if success:
+                            successful_files.append(file_path)
+                        else:
+                            failed_files.append(file_path)
+                            errors[file_path] = error_msg
 
-                    if success:
-                        successful_files.append(file_path)
-                    else:
-                        failed_files.append(file_path)
-                        errors[file_path] = error_msg
-
-                    if pbar:
-                        pbar.update(1)
+                        if pbar:
+                            pbar.update(1)
 
         except Exception as e:
             self.logger.error(f"Batch processing failed: {str(e)}")
-            # Mark remaining files as failed
-            for future in future_to_file:
-                if not future.done():
-                    file_path = future_to_file[future]
-                    failed_files.append(file_path)
-                    errors[file_path] = f"Processing interrupted: {str(e)}"
-                    if pbar:
-                        pbar.update(1)
+            # Mark remaining files as failed, including those whose worker
+            # process died before returning a result
+            recorded = set(successful_files) | set(failed_files)
+            for future, work_item in future_to_files.items():
+                if (
+                    not future.done()
+                    or future.cancelled()
+                    or future.exception() is not None
+                ):
+                    for file_path in work_item:
+                        if file_path in recorded:
+                            continue
+                        failed_files.append(file_path)
+                        errors[file_path] = f"Processing interrupted: {str(e)}"
+                        if pbar:
+                            pbar.update(1)
 
         finally:
             if pbar:
@@ -352,6 +489,40 @@ class BatchParser:
         )
 
 
+_worker_batch_parser: Optional[BatchParser] = None
+
+
+def _init_worker_parser(parser_type: str, docling_inprocess: bool) -> None:
+    """Process pool initializer: build this worker's parser and load its models"""
+    global _worker_batch_parser
+    _worker_batch_parser = BatchParser(
+        parser_type=parser_type,
+        max_workers=1,
+        show_progress=False,
+        skip_installation_check=True,
+        docling_inprocess=docling_inprocess,
+    )
+    if docling_inprocess:
+        from .parser import get_docling_converter
+
+        try:
+            get_docling_converter()
+        except Exception as e:
+            # Leave the error to surface per file instead of breaking the pool
+            logging.getLogger(__name__).warning(
+                f"Failed to initialize Docling converter: {e}"
+            )
+
+
+def _process_work_item_in_worker(
+    work_item: List[str], output_dir: str, parse_method: str, **kwargs
+) -> List[Tuple[bool, str, Optional[str]]]:
+    """Process a work item with the worker process's parser"""
+    return _worker_batch_parser._process_work_item(
+        work_item, output_dir, parse_method, **kwargs
+    )
+
+
 def main():
     """Command-line interface for batch parsing"""
     import argparse
@@ -386,6 +557,23 @@ def main():
     parser.add_argument(
         "--timeout", type=int, default=300, help="Timeout per file (seconds)"
     )
+    parser.add_argument(
+        "--group-max-files",
+        type=int,
+        default=1,
+        help="Maximum PDFs per MinerU invocation (1 disables grouping)",
+    )
+    parser.add_argument(
+        "--group-max-pages",
+        type=int,
+        default=200,
+        help="Maximum total pages per grouped MinerU invocation",
+    )
+    parser.add_argument(
+        "--docling-inprocess",
+        action="store_true",
+        help="Run Docling in worker processes that reuse one converter each",
+    )
 
     args = parser.parse_args()
 
@@ -402,6 +590,9 @@ def main():
             max_workers=args.workers,
             show_progress=not args.no_progress,
             timeout_per_file=args.timeout,
+            group_max_files=args.group_max_files,
+            group_max_pages=args.group_max_pages,
+            docling_inprocess=args.docling_inprocess,
         )
 
         # Process files
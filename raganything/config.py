@@ -34,6 +34,31 @@ class RAGAnythingConfig:
     )
     """Whether to display content statistics during parsing."""
 
+    mineru_worker_pool_size: int = field(
+        default=get_env_value("MINERU_WORKER_POOL_SIZE", 0, int)
+    )
+    """Number of persistent MinerU worker processes (0 spawns the mineru CLI per document)."""
+
+    mineru_worker_max_tasks: int = field(
+        default=get_env_value("MINERU_WORKER_MAX_TASKS", 50, int)
+    )
+    """Documents a MinerU worker parses before it is recycled to bound memory (0 disables)."""
+
+    mineru_group_max_files: int = field(
+        default=get_env_value("MINERU_GROUP_MAX_FILES", 1, int)
+    )
+    """Maximum PDFs parsed by one MinerU invocation in batch processing (1 disables grouping)."""
+
+    mineru_group_max_pages: int = field(
+        default=get_env_value("MINERU_GROUP_MAX_PAGES", 200, int)
+    )
+    """Maximum total pages per grouped MinerU invocation; larger PDFs are parsed alone."""
+
+    docling_inprocess: bool = field(
+        default=get_env_value("DOCLING_INPROCESS", False, bool)
+    )
+    """Run Docling in process with a reused converter instead of the docling CLI per document."""
+
     # Multimodal Processing Configuration
     # ---
     enable_image_processing: bool = field(
@@ -51,6 +76,118 @@ class RAGAnythingConfig:
     )
     """Enable equation content processing."""
 
+    enable_description_cache: bool = field(
+        default=get_env_value("ENABLE_DESCRIPTION_CACHE", True, bool)
+    )
+    """Cache modal description responses so repeated content and re-runs skip the model call."""
+
+    description_cache_storage: str = field(
+        default=get_env_value("DESCRIPTION_CACHE_STORAGE", "sqlite", str)
+    )
+    """Description cache backend: 'sqlite' for a per-workspace SQLite file, 'kv' for LightRAG's KV storage class."""
+
+    text_model_name: str = field(default=get_env_value("TEXT_MODEL_NAME", "", str))
+    """Name of the model behind llm_model_func; table, equation and generic descriptions are only cached when set."""
+
+    vision_model_name: str = field(default=get_env_value("VISION_MODEL_NAME", "", str))
+    """Name of the model behind vision_model_func; image descriptions are only cached when set."""
+
+    enable_modal_dedup: bool = field(
+        default=get_env_value("ENABLE_MODAL_DEDUP", True, bool)
+    )
+    """Describe repeated images and tables once and reuse the description for every occurrence."""
+
+    modal_dedup_image_threshold: int = field(
+        default=get_env_value("MODAL_DEDUP_IMAGE_THRESHOLD", 2, int)
+    )
+    """Maximum Hamming distance between 64-bit image dHashes treated as the same image."""
+
+    modal_dedup_tables: bool = field(
+        default=get_env_value("MODAL_DEDUP_TABLES", True, bool)
+    )
+    """Also reuse descriptions of tables with identical normalized bodies."""
+
+    enable_trivial_image_filter: bool = field(
+        default=get_env_value("ENABLE_TRIVIAL_IMAGE_FILTER", False, bool)
+    )
+    """Classify tiny icons, separators and blank crops before the vision model stage (opt-in)."""
+
+    trivial_image_action: str = field(
+        default=get_env_value("TRIVIAL_IMAGE_ACTION", "skip", str)
+    )
+    """What to do with trivial images: 'skip' drops them, 'template' gives them a fixed description."""
+
+    trivial_image_min_bytes: int = field(
+        default=get_env_value("TRIVIAL_IMAGE_MIN_BYTES", 256, int)
+    )
+    """Image files smaller than this many bytes are trivial."""
+
+    trivial_image_min_dimension: int = field(
+        default=get_env_value("TRIVIAL_IMAGE_MIN_DIMENSION", 48, int)
+    )
+    """Images whose longer side is below this many pixels are treated as icons."""
+
+    trivial_image_min_thickness: int = field(
+        default=get_env_value("TRIVIAL_IMAGE_MIN_THICKNESS", 8, int)
+    )
+    """Images whose shorter side is below this many pixels are treated as separators."""
+
+    trivial_image_max_color_stddev: float = field(
+        default=get_env_value("TRIVIAL_IMAGE_MAX_COLOR_STDDEV", 4.0, float)
+    )
+    """Images with a per-channel pixel standard deviation below this are near-uniform."""
+
+    trivial_image_min_ink_ratio: float = field(
+        default=get_env_value("TRIVIAL_IMAGE_MIN_INK_RATIO", 0.001, float)
+    )
+    """Near-uniform images with a smaller fraction of pixels standing out from the background are blank."""
+
+    enable_vlm_image_preparation: bool = field(
+        default=get_env_value("ENABLE_VLM_IMAGE_PREPARATION", True, bool)
+    )
+    """Downscale large images and re-encode them when that makes them smaller before sending them to the vision model."""
+
+    vlm_image_max_side: int = field(
+        default=get_env_value("VLM_IMAGE_MAX_SIDE", 1568, int)
+    )
+    """Maximum width or height in pixels of images sent to the vision model (0 = no resizing)."""
+
+    vlm_image_format: str = field(
+        default=get_env_value("VLM_IMAGE_FORMAT", "jpeg", str)
+    )
+    """Encoding of images sent to the vision model: 'jpeg' or 'webp'."""
+
+    vlm_image_quality: int = field(default=get_env_value("VLM_IMAGE_QUALITY", 85, int))
+    """Encoder quality (1-100) for re-encoded images."""
+
+    vlm_image_reencode_min_bytes: int = field(
+        default=get_env_value("VLM_IMAGE_REENCODE_MIN_BYTES", 262144, int)
+    )
+    """Images within the maximum side are re-encoded only from this size in bytes."""
+
+    vlm_image_cache_size: int = field(
+        default=get_env_value("VLM_IMAGE_CACHE_SIZE", 256, int)
+    )
+    """Number of prepared images kept in memory and shared by ingest and query."""
+
+    vlm_query_image_cache_size: int = field(
+        default=get_env_value("VLM_QUERY_IMAGE_CACHE_SIZE", 128, int)
+    )
+    """Number of encoded images from VLM enhanced query contexts cached by path, mtime and size."""
+
+    vlm_max_images: int = field(default=get_env_value("VLM_MAX_IMAGES", 8, int))
+    """Maximum number of images attached to a VLM enhanced query (0 = unlimited)."""
+
+    vlm_max_image_bytes: int = field(
+        default=get_env_value("VLM_MAX_IMAGE_BYTES", 20 * 1024 * 1024, int)
+    )
+    """Maximum total encoded image bytes attached to a VLM enhanced query (0 = unlimited)."""
+
+    multimodal_query_pipelined: bool = field(
+        default=get_env_value("MULTIMODAL_QUERY_PIPELINED", False, bool)
+    )
+    """Start retrieval for the text of a multimodal query while its attachments are still being described."""
+
     # Batch Processing Configuration
     # ---
     max_concurrent_files: int = field(
@@ -103,6 +240,60 @@ class RAGAnythingConfig:
     content_format: str = field(default=get_env_value("CONTENT_FORMAT", "minerU", str))
     """Default content format for context extraction when processing documents."""
 
+    # Parse Cache Configuration
+    # ---
+    parse_cache_storage: str = field(
+        default=get_env_value("PARSE_CACHE_STORAGE", "sqlite", str)
+    )
+    """Parse cache backend: 'sqlite' for a per-workspace SQLite file, 'kv' for LightRAG's KV storage class."""
+
+    parse_cache_fsync_batch: int = field(
+        default=get_env_value("PARSE_CACHE_FSYNC_BATCH", 64, int)
+    )
+    """Number of parse cache writes between fsyncs (SQLite backend)."""
+
+    parse_cache_compaction_threshold: float = field(
+        default=get_env_value("PARSE_CACHE_COMPACTION_THRESHOLD", 0.25, float)
+    )
+    """Fraction of free space in the parse cache file that triggers compaction on shutdown (SQLite backend)."""
+
+    parse_cache_out_of_line: bool = field(
+        default=get_env_value("PARSE_CACHE_OUT_OF_LINE", True, bool)
+    )
+    """Store cached content lists as separate compressed blobs loaded on demand."""
+
+    parse_cache_blob_lru_size: int = field(
+        default=get_env_value("PARSE_CACHE_BLOB_LRU_SIZE", 32, int)
+    )
+    """Number of recently used cached content lists kept in memory."""
+
+    # Model Call Scheduling
+    # ---
+    model_scheduler_enabled: bool = field(
+        default=get_env_value("MODEL_SCHEDULER_ENABLED", True, bool)
+    )
+    """Route multimodal model calls through the process-wide scheduler shared across documents."""
+
+    vision_max_concurrency: int = field(
+        default=get_env_value("VISION_MAX_CONCURRENCY", 4, int)
+    )
+    """Maximum concurrent vision model calls across all documents."""
+
+    text_max_concurrency: int = field(
+        default=get_env_value("TEXT_MAX_CONCURRENCY", 4, int)
+    )
+    """Maximum concurrent text model calls for multimodal descriptions across all documents."""
+
+    vision_requests_per_minute: float = field(
+        default=get_env_value("VISION_REQUESTS_PER_MINUTE", 0, float)
+    )
+    """Vision model request rate limit (0 for unlimited)."""
+
+    text_requests_per_minute: float = field(
+        default=get_env_value("TEXT_REQUESTS_PER_MINUTE", 0, float)
+    )
+    """Text model request rate limit for multimodal descriptions (0 for unlimited)."""
+
     def __post_init__(self):
         """Post-initialization setup for backward compatibility"""
         # Support legacy environment variable names for backward compatibility
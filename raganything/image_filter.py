@@ -0,0 +1,108 @@
+"""
+Trivial image filter for RAGAnything
+
+Classifies image blocks that are not worth a vision model call (tiny icons,
+separator lines, blank or near-uniform crops) using cheap checks on file
+size, dimensions and ink density.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from lightrag.utils import logger
+
+
+@dataclass
+class TrivialImageConfig:
+    """Thresholds for classifying an image as trivial"""
+
+    min_file_bytes: int = 256  # Files smaller than this are trivial
+    min_dimension: int = 48  # Images whose longer side is smaller are icons
+    min_thickness: int = 8  # Images whose shorter side is smaller are rules/separators
+    max_color_stddev: float = 4.0  # Near-uniform color below this pixel stddev
+    min_ink_ratio: float = 0.001  # Blank below this fraction of ink pixels
+    ink_threshold: int = 24  # Gray levels a pixel must differ from the background
+
+
+def has_image_context(item: dict) -> bool:
+    """Whether an image item carries a caption or footnote"""
+    for key in ("image_caption", "img_caption", "image_footnote", "img_footnote"):
+        value = item.get(key)
+        if isinstance(value, str):
+            value = [value]
+        if value and any(str(part).strip() for part in value):
+            return True
+    return False
+
+
+# Images are downscaled before computing statistics
+_STATS_SIZE = (128, 128)
+
+
+def classify_trivial_image(
+    image_path: str, config: Optional[TrivialImageConfig] = None
+) -> Optional[str]:
+    """
+    Classify an image as trivial
+
+    Checks run from cheapest to most expensive: file size, then dimensions
+    (read from the image header), then ink density on a downscaled copy.
+    Ink pixels are those that differ from the most common gray level (the
+    background) by more than ``ink_threshold``, so sparse line art such as
+    charts and equations is kept while blank and near-blank crops are not.
+    Without Pillow only the file size check is applied.
+
+    Args:
+        image_path: Path to the image file
+        config: Classification thresholds (defaults if None)
+
+    Returns:
+        Optional[str]: Reason the image is trivial ("small_file", "icon",
+            "separator", "blank"), or None if it should
+            be described
+    """
+    config = config or TrivialImageConfig()
+
+    try:
+        file_size = os.path.getsize(image_path)
+    except OSError:
+        # Missing files are reported by the image processor
+        return None
+    if file_size < config.min_file_bytes:
+        return "small_file"
+
+    try:
+        from PIL import Image, ImageStat
+    except ImportError:
+        return None
+
+    try:
+        with Image.open(image_path) as img:
+            width, height = img.size
+            if max(width, height) < config.min_dimension:
+                return "icon"
+            if min(width, height) < config.min_thickness:
+                return "separator"
+
+            img.draft("RGB", _STATS_SIZE)
+            sample = img.convert("RGB")
+            sample.thumbnail(_STATS_SIZE)
+    except Exception as e:
+        logger.debug(f"Could not inspect image {image_path}: {e}")
+        return None
+
+    histogram = sample.convert("L").histogram()
+    background = max(range(256), key=histogram.__getitem__)
+    ink = sum(
+        count
+        for level, count in enumerate(histogram)
+        if abs(level - background) > config.ink_threshold
+    )
+    if ink / sum(histogram) >= config.min_ink_ratio:
+        return None
+
+    # Grayscale hides marks that differ only in hue; keep colorful images
+    if max(ImageStat.Stat(sample).stddev) >= config.max_color_stddev:
+        return None
+    return "blank"
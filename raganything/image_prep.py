@@ -0,0 +1,324 @@
+"""
+Image preparation for vision model calls
+
+Resizes large images to a maximum side, re-encodes them to JPEG or WebP when
+that makes them smaller, and keeps the prepared base64 payload in a bounded cache keyed by content hash, so the
+ingest and query paths send small, correctly labelled images and share the
+encoding work.
+"""
+
+import base64
+import binascii
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from lightrag.utils import logger
+
+# Leading bytes of the image formats vision models accept
+_IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+    (b"II*\x00", "image/tiff"),
+    (b"MM\x00*", "image/tiff"),
+)
+
+# Formats vision models accept as is; others are always re-encoded
+_PASSTHROUGH_MIME_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp"}
+
+# Output format name -> (Pillow format, MIME type)
+_OUTPUT_FORMATS = {
+    "jpeg": ("JPEG", "image/jpeg"),
+    "jpg": ("JPEG", "image/jpeg"),
+    "webp": ("WEBP", "image/webp"),
+}
+
+
+def detect_image_mime_type(data: bytes, default: str = "image/jpeg") -> str:
+    """
+    Detect the MIME type of image bytes from their signature
+
+    Args:
+        data: Image bytes (only the first 16 bytes are needed)
+        default: MIME type returned when the format is not recognized
+
+    Returns:
+        str: MIME type such as "image/png"
+    """
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    for signature, mime_type in _IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return mime_type
+    return default
+
+
+def detect_base64_image_mime_type(
+    image_base64: str, default: str = "image/jpeg"
+) -> str:
+    """
+    Detect the MIME type of a base64 encoded image
+
+    Only the first 24 characters are decoded.
+
+    Args:
+        image_base64: Base64 encoded image
+        default: MIME type returned when the format is not recognized
+
+    Returns:
+        str: MIME type such as "image/png"
+    """
+    try:
+        head = base64.b64decode(image_base64[:24])
+    except (binascii.Error, ValueError):
+        return default
+    return detect_image_mime_type(head, default)
+
+
+@dataclass
+class PreparedImage:
+    """Image payload ready to send to a vision model"""
+
+    base64: str
+    """Base64 encoded image bytes."""
+
+    mime_type: str
+    """MIME type of the encoded bytes."""
+
+    digest: str
+    """Hash of the encoded bytes."""
+
+    size_bytes: int
+    """Size of the encoded bytes."""
+
+    original_bytes: int
+    """Size of the source file."""
+
+    @property
+    def data_url(self) -> str:
+        """Data URL for OpenAI-style image_url message parts"""
+        return f"data:{self.mime_type};base64,{self.base64}"
+
+
+class ImagePreparer:
+    """
+    Prepare images for vision model calls
+
+    Images larger than ``max_side`` are downscaled, and images of at least
+    ``reencode_min_bytes`` or in a format vision models do not accept are
+    re-encoded to the output format. The source bytes are kept, with their
+    own MIME type, whenever re-encoding does not make them smaller, so small
+    optimized PNG diagrams are not turned into larger, lossy JPEGs. Results
+    are cached by the hash of the source bytes, so an image described during
+    ingest is not encoded again when it appears in a query.
+
+    Without Pillow, images are sent unchanged with a sniffed MIME type.
+    """
+
+    def __init__(
+        self,
+        max_side: int = 1568,
+        image_format: str = "jpeg",
+        quality: int = 85,
+        cache_size: int = 256,
+        reencode_min_bytes: int = 262144,
+    ):
+        """
+        Initialize image preparer
+
+        Args:
+            max_side: Maximum width or height in pixels (0 disables resizing)
+            image_format: Output format, "jpeg" or "webp"
+            quality: Encoder quality (1-100)
+            cache_size: Maximum number of prepared images kept in memory
+            reencode_min_bytes: Source size from which images within
+                ``max_side`` are re-encoded
+        """
+        output = _OUTPUT_FORMATS.get(image_format.lower())
+        if output is None:
+            logger.warning(f"Unsupported VLM image format '{image_format}', using jpeg")
+            output = _OUTPUT_FORMATS["jpeg"]
+        self.max_side = max(0, max_side)
+        self.output_format, self.mime_type = output
+        self.quality = min(100, max(1, quality))
+        self.cache_size = max(0, cache_size)
+        self.reencode_min_bytes = max(0, reencode_min_bytes)
+        self._cache: "OrderedDict[str, PreparedImage]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "reencoded": 0,
+            "resized": 0,
+            "bytes_in": 0,
+            "bytes_out": 0,
+        }
+
+    def _encode(self, data: bytes) -> tuple:
+        """Return (encoded bytes, MIME type, resized) for source image bytes"""
+        source_mime_type = detect_image_mime_type(data)
+        try:
+            from PIL import Image
+        except ImportError:
+            return data, source_mime_type, False
+
+        convert = source_mime_type not in _PASSTHROUGH_MIME_TYPES
+        with Image.open(io.BytesIO(data)) as img:
+            resized = bool(self.max_side) and max(img.size) > self.max_side
+            if not (resized or convert or len(data) >= self.reencode_min_bytes):
+                return data, source_mime_type, False
+
+            has_alpha = img.mode in ("RGBA", "LA") or (
+                img.mode == "P" and "transparency" in img.info
+            )
+            frame = img.convert("RGBA" if has_alpha else "RGB")
+            if has_alpha and self.output_format == "JPEG":
+                # JPEG has no alpha channel; flatten onto white
+                background = Image.new("RGB", frame.size, "white")
+                background.paste(frame, mask=frame.getchannel("A"))
+                frame = background
+            if resized:
+                frame.thumbnail(
+                    (self.max_side, self.max_side), Image.Resampling.LANCZOS
+                )
+
+            buffer = io.BytesIO()
+            frame.save(buffer, self.output_format, quality=self.quality)
+            encoded = buffer.getvalue()
+
+        if len(encoded) >= len(data) and not convert:
+            return data, source_mime_type, False
+        return encoded, self.mime_type, resized
+
+    def prepare(self, image_path: str) -> Optional[PreparedImage]:
+        """
+        Prepare an image file for a vision model call
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            Optional[PreparedImage]: Prepared image, or None if the file cannot
+                be read
+        """
+        try:
+            with open(image_path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            logger.error(f"Failed to read image {image_path}: {e}")
+            return None
+
+        key = hashlib.blake2b(data, digest_size=16).hexdigest()
+        with self._lock:
+            prepared = self._cache.get(key)
+            if prepared is not None:
+                self._cache.move_to_end(key)
+                self.stats["hits"] += 1
+                return prepared
+
+        try:
+            encoded, mime_type, resized = self._encode(data)
+        except Exception as e:
+            logger.warning(
+                f"Could not re-encode image {image_path}, sending as is: {e}"
+            )
+            encoded, mime_type, resized = data, detect_image_mime_type(data), False
+
+        prepared = PreparedImage(
+            base64=base64.b64encode(encoded).decode("utf-8"),
+            mime_type=mime_type,
+            digest=key
+            if encoded is data
+            else hashlib.blake2b(encoded, digest_size=16).hexdigest(),
+            size_bytes=len(encoded),
+            original_bytes=len(data),
+        )
+
+        with self._lock:
+            self.stats["misses"] += 1
+            self.stats["bytes_in"] += len(data)
+            self.stats["bytes_out"] += len(encoded)
+            if encoded is not data:
+                self.stats["reencoded"] += 1
+            if resized:
+                self.stats["resized"] += 1
+            if self.cache_size:
+                self._cache[key] = prepared
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return prepared
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get preparation counters
+
+        Returns:
+            Dict[str, Any]: Cache hits/misses, re-encode and resize counts and
+                total source/prepared bytes
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["cached_images"] = len(self._cache)
+        return stats
+
+
+class EncodedImageCache:
+    """
+    Bounded LRU cache of encoded images keyed by file identity
+
+    Keys are (path, modification time, size) tuples, so a hit skips reading
+    the file entirely and a modified file is encoded again. Safe to use from
+    worker threads.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        """
+        Initialize encoded image cache
+
+        Args:
+            max_entries: Maximum number of cached images
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[str]:
+        """Return the cached base64 image for a key, or None"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Tuple, image_base64: str) -> None:
+        """Store a base64 image, evicting the least recently used entries"""
+        with self._lock:
+            self._entries[key] = image_base64
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache counters
+
+        Returns:
+            Dict[str, int]: Hits, misses and number of cached images
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "cached_images": len(self._entries),
+            }
@@ -0,0 +1,342 @@
+"""
+Persistent MinerU worker pool for RAGAnything
+
+Keeps a pool of long-lived worker processes that run MinerU through its Python
+API, so layout/OCR/formula models are loaded once per worker instead of once
+per document as with the ``mineru`` command line tool.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from raganything.parser import MineruExecutionError
+
+logger = logging.getLogger(__name__)
+
+# File types MinerU accepts when the input path is a directory
+MINERU_INPUT_SUFFIXES = {".pdf", ".png", ".jpeg", ".jpg"}
+
+
+def run_mineru_in_process(
+    input_path: Union[str, Path],
+    output_dir: Union[str, Path],
+    method: str = "auto",
+    lang: Optional[str] = None,
+    backend: Optional[str] = None,
+    start_page: Optional[int] = None,
+    end_page: Optional[int] = None,
+    formula: bool = True,
+    table: bool = True,
+    device: Optional[str] = None,
+    source: Optional[str] = None,
+    vlm_url: Optional[str] = None,
+) -> None:
+    """
+    Run MinerU through its Python API in the current process
+
+    Accepts the same arguments as ``MineruParser._run_mineru_command`` and
+    produces the same output layout as the ``mineru`` command line tool.
+    Models are cached by MinerU inside the process, so repeated calls from the
+    same process skip model loading.
+
+    Args:
+        input_path: Path to input file or directory
+        output_dir: Output directory path
+        method: Parsing method (auto, txt, ocr)
+        lang: Document language for OCR optimization
+        backend: Parsing backend
+        start_page: Starting page number (0-based)
+        end_page: Ending page number (0-based)
+        formula: Enable formula parsing
+        table: Enable table parsing
+        device: Inference device (only applied before the first parse in a process)
+        source: Model source (only applied before the first parse in a process)
+        vlm_url: Server URL for `vlm-sglang-client` backend
+    """
+    from mineru.cli.common import do_parse, read_fn
+
+    backend = backend or "pipeline"
+    if not backend.endswith("-client"):
+        if device and os.getenv("MINERU_DEVICE_MODE") is None:
+            os.environ["MINERU_DEVICE_MODE"] = device
+    if source and os.getenv("MINERU_MODEL_SOURCE") is None:
+        os.environ["MINERU_MODEL_SOURCE"] = source
+
+    input_path = Path(input_path)
+    if input_path.is_dir():
+        path_list = sorted(
+            p for p in input_path.iterdir() if p.suffix.lower() in MINERU_INPUT_SUFFIXES
+        )
+    else:
+        path_list = [input_path]
+
+    os.makedirs(output_dir, exist_ok=True)
+    do_parse(
+        output_dir=str(output_dir),
+        pdf_file_names=[p.stem for p in path_list],
+        pdf_bytes_list=[read_fn(p) for p in path_list],
+        p_lang_list=[lang or "ch"] * len(path_list),
+        backend=backend,
+        parse_method=method,
+        formula_enable=formula,
+        table_enable=table,
+        server_url=vlm_url,
+        start_page_id=start_page or 0,
+        end_page_id=end_page,
+    )
+
+
+def _worker_main(conn) -> None:
+    """Worker process loop: serve ping and parse requests until told to stop"""
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+
+        command = message[0]
+        if command == "stop":
+            break
+        if command == "ping":
+            conn.send(("pong", os.getpid()))
+            continue
+        if command == "parse":
+            try:
+                run_mineru_in_process(**message[1])
+                conn.send(("ok", None))
+            except Exception as e:
+                conn.send(("error", f"{type(e).__name__}: {e}"))
+            continue
+        conn.send(("error", f"Unknown command: {command}"))
+
+    conn.close()
+
+
+class _Worker:
+    """Handle for a single MinerU worker process"""
+
+    def __init__(self, context) -> None:
+        parent_conn, child_conn = context.Pipe()
+        self.conn = parent_conn
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn,), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks_done = 0
+
+    def request(self, message: Tuple, timeout: Optional[float]) -> Tuple[str, Any]:
+        self.conn.send(message)
+        if not self.conn.poll(timeout):
+            raise TimeoutError(f"MinerU worker {self.process.pid} did not respond")
+        return self.conn.recv()
+
+    def is_healthy(self, timeout: float) -> bool:
+        if not self.process.is_alive():
+            return False
+        try:
+            return self.request(("ping",), timeout)[0] == "pong"
+        except (OSError, EOFError, TimeoutError):
+            return False
+
+    def stop(self, timeout: float = 5.0) -> None:
+        try:
+            if self.process.is_alive():
+                self.conn.send(("stop",))
+                self.process.join(timeout)
+        except (OSError, EOFError):
+            pass
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        self.conn.close()
+
+
+class MineruWorkerPool:
+    """
+    Pool of warm MinerU worker processes
+
+    Workers are started lazily on first use. Before each task a worker is
+    pinged and replaced if it does not answer; after ``max_tasks_per_worker``
+    tasks it is recycled to bound memory growth from the models' caches.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_tasks_per_worker: int = 50,
+        task_timeout: Optional[float] = None,
+        health_check_timeout: float = 10.0,
+    ) -> None:
+        """
+        Initialize worker pool
+
+        Args:
+            size: Number of worker processes
+            max_tasks_per_worker: Tasks after which a worker is recycled (0 disables)
+            task_timeout: Seconds to wait for a single parse (None waits forever)
+            health_check_timeout: Seconds to wait for a ping reply
+        """
+        self.size = max(1, size)
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.task_timeout = task_timeout
+        self.health_check_timeout = health_check_timeout
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[Optional[_Worker]]" = queue.Queue()
+        self._workers: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            if self._closed:
+                raise RuntimeError("MinerU worker pool has been shut down")
+            for _ in range(self.size):
+                self._idle.put(None)  # Placeholder, spawned on first checkout
+            self._started = True
+            logger.info(f"Started MinerU worker pool with {self.size} workers")
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._context)
+        with self._lock:
+            self._workers.append(worker)
+        logger.debug(f"Spawned MinerU worker {worker.process.pid}")
+        return worker
+
+    def _retire(self, worker: _Worker) -> None:
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        worker.stop()
+
+    def _checkout(self) -> _Worker:
+        self._start()
+        worker = self._idle.get()
+        try:
+            if worker is None:
+                return self._spawn()
+            if not worker.is_healthy(self.health_check_timeout):
+                logger.warning(
+                    f"MinerU worker {worker.process.pid} failed health check, replacing"
+                )
+                self._retire(worker)
+                return self._spawn()
+            return worker
+        except BaseException:
+            # Keep pool capacity if spawning fails
+            self._idle.put(None)
+            raise
+
+    def _checkin(self, worker: Optional[_Worker]) -> None:
+        if (
+            worker is not None
+            and self.max_tasks_per_worker > 0
+            and worker.tasks_done >= self.max_tasks_per_worker
+        ):
+            logger.info(
+                f"Recycling MinerU worker {worker.process.pid} after {worker.tasks_done} tasks"
+            )
+            self._retire(worker)
+            worker = None
+        self._idle.put(worker)
+
+    def run(self, **kwargs) -> None:
+        """
+        Run one MinerU parse on a pooled worker
+
+        Blocks the calling thread until the parse completes.
+
+        Args:
+            **kwargs: Arguments for run_mineru_in_process
+
+        Raises:
+            MineruExecutionError: If MinerU fails, the worker dies, or the task times out
+        """
+        kwargs = {k: str(v) if isinstance(v, Path) else v for k, v in kwargs.items()}
+        worker = self._checkout()
+        start = time.time()
+        try:
+            status, payload = worker.request(("parse", kwargs), self.task_timeout)
+            worker.tasks_done += 1
+        except (OSError, EOFError, TimeoutError) as e:
+            self._retire(worker)
+            self._checkin(None)
+            raise MineruExecutionError(-1, [f"MinerU worker failed: {e}"]) from e
+
+        self._checkin(worker)
+        if status != "ok":
+            raise MineruExecutionError(1, [payload])
+        logger.info(
+            f"[MinerU] Worker {worker.process.pid} parsed {kwargs.get('input_path')} "
+            f"in {time.time() - start:.2f}s"
+        )
+
+    def shutdown(self) -> None:
+        """Stop all worker processes"""
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get pool size, live worker count, and tasks handled per worker"""
+        with self._lock:
+            return {
+                "size": self.size,
+                "live_workers": len(self._workers),
+                "tasks_per_worker": {
+                    w.process.pid: w.tasks_done for w in self._workers
+                },
+            }
+
+
+_shared_pools: Dict[Tuple[int, int], MineruWorkerPool] = {}
+_shared_pools_lock = threading.Lock()
+
+
+def get_mineru_worker_pool(
+    size: int, max_tasks_per_worker: int = 50
+) -> MineruWorkerPool:
+    """
+    Get a process-wide MinerU worker pool, creating it on first use
+
+    Pools are shared per (size, max_tasks_per_worker) so several RAGAnything
+    instances in one process do not each load their own copy of the models.
+
+    Args:
+        size: Number of worker processes
+        max_tasks_per_worker: Tasks after which a worker is recycled
+
+    Returns:
+        MineruWorkerPool: Shared worker pool
+    """
+    key = (size, max_tasks_per_worker)
+    with _shared_pools_lock:
+        pool = _shared_pools.get(key)
+        if pool is None:
+            pool = MineruWorkerPool(size, max_tasks_per_worker)
+            _shared_pools[key] = pool
+        return pool
+
+
+@atexit.register
+def _shutdown_shared_pools() -> None:
+    with _shared_pools_lock:
+        pools = list(_shared_pools.values())
+        _shared_pools.clear()
+    for pool in pools:
+        pool.shutdown()
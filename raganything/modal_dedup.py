@@ -0,0 +1,283 @@
+"""
+Multimodal content deduplication for RAGAnything
+
+Groups repeated images (by perceptual hash) and repeated tables (by normalized
+body) with the same captions and footnotes across all documents processed by
+a RAGAnything instance, so only one representative per group is sent to the
+model. The other occurrences reuse the
+representative's description and entity while still getting their own chunks.
+"""
+
+import asyncio
+import hashlib
+import html
+import re
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from lightrag.utils import logger
+
+DescriptionResult = Tuple[str, Dict[str, Any]]
+
+
+def compute_image_dhash(image_path: str, hash_size: int = 8) -> Optional[Tuple]:
+    """
+    Compute a difference hash (dHash) of an image
+
+    The image is reduced to a (hash_size + 1) x hash_size grayscale grid and
+    each bit records whether a pixel is brighter than its right neighbour, so
+    re-encoded or rescaled copies of the same image hash to the same or nearby
+    values. Because the hash only captures gradients, the coarse aspect ratio
+    and mean color are returned alongside it to keep flat images of different
+    colors or shapes apart.
+
+    Args:
+        image_path: Path to the image file
+        hash_size: Hash grid size (hash_size * hash_size bits)
+
+    Returns:
+        Optional[Tuple]: (bucket, hash) where bucket is (aspect ratio, mean
+            color), or None if Pillow is unavailable or the image cannot be read
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+
+    try:
+        with Image.open(image_path) as img:
+            width, height = img.size
+            rgb = img.convert("RGB")
+            mean_color = tuple(
+                channel // 32
+                for channel in rgb.resize((1, 1), Image.BOX).getpixel((0, 0))
+            )
+            grid = rgb.convert("L").resize(
+                (hash_size + 1, hash_size), Image.Resampling.LANCZOS
+            )
+            pixels = list(grid.getdata())
+    except Exception as e:
+        logger.debug(f"Could not hash image {image_path}: {e}")
+        return None
+
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+
+    aspect = round(width / height, 1) if height else 0.0
+    return (aspect, mean_color), value
+
+
+def normalize_table_body(table_body: str) -> str:
+    """
+    Normalize a table body so formatting-only differences compare equal
+
+    HTML attributes, entity encoding, case, and whitespace (including spacing
+    around Markdown cell separators) are normalized.
+
+    Args:
+        table_body: Table body in HTML or Markdown
+
+    Returns:
+        str: Normalized table body
+    """
+    text = html.unescape(table_body)
+    text = re.sub(r"<\s*(/?)\s*(\w+)[^>]*>", r"<\1\2>", text)
+    text = re.sub(r"\s*\|\s*", "|", text)
+    text = re.sub(r"\s+", " ", text)
+    return text.strip().lower()
+
+
+# Item fields that are sent to the model alongside the image or table body
+_CONTEXT_FIELDS = {
+    "image": ("image_caption", "img_caption", "image_footnote", "img_footnote"),
+    "table": ("table_caption", "table_footnote"),
+}
+
+
+def _item_context(item: Dict[str, Any]) -> str:
+    """Normalized captions and footnotes of an item, part of its group key"""
+    parts = []
+    for key in _CONTEXT_FIELDS.get(item.get("type"), ()):
+        value = item.get(key) or []
+        if isinstance(value, str):
+            value = [value]
+        text = " ".join(" ".join(str(part).split()) for part in value)
+        parts.append(f"{key}={text}")
+    return "|".join(parts)
+
+
+class _DedupGroup:
+    """A group of equivalent items and the representative's result"""
+
+    __slots__ = ("result", "pending", "occurrences")
+
+    def __init__(self):
+        self.result: Optional[DescriptionResult] = None
+        self.pending: Optional[asyncio.Future] = None
+        self.occurrences = 0
+
+
+class ModalDeduplicator:
+    """
+    Reuse descriptions of repeated images and tables
+
+    The first item of a group becomes its representative and is described
+    normally. Items of the same group that arrive while the representative is
+    being described wait for it; later ones reuse the stored result directly.
+    If describing the representative fails, or yields a fallback instead of
+    model output (entity_info["fallback"]), nothing is stored and the next
+    waiting item takes over.
+    """
+
+    def __init__(
+        self,
+        image_hash_threshold: int = 2,
+        dedup_tables: bool = True,
+        max_groups: int = 100000,
+    ):
+        """
+        Initialize deduplicator
+
+        Args:
+            image_hash_threshold: Maximum Hamming distance between the 64-bit
+                dHashes of two images in the same group (0 = identical hashes)
+            dedup_tables: Also group tables with identical normalized bodies
+            max_groups: Maximum number of groups remembered per modality (oldest
+                are dropped)
+        """
+        self.image_hash_threshold = max(0, image_hash_threshold)
+        self.dedup_tables = dedup_tables
+        self.max_groups = max(1, max_groups)
+        self._lock = threading.Lock()
+        # (aspect, mean color) -> [(dhash, group)]
+        self._image_groups: Dict[Tuple, List[Tuple[int, _DedupGroup]]] = {}
+        self._table_groups: Dict[str, _DedupGroup] = {}
+        self._image_group_count = 0
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def _record(self, modality: str, event: str) -> None:
+        counters = self.stats.setdefault(
+            modality, {"items": 0, "representatives": 0, "reused": 0}
+        )
+        counters[event] += 1
+
+    def _evict_images_locked(self) -> None:
+        """Drop the oldest image groups once max_groups is exceeded"""
+        while self._image_group_count > self.max_groups:
+            bucket = next(iter(self._image_groups))
+            self._image_groups[bucket].pop(0)
+            if not self._image_groups[bucket]:
+                del self._image_groups[bucket]
+            self._image_group_count -= 1
+
+    def _image_group(self, image_hash: Tuple, context: str) -> _DedupGroup:
+        bucket, value = image_hash
+        bucket = (bucket, context)
+        with self._lock:
+            candidates = self._image_groups.setdefault(bucket, [])
+            for other, group in candidates:
+                if bin(value ^ other).count("1") <= self.image_hash_threshold:
+                    return group
+            group = _DedupGroup()
+            candidates.append((value, group))
+            self._image_group_count += 1
+            self._evict_images_locked()
+            return group
+
+    def _table_group(self, table_body: str, context: str) -> _DedupGroup:
+        key = hashlib.md5(
+            f"{normalize_table_body(table_body)}\n{context}".encode()
+        ).hexdigest()
+        with self._lock:
+            group = self._table_groups.get(key)
+            if group is None:
+                group = self._table_groups[key] = _DedupGroup()
+                if len(self._table_groups) > self.max_groups:
+                    del self._table_groups[next(iter(self._table_groups))]
+            return group
+
+    async def _group_for(self, item: Dict[str, Any]) -> Optional[_DedupGroup]:
+        content_type = item.get("type")
+        if content_type == "image" and item.get("img_path"):
+            image_hash = await asyncio.to_thread(compute_image_dhash, item["img_path"])
+            if image_hash is None:
+                return None
+            return self._image_group(image_hash, _item_context(item))
+        if content_type == "table" and self.dedup_tables:
+            table_body = item.get("table_body")
+            if isinstance(table_body, str) and table_body.strip():
+                return self._table_group(table_body, _item_context(item))
+        return None
+
+    async def describe(
+        self,
+        item: Dict[str, Any],
+        generate: Callable[[], Awaitable[DescriptionResult]],
+    ) -> Tuple[str, Dict[str, Any], bool]:
+        """
+        Describe an item, calling the model only for a group's representative
+
+        Args:
+            item: Multimodal content item
+            generate: Coroutine function producing (description, entity_info)
+
+        Returns:
+            Tuple of (description, entity_info, reused) where reused is True if
+            the result was taken from an equivalent item
+        """
+        group = await self._group_for(item)
+        if group is None:
+            description, entity_info = await generate()
+            return description, entity_info, False
+
+        modality = item.get("type", "unknown")
+        self._record(modality, "items")
+        group.occurrences += 1
+        loop = asyncio.get_running_loop()
+
+        while True:
+            if group.result is not None:
+                self._record(modality, "reused")
+                description, entity_info = group.result
+                return description, dict(entity_info), True
+
+            pending = group.pending
+            if (
+                pending is not None
+                and not pending.done()
+                and pending.get_loop() is loop
+            ):
+                # Another occurrence is being described; wait for it
+                await asyncio.shield(pending)
+                continue
+
+            # This occurrence becomes the group's representative
+            future = group.pending = loop.create_future()
+            try:
+                description, entity_info = await generate()
+                if entity_info.get("fallback"):
+                    # Not model output; a waiting occurrence retries the model
+                    return description, entity_info, False
+                group.result = (description, dict(entity_info))
+                self._record(modality, "representatives")
+                return description, entity_info, False
+            finally:
+                if group.pending is future:
+                    group.pending = None
+                future.set_result(None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get deduplication counters
+
+        Returns:
+            Dict[str, Any]: Per-modality item, representative and reuse counts,
+                plus the number of model calls saved
+        """
+        stats = {modality: dict(counters) for modality, counters in self.stats.items()}
+        stats["model_calls_saved"] = sum(c["reused"] for c in self.stats.values())
+        stats["groups"] = self._image_group_count + len(self._table_groups)
+        return stats
@@ -3,6 +3,7 @@ Specialized processors for different modalities
 
 Includes:
 - ContextExtractor: Universal context extraction for multimodal content
+- DescriptionCache: Cache of modal description responses in KV storage
 - ImageModalProcessor: Specialized processor for image content
 - TableModalProcessor: Specialized processor for table content
 - EquationModalProcessor: Specialized processor for equation content
@@ -13,9 +14,10 @@ import re
 import json
 import time
 import base64
-from typing import Dict, Any, Tuple, List
+import asyncio
+from typing import Dict, Any, Tuple, List, Optional
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from lightrag.utils import (
     logger,
@@ -28,6 +30,7 @@ from lightrag.operate import extract_entities, merge_nodes_and_edges
 
 # Import prompt templates
 from raganything.prompt import PROMPTS
+from raganything.image_prep import ImagePreparer, PreparedImage
 
 
 @dataclass
@@ -46,6 +49,149 @@ class ContextConfig:
             self.filter_content_types = ["text"]
 
 
+@dataclass
+class ContextIndex:
+    """Per-document lookup structure for page-based context extraction
+
+    Built once per content list by grouping the blocks that can contribute to
+    context by page, so extracting context for an item only touches the
+    blocks inside its page window. Blocks are rendered and tokenized a page at
+    a time, the first time a page window needs them.
+    """
+
+    config: ContextConfig  # Config the index was built with
+    content_list: List[Dict] = field(default_factory=list)  # Indexed content list
+    page_offsets: Dict[Any, List[int]] = field(default_factory=dict)
+    # Content list offsets of candidate blocks per page, in content list order
+    blocks: Dict[int, Tuple[str, int]] = field(default_factory=dict)
+    # (text, token count) per offset on rendered pages; blank blocks are absent
+    rendered_pages: set = field(default_factory=set)  # Pages already rendered
+
+    def blocks_in_pages(self, start_page: int, end_page: int) -> List[int]:
+        """Get content list offsets of candidate blocks on pages start_page..end_page-1 in document order"""
+        offsets = []
+        for page in range(start_page, end_page):
+            offsets.extend(self.page_offsets.get(page, ()))
+        # Pages are normally in order already; sort in case they are not
+        offsets.sort()
+        return offsets
+
+
+@dataclass
+class DocumentContext:
+    """Context extraction state for one document
+
+    Passed through multimodal processing instead of being stored on the shared
+    processors, so several documents can be processed concurrently.
+    """
+
+    content_source: Any  # Source content (e.g. MinerU content list)
+    content_format: str = "auto"  # Format of content source
+    context_index: Optional[ContextIndex] = None  # Prebuilt index for content lists
+    doc_id: Optional[str] = None  # Document the context belongs to
+
+
+class DescriptionCache:
+    """Cache of modal description responses stored in a KV storage
+
+    The storage is a per-workspace SQLite table by default, so entries are
+    written individually; LightRAG's KV storage class can be used instead.
+
+    Entries are keyed by processor type, prompt template version, content
+    fingerprint (image bytes or table/equation body), context and model, so a
+    repeated figure or a re-run after a doc_id change is answered without
+    calling the model again. Hit and miss counts are kept per modality.
+    """
+
+    def __init__(self, storage):
+        """Initialize description cache
+
+        Args:
+            storage: KV storage instance (SQLiteParseCache or a LightRAG KV storage)
+        """
+        self.storage = storage
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_requested = False
+
+    async def initialize(self) -> None:
+        """Initialize the underlying storage"""
+        await self.storage.initialize()
+
+    async def finalize(self) -> None:
+        """Persist and close the underlying storage"""
+        if self._flush_task is not None:
+            await self._flush_task
+        await self.storage.finalize()
+
+    def _record(self, modality: str, event: str) -> None:
+        counters = self.stats.setdefault(modality, {"hits": 0, "misses": 0})
+        counters[event] += 1
+
+    async def get(self, key: str, modality: str) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss"""
+        try:
+            entry = await self.storage.get_by_id(key)
+        except Exception as e:
+            logger.debug(f"Error reading description cache: {e}")
+            entry = None
+
+        if entry and isinstance(entry.get("return"), str):
+            self._record(modality, "hits")
+            return entry["return"]
+        self._record(modality, "misses")
+        return None
+
+    async def put(self, key: str, modality: str, response: str) -> None:
+        """Store a model response"""
+        try:
+            await self.storage.upsert(
+                {
+                    key: {
+                        "return": response,
+                        "cache_type": "modal_description",
+                        "modality": modality,
+                        "create_time": int(time.time()),
+                    }
+                }
+            )
+        except Exception as e:
+            logger.debug(f"Error writing description cache: {e}")
+
+    async def flush(self) -> None:
+        """Persist pending cache entries"""
+        try:
+            await self.storage.index_done_callback()
+        except Exception as e:
+            logger.debug(f"Error persisting description cache: {e}")
+
+    def schedule_flush(self) -> None:
+        """Persist pending cache entries in a background task
+
+        Requests made while a flush is running are coalesced into one more
+        flush, so callers on a request path never wait for storage writes.
+        """
+        self._flush_requested = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_in_background())
+
+    async def _flush_in_background(self) -> None:
+        while self._flush_requested:
+            self._flush_requested = False
+            await self.flush()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get hit/miss counts and hit rate per modality"""
+        stats = {}
+        for modality, counters in self.stats.items():
+            lookups = counters["hits"] + counters["misses"]
+            stats[modality] = {
+                **counters,
+                "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+            }
+        return stats
+
+
 class ContextExtractor:
     """Universal context extractor supporting multiple content source formats"""
 
@@ -58,12 +204,63 @@ class ContextExtractor:
         """
         self.config = config or ContextConfig()
         self.tokenizer = tokenizer
+        self._marker_token_counts: Dict[str, int] = {}
+
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens with the tokenizer, or characters without one"""
+        if self.tokenizer:
+            return len(self.tokenizer.encode(text))
+        return len(text)
+
+    def build_index(self, content_list: List[Dict]) -> ContextIndex:
+        """Build a context index for a MinerU-style content list
+
+        Groups the blocks that pass the content type filter by page. Nothing
+        is rendered or tokenized here; see _render_index_pages.
+
+        Args:
+            content_list: List of content items with page_idx and type info
+
+        Returns:
+            ContextIndex for the content list
+        """
+        index = ContextIndex(config=self.config, content_list=content_list)
+        for offset, item in enumerate(content_list):
+            if item.get("type", "") in self.config.filter_content_types:
+                page = item.get("page_idx", 0)
+                index.page_offsets.setdefault(page, []).append(offset)
+        return index
+
+    def _render_index_pages(
+        self, context_index: ContextIndex, start_page: int, end_page: int
+    ) -> None:
+        """Render and tokenize the blocks of index pages not rendered yet
+
+        Args:
+            context_index: Index built for the content list
+            start_page: First page of the window
+            end_page: Page after the last page of the window
+        """
+        for page in range(start_page, end_page):
+            if page in context_index.rendered_pages:
+                continue
+            for offset in context_index.page_offsets.get(page, ()):
+                text_content = self._extract_text_from_item(
+                    context_index.content_list[offset]
+                )
+                if text_content and text_content.strip():
+                    context_index.blocks[offset] = (
+                        text_content,
+                        self._count_tokens(text_content),
+                    )
+            context_index.rendered_pages.add(page)
 
     def extract_context(
         self,
         content_source: Any,
         current_item_info: Dict[str, Any],
         content_format: str = "auto",
+        context_index: Optional[ContextIndex] = None,
     ) -> str:
         """Extract context for current item from content source
 
@@ -71,6 +268,7 @@ class ContextExtractor:
             content_source: Source content (list, dict, or other format)
             current_item_info: Information about current item (page_idx, index, etc.)
             content_format: Format hint for content source ("minerU", "text_chunks", "auto", etc.)
+            context_index: Prebuilt index for a content list source (see build_index)
 
         Returns:
             Extracted context text
@@ -82,7 +280,7 @@ class ContextExtractor:
             # Use format hint if provided, otherwise auto-detect
             if content_format == "minerU" and isinstance(content_source, list):
                 return self._extract_from_content_list(
-                    content_source, current_item_info
+                    content_source, current_item_info, context_index
                 )
             elif content_format == "text_chunks" and isinstance(content_source, list):
                 return self._extract_from_text_chunks(content_source, current_item_info)
@@ -92,7 +290,7 @@ class ContextExtractor:
                 # Auto-detect content source format
                 if isinstance(content_source, list):
                     return self._extract_from_content_list(
-                        content_source, current_item_info
+                        content_source, current_item_info, context_index
                     )
                 elif isinstance(content_source, dict):
                     return self._extract_from_dict_source(
@@ -112,23 +310,32 @@ class ContextExtractor:
             return ""
 
     def _extract_from_content_list(
-        self, content_list: List[Dict], current_item_info: Dict
+        self,
+        content_list: List[Dict],
+        current_item_info: Dict,
+        context_index: Optional[ContextIndex] = None,
     ) -> str:
         """Extract context from MinerU-style content list
 
         Args:
             content_list: List of content items with page_idx and type info
             current_item_info: Current item information
+            context_index: Prebuilt index for the content list, if available
 
         Returns:
             Context text from surrounding pages/chunks
         """
-        if self.config.context_mode == "page":
-            return self._extract_page_context(content_list, current_item_info)
-        elif self.config.context_mode == "chunk":
+        if self.config.context_mode == "chunk":
             return self._extract_chunk_context(content_list, current_item_info)
-        else:
-            return self._extract_page_context(content_list, current_item_info)
+
+        # An index built under a different config renders blocks differently
+        if (
+            context_index is not None
+            and context_index.config is self.config
+            and isinstance(current_item_info.get("page_idx", 0), int)
+        ):
+            return self._extract_page_context_indexed(context_index, current_item_info)
+        return self._extract_page_context(content_list, current_item_info)
 
     def _extract_page_context(
         self, content_list: List[Dict], current_item_info: Dict
@@ -170,6 +377,91 @@ class ContextExtractor:
         context = "\n".join(context_texts)
         return self._truncate_context(context)
 
+    def _extract_page_context_indexed(
+        self, context_index: ContextIndex, current_item_info: Dict
+    ) -> str:
+        """Extract page-window context using a prebuilt context index
+
+        Visits only the blocks inside the page window, rendering pages the
+        index has not seen yet, and assembles the context from whole blocks
+        using their cached token counts, so only the block that crosses the
+        token budget is tokenized again.
+
+        Args:
+            context_index: Index built for the content list
+            current_item_info: Current item with page_idx
+
+        Returns:
+            Context text from surrounding pages
+        """
+        current_page = current_item_info.get("page_idx", 0)
+        window_size = self.config.context_window
+        start_page = max(0, current_page - window_size)
+        end_page = current_page + window_size + 1
+
+        self._render_index_pages(context_index, start_page, end_page)
+        blocks = []
+        collected_tokens = 0
+        for offset in context_index.blocks_in_pages(start_page, end_page):
+            block = context_index.blocks.get(offset)
+            if block is None:
+                continue
+            text_content, token_count = block
+            item_page = context_index.content_list[offset].get("page_idx", 0)
+            # Add page marker for better context understanding
+            if item_page != current_page:
+                marker = f"[Page {item_page}] "
+                if marker not in self._marker_token_counts:
+                    self._marker_token_counts[marker] = self._count_tokens(marker)
+                text_content = marker + text_content
+                token_count += self._marker_token_counts[marker]
+            blocks.append((text_content, token_count))
+
+            # Later blocks cannot fit once the budget is exceeded
+            collected_tokens += token_count
+            if collected_tokens > self.config.max_context_tokens:
+                break
+
+        return self._truncate_blocks(blocks)
+
+    def _truncate_blocks(self, blocks: List[Tuple[str, int]]) -> str:
+        """Join context blocks up to the maximum token limit
+
+        Whole blocks are taken while their cached token counts fit the budget
+        (counting one token per newline separator); only the block that
+        crosses the budget is encoded and cut.
+
+        Args:
+            blocks: (text, token count) pairs in context order
+
+        Returns:
+            Context text within the token limit
+        """
+        max_tokens = self.config.max_context_tokens
+        texts = []
+        used_tokens = 0
+        for text, token_count in blocks:
+            separator_tokens = 1 if texts else 0
+            if used_tokens + separator_tokens + token_count <= max_tokens:
+                texts.append(text)
+                used_tokens += separator_tokens + token_count
+                continue
+
+            remaining = max_tokens - used_tokens - separator_tokens
+            if remaining == 0:
+                # Keep the separator, as a cut right after it would
+                texts.append("")
+            elif remaining > 0:
+                if self.tokenizer:
+                    tokens = self.tokenizer.encode(text)
+                    texts.append(self.tokenizer.decode(tokens[:remaining]))
+                else:
+                    texts.append(text[:remaining])
+            truncated = "\n".join(texts)
+            return self._trim_to_boundary(truncated) if truncated else ""
+
+        return "\n".join(texts)
+
     def _extract_chunk_context(
         self, content_list: List[Dict], current_item_info: Dict
     ) -> str:
@@ -325,46 +617,50 @@ class ContextExtractor:
 
             # Truncate to max tokens and decode back to text
             truncated_tokens = tokens[: self.config.max_context_tokens]
-            truncated_text = self.tokenizer.decode(truncated_tokens)
-
-            # Try to end at a sentence boundary
-            last_period = truncated_text.rfind(".")
-            last_newline = truncated_text.rfind("\n")
-
-            if last_period > len(truncated_text) * 0.8:
-                return truncated_text[: last_period + 1]
-            elif last_newline > len(truncated_text) * 0.8:
-                return truncated_text[:last_newline]
-            else:
-                return truncated_text + "..."
+            return self._trim_to_boundary(self.tokenizer.decode(truncated_tokens))
         else:
             # Fallback to character-based truncation if no tokenizer
             if len(context) <= self.config.max_context_tokens:
                 return context
 
             # Simple truncation - fallback when no tokenizer available
-            truncated = context[: self.config.max_context_tokens]
+            return self._trim_to_boundary(context[: self.config.max_context_tokens])
 
-            # Try to end at a sentence boundary
-            last_period = truncated.rfind(".")
-            last_newline = truncated.rfind("\n")
+    def _trim_to_boundary(self, truncated: str) -> str:
+        """End truncated context at a sentence or line boundary when one is near the end
 
-            if last_period > len(truncated) * 0.8:
-                return truncated[: last_period + 1]
-            elif last_newline > len(truncated) * 0.8:
-                return truncated[:last_newline]
-            else:
-                return truncated + "..."
+        Args:
+            truncated: Context text already cut to the token limit
+
+        Returns:
+            Context text ending at a boundary, or marked with an ellipsis
+        """
+        last_period = truncated.rfind(".")
+        last_newline = truncated.rfind("\n")
+
+        if last_period > len(truncated) * 0.8:
+            return truncated[: last_period + 1]
+        elif last_newline > len(truncated) * 0.8:
+            return truncated[:last_newline]
+        else:
+            return truncated + "..."
 
 
 class BaseModalProcessor:
     """Base class for modal processors"""
 
+    # Modality name used for description cache keys and statistics
+    MODALITY = "generic"
+    # PROMPTS entries whose text versions the description cache
+    DESCRIPTION_PROMPT_KEYS: Tuple[str, ...] = ()
+
     def __init__(
         self,
         lightrag: LightRAG,
         modal_caption_func,
         context_extractor: ContextExtractor = None,
+        description_cache: Optional[DescriptionCache] = None,
+        model_name: Optional[str] = None,
     ):
         """Initialize base processor
 
@@ -372,9 +668,13 @@ class BaseModalProcessor:
             lightrag: LightRAG instance
             modal_caption_func: Function for generating descriptions
             context_extractor: Context extractor instance
+            description_cache: Optional cache for description responses
+            model_name: Identity of the model behind modal_caption_func, part of
+                description cache keys (responses are not cached when empty)
         """
         self.lightrag = lightrag
         self.modal_caption_func = modal_caption_func
+        self.description_cache = description_cache
 
         # Use LightRAG's storage instances
         self.text_chunks_db = lightrag.text_chunks
@@ -387,6 +687,7 @@ class BaseModalProcessor:
         self.embedding_func = lightrag.embedding_func
         self.llm_model_func = lightrag.llm_model_func
         self.global_config = asdict(lightrag)
+        self.model_name = model_name or ""
         self.hashing_kv = lightrag.llm_response_cache
         self.tokenizer = lightrag.tokenizer
 
@@ -402,33 +703,66 @@ class BaseModalProcessor:
         # Content source for context extraction
         self.content_source = None
         self.content_format = "auto"
+        self.context_index = None
 
-    def set_content_source(self, content_source: Any, content_format: str = "auto"):
+    def set_content_source(
+        self,
+        content_source: Any,
+        content_format: str = "auto",
+        context_index: Optional[ContextIndex] = None,
+    ):
         """Set content source for context extraction
 
         Args:
             content_source: Source content for context extraction
             content_format: Format of content source ("minerU", "text_chunks", "auto")
+            context_index: Prebuilt context index for a content list source;
+                built here if not given
         """
         self.content_source = content_source
         self.content_format = content_format
+        if (
+            context_index is None
+            and isinstance(content_source, list)
+            and content_format in ("minerU", "auto")
+        ):
+            context_index = self.context_extractor.build_index(content_source)
+        self.context_index = context_index
         logger.info(f"Content source set with format: {content_format}")
 
-    def _get_context_for_item(self, item_info: Dict[str, Any]) -> str:
+    def _get_context_for_item(
+        self,
+        item_info: Dict[str, Any],
+        document_context: Optional[DocumentContext] = None,
+    ) -> str:
         """Get context for current processing item
 
         Args:
             item_info: Information about current item (page_idx, index, etc.)
+            document_context: Per-document context source; falls back to the
+                content source set on the processor
 
         Returns:
             Context text for the item
         """
-        if not self.content_source:
+        if document_context is not None:
+            content_source = document_context.content_source
+            content_format = document_context.content_format
+            context_index = document_context.context_index
+        else:
+            content_source = self.content_source
+            content_format = self.content_format
+            context_index = self.context_index
+
+        if not content_source:
             return ""
 
         try:
             context = self.context_extractor.extract_context(
-                self.content_source, item_info, self.content_format
+                content_source,
+                item_info,
+                content_format,
+                context_index,
             )
             if context:
                 logger.debug(
@@ -445,6 +779,7 @@ class BaseModalProcessor:
         content_type: str,
         item_info: Dict[str, Any] = None,
         entity_name: str = None,
+        document_context: Optional[DocumentContext] = None,
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Generate text description and entity info only, without entity relation extraction.
@@ -455,13 +790,89 @@ class BaseModalProcessor:
             content_type: Type of modal content
             item_info: Item information for context extraction
             entity_name: Optional predefined entity name
+            document_context: Per-document context source (defaults to the
+                processor's content source)
 
         Returns:
-            Tuple of (description, entity_info)
+            Tuple of (description, entity_info). If the model call fails, a
+            fallback built from the raw content is returned and entity_info
+            has "fallback": True.
         """
         # Subclasses must implement this method
         raise NotImplementedError("Subclasses must implement this method")
 
+    def _description_cache_key(
+        self,
+        content_fingerprint: str,
+        context: str,
+        entity_name: Optional[str],
+    ) -> Optional[str]:
+        """Build the description cache key for one model call
+
+        Args:
+            content_fingerprint: Hash of the content being described
+            context: Surrounding context included in the prompt
+            entity_name: Predefined entity name, if any
+
+        Returns:
+            Cache key, or None if the model identity is unknown
+        """
+        if not self.model_name:
+            return None
+
+        # Hashing the template text invalidates entries when prompts change
+        template_version = compute_mdhash_id(
+            "\x1f".join(
+                str(PROMPTS.get(key, "")) for key in self.DESCRIPTION_PROMPT_KEYS
+            )
+        )
+        key_data = [
+            self.MODALITY,
+            template_version,
+            content_fingerprint,
+            compute_mdhash_id(context or ""),
+            self.model_name,
+            entity_name or "",
+        ]
+        return compute_mdhash_id(json.dumps(key_data), prefix="desc-")
+
+    async def _call_modal_caption_func(
+        self,
+        prompt: str,
+        content_fingerprint: str,
+        context: str,
+        entity_name: Optional[str],
+        **kwargs,
+    ) -> str:
+        """Call the modal caption function, consulting the description cache
+
+        Args:
+            prompt: Description prompt
+            content_fingerprint: Hash of the content being described
+            context: Surrounding context included in the prompt
+            entity_name: Predefined entity name, if any
+            **kwargs: Extra arguments for the caption function (image_data, system_prompt)
+
+        Returns:
+            Model response
+        """
+        cache_key = None
+        if self.description_cache is not None:
+            cache_key = self._description_cache_key(
+                content_fingerprint, context, entity_name
+            )
+        if cache_key is None:
+            return await self.modal_caption_func(prompt, **kwargs)
+
+        cached = await self.description_cache.get(cache_key, self.MODALITY)
+        if cached is not None:
+            return cached
+
+        response = await self.modal_caption_func(prompt, **kwargs)
+        if isinstance(response, str) and response:
+            await self.description_cache.put(cache_key, self.MODALITY, response)
+        return response
+
     async def _create_entity_and_chunk(
         self,
         modal_chunk: str,
@@ -782,11 +1193,21 @@ class BaseModalProcessor:
 class ImageModalProcessor(BaseModalProcessor):
     """Processor specialized for image content"""
 
+    MODALITY = "image"
+    DESCRIPTION_PROMPT_KEYS = (
+        "vision_prompt",
+        "vision_prompt_with_context",
+        "IMAGE_ANALYSIS_SYSTEM",
+    )
+
     def __init__(
         self,
         lightrag: LightRAG,
         modal_caption_func,
         context_extractor: ContextExtractor = None,
+        description_cache: Optional[DescriptionCache] = None,
+        image_preparer: Optional[ImagePreparer] = None,
+        model_name: Optional[str] = None,
     ):
         """Initialize image processor
 
@@ -794,11 +1215,32 @@ class ImageModalProcessor(BaseModalProcessor):
             lightrag: LightRAG instance
             modal_caption_func: Function for generating descriptions (supporting image understanding)
             context_extractor: Context extractor instance
+            description_cache: Optional cache for description responses
+            image_preparer: Optional preparer that resizes and re-encodes images
+                before they are sent to the model
+            model_name: Identity of the vision model, part of description cache
+                keys (responses are not cached when empty)
         """
-        super().__init__(lightrag, modal_caption_func, context_extractor)
+        super().__init__(
+            lightrag,
+            modal_caption_func,
+            context_extractor,
+            description_cache,
+            model_name=model_name,
+        )
+        self.image_preparer = image_preparer
+
+    def _prepare_image(self, image_path: str) -> Optional[PreparedImage]:
+        """Prepare image for the vision model, None if no preparer is set"""
+        if self.image_preparer is None:
+            return None
+        return self.image_preparer.prepare(image_path)
 
     def _encode_image_to_base64(self, image_path: str) -> str:
         """Encode image to base64"""
+        if self.image_preparer is not None:
+            prepared = self.image_preparer.prepare(image_path)
+            return prepared.base64 if prepared else ""
         try:
             with open(image_path, "rb") as image_file:
                 encoded_string = base64.b64encode(image_file.read()).decode("utf-8")
@@ -813,6 +1255,7 @@ class ImageModalProcessor(BaseModalProcessor):
         content_type: str,
         item_info: Dict[str, Any] = None,
         entity_name: str = None,
+        document_context: Optional[DocumentContext] = None,
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Generate image description and entity info only, without entity relation extraction.
@@ -823,6 +1266,8 @@ class ImageModalProcessor(BaseModalProcessor):
             content_type: Type of modal content ("image")
             item_info: Item information for context extraction
             entity_name: Optional predefined entity name
+            document_context: Per-document context source (defaults to the
+                processor's content source)
 
         Returns:
             Tuple of (enhanced_caption, entity_info)
@@ -859,7 +1304,7 @@ class ImageModalProcessor(BaseModalProcessor):
             # Extract context for current item
             context = ""
             if item_info:
-                context = self._get_context_for_item(item_info)
+                context = self._get_context_for_item(item_info, document_context)
 
             # Build detailed visual analysis prompt with context
             if context:
@@ -884,14 +1329,29 @@ class ImageModalProcessor(BaseModalProcessor):
                     footnotes=footnotes if footnotes else "None",
                 )
 
-            # Encode image to base64
-            image_base64 = self._encode_image_to_base64(image_path)
+            # Encode image to base64 (resized and re-encoded if a preparer is set)
+            if self.image_preparer is not None:
+                prepared = await asyncio.to_thread(self._prepare_image, image_path)
+                image_base64 = prepared.base64 if prepared else ""
+                image_digest = prepared.digest if prepared else ""
+            else:
+                image_base64 = self._encode_image_to_base64(image_path)
+                image_digest = compute_mdhash_id(image_base64)
             if not image_base64:
                 raise RuntimeError(f"Failed to encode image to base64: {image_path}")
 
             # Call vision model with encoded image
-            response = await self.modal_caption_func(
+            content_fingerprint = compute_mdhash_id(
+                json.dumps(
+                    [image_digest, captions, footnotes],
+                    ensure_ascii=False,
+                )
+            )
+            response = await self._call_modal_caption_func(
                 vision_prompt,
+                content_fingerprint,
+                context,
+                entity_name,
                 image_data=image_base64,
                 system_prompt=PROMPTS["IMAGE_ANALYSIS_SYSTEM"],
             )
@@ -910,6 +1370,7 @@ class ImageModalProcessor(BaseModalProcessor):
                 else f"image_{compute_mdhash_id(str(modal_content))}",
                 "entity_type": "image",
                 "summary": f"Image content: {str(modal_content)[:100]}",
+                "fallback": True,
             }
             return str(modal_content), fallback_entity
 
@@ -923,12 +1384,13 @@ class ImageModalProcessor(BaseModalProcessor):
         batch_mode: bool = False,
         doc_id: str = None,
         chunk_order_index: int = 0,
+        document_context: Optional[DocumentContext] = None,
     ) -> Tuple[str, Dict[str, Any]]:
         """Process image content with context support"""
         try:
             # Generate description and entity info
             enhanced_caption, entity_info = await self.generate_description_only(
-                modal_content, content_type, item_info, entity_name
+                modal_content, content_type, item_info, entity_name, document_context
             )
 
             # Build complete image content
@@ -1018,12 +1480,20 @@ class ImageModalProcessor(BaseModalProcessor):
 class TableModalProcessor(BaseModalProcessor):
     """Processor specialized for table content"""
 
+    MODALITY = "table"
+    DESCRIPTION_PROMPT_KEYS = (
+        "table_prompt",
+        "table_prompt_with_context",
+        "TABLE_ANALYSIS_SYSTEM",
+    )
+
     async def generate_description_only(
         self,
         modal_content,
         content_type: str,
         item_info: Dict[str, Any] = None,
         entity_name: str = None,
+        document_context: Optional[DocumentContext] = None,
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Generate table description and entity info only, without entity relation extraction.
@@ -1034,6 +1504,8 @@ class TableModalProcessor(BaseModalProcessor):
             content_type: Type of modal content ("table")
             item_info: Item information for context extraction
             entity_name: Optional predefined entity name
+            document_context: Per-document context source (defaults to the
+                processor's content source)
 
         Returns:
             Tuple of (enhanced_caption, entity_info)
@@ -1056,7 +1528,7 @@ class TableModalProcessor(BaseModalProcessor):
             # Extract context for current item
             context = ""
             if item_info:
-                context = self._get_context_for_item(item_info)
+                context = self._get_context_for_item(item_info, document_context)
 
             # Build table analysis prompt with context
             if context:
@@ -1084,8 +1556,16 @@ class TableModalProcessor(BaseModalProcessor):
                 )
 
             # Call LLM for table analysis
-            response = await self.modal_caption_func(
+            content_fingerprint = compute_mdhash_id(
+                json.dumps(
+                    [table_body, table_caption, table_footnote], ensure_ascii=False
+                )
+            )
+            response = await self._call_modal_caption_func(
                 table_prompt,
+                content_fingerprint,
+                context,
+                entity_name,
                 system_prompt=PROMPTS["TABLE_ANALYSIS_SYSTEM"],
             )
 
@@ -1105,6 +1585,7 @@ class TableModalProcessor(BaseModalProcessor):
                 else f"table_{compute_mdhash_id(str(modal_content))}",
                 "entity_type": "table",
                 "summary": f"Table content: {str(modal_content)[:100]}",
+                "fallback": True,
             }
             return str(modal_content), fallback_entity
 
@@ -1118,12 +1599,13 @@ class TableModalProcessor(BaseModalProcessor):
         batch_mode: bool = False,
         doc_id: str = None,
         chunk_order_index: int = 0,
+        document_context: Optional[DocumentContext] = None,
     ) -> Tuple[str, Dict[str, Any]]:
         """Process table content with context support"""
         try:
             # Generate description and entity info
             enhanced_caption, entity_info = await self.generate_description_only(
-                modal_content, content_type, item_info, entity_name
+                modal_content, content_type, item_info, entity_name, document_context
             )
 
             # Parse table content for building complete chunk
@@ -1212,12 +1694,20 @@ class TableModalProcessor(BaseModalProcessor):
 class EquationModalProcessor(BaseModalProcessor):
     """Processor specialized for equation content"""
 
+    MODALITY = "equation"
+    DESCRIPTION_PROMPT_KEYS = (
+        "equation_prompt",
+        "equation_prompt_with_context",
+        "EQUATION_ANALYSIS_SYSTEM",
+    )
+
     async def generate_description_only(
         self,
         modal_content,
         content_type: str,
         item_info: Dict[str, Any] = None,
         entity_name: str = None,
+        document_context: Optional[DocumentContext] = None,
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Generate equation description and entity info only, without entity relation extraction.
@@ -1228,6 +1718,8 @@ class EquationModalProcessor(BaseModalProcessor):
             content_type: Type of modal content ("equation")
             item_info: Item information for context extraction
             entity_name: Optional predefined entity name
+            document_context: Per-document context source (defaults to the
+                processor's content source)
 
         Returns:
             Tuple of (enhanced_caption, entity_info)
@@ -1248,7 +1740,7 @@ class EquationModalProcessor(BaseModalProcessor):
             # Extract context for current item
             context = ""
             if item_info:
-                context = self._get_context_for_item(item_info)
+                context = self._get_context_for_item(item_info, document_context)
 
             # Build equation analysis prompt with context
             if context:
@@ -1272,8 +1764,14 @@ class EquationModalProcessor(BaseModalProcessor):
                 )
 
             # Call LLM for equation analysis
-            response = await self.modal_caption_func(
+            content_fingerprint = compute_mdhash_id(
+                json.dumps([equation_text, equation_format], ensure_ascii=False)
+            )
+            response = await self._call_modal_caption_func(
                 equation_prompt,
+                content_fingerprint,
+                context,
+                entity_name,
                 system_prompt=PROMPTS["EQUATION_ANALYSIS_SYSTEM"],
             )
 
@@ -1293,6 +1791,7 @@ class EquationModalProcessor(BaseModalProcessor):
                 else f"equation_{compute_mdhash_id(str(modal_content))}",
                 "entity_type": "equation",
                 "summary": f"Equation content: {str(modal_content)[:100]}",
+                "fallback": True,
             }
             return str(modal_content), fallback_entity
 
@@ -1306,12 +1805,13 @@ class EquationModalProcessor(BaseModalProcessor):
         batch_mode: bool = False,
         doc_id: str = None,
         chunk_order_index: int = 0,
+        document_context: Optional[DocumentContext] = None,
     ) -> Tuple[str, Dict[str, Any]]:
         """Process equation content with context support"""
         try:
             # Generate description and entity info
             enhanced_caption, entity_info = await self.generate_description_only(
-                modal_content, content_type, item_info, entity_name
+                modal_content, content_type, item_info, entity_name, document_context
             )
 
             # Parse equation content for building complete chunk
@@ -1396,12 +1896,19 @@ class EquationModalProcessor(BaseModalProcessor):
 class GenericModalProcessor(BaseModalProcessor):
     """Generic processor for other types of modal content"""
 
+    DESCRIPTION_PROMPT_KEYS = (
+        "generic_prompt",
+        "generic_prompt_with_context",
+        "GENERIC_ANALYSIS_SYSTEM",
+    )
+
     async def generate_description_only(
         self,
         modal_content,
         content_type: str,
         item_info: Dict[str, Any] = None,
         entity_name: str = None,
+        document_context: Optional[DocumentContext] = None,
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Generate generic modal description and entity info only, without entity relation extraction.
@@ -1412,6 +1919,8 @@ class GenericModalProcessor(BaseModalProcessor):
             content_type: Type of modal content
             item_info: Item information for context extraction
             entity_name: Optional predefined entity name
+            document_context: Per-document context source (defaults to the
+                processor's content source)
 
         Returns:
             Tuple of (enhanced_caption, entity_info)
@@ -1420,7 +1929,7 @@ class GenericModalProcessor(BaseModalProcessor):
             # Extract context for current item
             context = ""
             if item_info:
-                context = self._get_context_for_item(item_info)
+                context = self._get_context_for_item(item_info, document_context)
 
             # Build generic analysis prompt with context
             if context:
@@ -1444,8 +1953,12 @@ class GenericModalProcessor(BaseModalProcessor):
                 )
 
             # Call LLM for generic analysis
-            response = await self.modal_caption_func(
+            content_fingerprint = compute_mdhash_id(f"{content_type}:{modal_content}")
+            response = await self._call_modal_caption_func(
                 generic_prompt,
+                content_fingerprint,
+                context,
+                entity_name,
                 system_prompt=PROMPTS["GENERIC_ANALYSIS_SYSTEM"].format(
                     content_type=content_type
                 ),
@@ -1467,6 +1980,7 @@ class GenericModalProcessor(BaseModalProcessor):
                 else f"{content_type}_{compute_mdhash_id(str(modal_content))}",
                 "entity_type": content_type,
                 "summary": f"{content_type} content: {str(modal_content)[:100]}",
+                "fallback": True,
             }
             return str(modal_content), fallback_entity
 
@@ -1480,12 +1994,13 @@ class GenericModalProcessor(BaseModalProcessor):
         batch_mode: bool = False,
         doc_id: str = None,
         chunk_order_index: int = 0,
+        document_context: Optional[DocumentContext] = None,
     ) -> Tuple[str, Dict[str, Any]]:
         """Process generic modal content with context support"""
         try:
             # Generate description and entity info
             enhanced_caption, entity_info = await self.generate_description_only(
-                modal_content, content_type, item_info, entity_name
+                modal_content, content_type, item_info, entity_name, document_context
             )
 
             # Build complete content
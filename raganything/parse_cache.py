@@ -0,0 +1,396 @@
+"""
+Parse cache storage backends for RAGAnything
+
+Contains a SQLite-backed key-value store for parse results (also used for the
+modal description cache) that writes entries individually instead of
+re-serializing the whole cache on every flush, and a blob store that keeps
+cached content lists out of the cache entries
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from lightrag.utils import logger
+
+
+class SQLiteParseCache:
+    """
+    Parse cache stored in a single SQLite database file per workspace
+
+    Exposes the subset of LightRAG's KV storage interface used by RAGAnything
+    (initialize, get_by_id, get_by_ids, filter_keys, upsert, delete,
+    index_done_callback, finalize), so it can be used as a drop-in replacement
+    for ``key_string_value_json_storage_cls`` for the parse cache and the
+    modal description cache.
+
+    Writes are per entry. The database runs in WAL mode with
+    ``synchronous=NORMAL``, so a commit only appends to the write-ahead log;
+    the log is checkpointed (fsynced into the main file) once every
+    ``fsync_batch_size`` writes and on finalize. Free pages left behind by
+    overwritten entries are reclaimed with VACUUM when they exceed
+    ``compaction_threshold`` of the file.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        fsync_batch_size: int = 64,
+        compaction_threshold: float = 0.25,
+        table: str = "parse_cache",
+        blob_store: Optional["ParseCacheBlobStore"] = None,
+    ):
+        """
+        Initialize SQLite parse cache
+
+        Args:
+            db_path: Path to the SQLite database file
+            fsync_batch_size: Number of writes between WAL checkpoints
+            compaction_threshold: Fraction of free pages that triggers VACUUM on finalize
+            table: Name of the table holding the entries
+            blob_store: Blob store holding content lists referenced by the
+                entries; cleared together with the entries by drop()
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid SQLite table name: {table!r}")
+        self.db_path = Path(db_path)
+        self.table = table
+        self.blob_store = blob_store
+        self.fsync_batch_size = max(1, fsync_batch_size)
+        self.compaction_threshold = compaction_threshold
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes_since_checkpoint = 0
+
+    def _connect(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Checkpoints are driven explicitly in batches
+        conn.execute("PRAGMA wal_autocheckpoint=0")
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn = conn
+
+    def _execute(self, sql: str, params=()) -> List[tuple]:
+        with self._lock:
+            if self._conn is None:
+                raise RuntimeError("SQLite parse cache is not initialized")
+            return self._conn.execute(sql, params).fetchall()
+
+    async def initialize(self) -> None:
+        """Open the database, creating it if needed"""
+        if self._conn is None:
+            await asyncio.to_thread(self._connect)
+            logger.info(f"{self.table} using SQLite storage: {self.db_path}")
+
+    async def get_by_id(self, id: str) -> Optional[Dict[str, Any]]:
+        """Get a cache entry by key"""
+        rows = await asyncio.to_thread(
+            self._execute, f"SELECT value FROM {self.table} WHERE key = ?", (id,)
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    async def get_by_ids(self, ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get cache entries by keys, preserving order (None for missing keys)"""
+        if not ids:
+            return []
+        placeholders = ",".join("?" * len(ids))
+        rows = await asyncio.to_thread(
+            self._execute,
+            f"SELECT key, value FROM {self.table} WHERE key IN ({placeholders})",
+            tuple(ids),
+        )
+        found = {key: json.loads(value) for key, value in rows}
+        return [found.get(id) for id in ids]
+
+    async def filter_keys(self, keys: set[str]) -> set[str]:
+        """Return the keys that are not present in the cache"""
+        if not keys:
+            return set()
+        key_list = list(keys)
+        placeholders = ",".join("?" * len(key_list))
+        rows = await asyncio.to_thread(
+            self._execute,
+            f"SELECT key FROM {self.table} WHERE key IN ({placeholders})",
+            tuple(key_list),
+        )
+        return keys - {row[0] for row in rows}
+
+    def _upsert_sync(self, data: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            if self._conn is None:
+                raise RuntimeError("SQLite parse cache is not initialized")
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)",
+                    [
+                        (key, json.dumps(value, ensure_ascii=False))
+                        for key, value in data.items()
+                    ],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._writes_since_checkpoint += len(data)
+
+    async def upsert(self, data: Dict[str, Dict[str, Any]]) -> None:
+        """Insert or replace cache entries"""
+        if data:
+            await asyncio.to_thread(self._upsert_sync, data)
+
+    async def delete(self, ids: List[str]) -> None:
+        """Delete cache entries by keys"""
+        if not ids:
+            return
+        placeholders = ",".join("?" * len(ids))
+        await asyncio.to_thread(
+            self._execute,
+            f"DELETE FROM {self.table} WHERE key IN ({placeholders})",
+            tuple(ids),
+        )
+
+    def _checkpoint_sync(self, mode: str = "PASSIVE") -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.execute(f"PRAGMA wal_checkpoint({mode})")
+            self._writes_since_checkpoint = 0
+
+    async def index_done_callback(self) -> None:
+        """Checkpoint the write-ahead log once enough writes have accumulated"""
+        if self._writes_since_checkpoint >= self.fsync_batch_size:
+            await asyncio.to_thread(self._checkpoint_sync)
+
+    def _compact_sync(self, force: bool = False) -> bool:
+        with self._lock:
+            if self._conn is None:
+                return False
+            page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+            freelist_count = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if not force and (
+                page_count == 0
+                or freelist_count / page_count < self.compaction_threshold
+            ):
+                return False
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.execute("VACUUM")
+            return True
+
+    async def compact(self, force: bool = False) -> bool:
+        """
+        Reclaim space left by overwritten or deleted entries
+
+        Args:
+            force: Run VACUUM even if the free page ratio is below the threshold
+
+        Returns:
+            bool: True if the database was compacted
+        """
+        compacted = await asyncio.to_thread(self._compact_sync, force)
+        if compacted:
+            logger.info(f"Compacted {self.table}: {self.db_path}")
+        return compacted
+
+    async def drop(self) -> Dict[str, str]:
+        """Remove all cache entries and their content list blobs"""
+        await asyncio.to_thread(self._execute, f"DELETE FROM {self.table}")
+        if self.blob_store is not None:
+            await self.blob_store.clear()
+        await self.compact(force=True)
+        return {"status": "success", "message": "data dropped"}
+
+    def _close_sync(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self._conn.close()
+                self._conn = None
+
+    async def finalize(self) -> None:
+        """Flush the write-ahead log, compact if needed, and close the database"""
+        if self._conn is None:
+            return
+        try:
+            await self.compact()
+        except Exception as e:
+            logger.warning(f"Parse cache compaction failed: {e}")
+        await asyncio.to_thread(self._close_sync)
+
+
+def get_description_cache_db_path(working_dir: str, workspace: str = "") -> Path:
+    """
+    Get the SQLite modal description cache path for a working directory and workspace
+
+    Args:
+        working_dir: RAG storage working directory
+        workspace: Optional LightRAG workspace name
+
+    Returns:
+        Path: Path to the description cache database file
+    """
+    base_dir = os.path.join(working_dir, workspace) if workspace else working_dir
+    return Path(base_dir) / "modal_description_cache.sqlite3"
+
+
+def get_parse_cache_db_path(working_dir: str, workspace: str = "") -> Path:
+    """
+    Get the SQLite parse cache path for a working directory and workspace
+
+    Mirrors the directory layout LightRAG uses for its file-based KV storages.
+
+    Args:
+        working_dir: RAG storage working directory
+        workspace: Optional LightRAG workspace name
+
+    Returns:
+        Path: Path to the parse cache database file
+    """
+    base_dir = os.path.join(working_dir, workspace) if workspace else working_dir
+    return Path(base_dir) / "parse_cache.sqlite3"
+
+
+class ParseCacheBlobStore:
+    """
+    Out-of-line storage for cached content lists
+
+    Each content list is written as a gzip-compressed JSON file named after its
+    parse cache key, so the parse cache itself only holds small metadata
+    entries. Blobs are read on demand when a cache lookup hits, and the most
+    recently used blobs are kept decompressed in an in-memory LRU. The LRU holds
+    serialized JSON rather than decoded objects, so every hit returns a fresh
+    content list that callers are free to modify.
+    """
+
+    def __init__(self, blob_dir: Union[str, Path], lru_size: int = 32):
+        """
+        Initialize blob store
+
+        Args:
+            blob_dir: Directory holding the compressed blobs
+            lru_size: Number of decompressed blobs kept in memory (0 disables)
+        """
+        self.blob_dir = Path(blob_dir)
+        self.lru_size = max(0, lru_size)
+        self._lru: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lru_lock = threading.Lock()
+
+    def _blob_path(self, key: str) -> Path:
+        return self.blob_dir / f"{key}.json.gz"
+
+    def _remember(self, key: str, payload: bytes) -> None:
+        if self.lru_size == 0:
+            return
+        with self._lru_lock:
+            self._lru[key] = payload
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    def _write_sync(self, key: str, content_list: List[Dict[str, Any]]) -> bytes:
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(content_list, ensure_ascii=False).encode("utf-8")
+        # A unique temporary file per write, so concurrent writes of the same
+        # key never share a partially written file
+        with tempfile.NamedTemporaryFile(
+            dir=self.blob_dir, prefix=f"{key}.", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            try:
+                with gzip.GzipFile(
+                    fileobj=tmp, mode="wb", compresslevel=6, filename=""
+                ) as f:
+                    f.write(payload)
+            except BaseException:
+                tmp.close()
+                tmp_path.unlink(missing_ok=True)
+                raise
+        try:
+            os.replace(tmp_path, self._blob_path(key))
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return payload
+
+    def _read_sync(self, key: str) -> Optional[bytes]:
+        path = self._blob_path(key)
+        if not path.exists():
+            return None
+        with gzip.open(path, "rb") as f:
+            return f.read()
+
+    async def put(self, key: str, content_list: List[Dict[str, Any]]) -> None:
+        """Write a content list blob"""
+        payload = await asyncio.to_thread(self._write_sync, key, content_list)
+        self._remember(key, payload)
+
+    async def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Read a content list blob, or None if it does not exist"""
+        with self._lru_lock:
+            payload = self._lru.get(key)
+            if payload is not None:
+                self._lru.move_to_end(key)
+
+        if payload is None:
+            payload = await asyncio.to_thread(self._read_sync, key)
+            if payload is None:
+                return None
+            self._remember(key, payload)
+
+        return json.loads(payload.decode("utf-8"))
+
+    async def delete(self, key: str) -> None:
+        """Delete a content list blob"""
+        with self._lru_lock:
+            self._lru.pop(key, None)
+        await asyncio.to_thread(self._blob_path(key).unlink, missing_ok=True)
+
+    def _clear_sync(self) -> int:
+        if not self.blob_dir.exists():
+            return 0
+        removed = 0
+        for pattern in ("*.json.gz", "*.tmp"):
+            for path in self.blob_dir.glob(pattern):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    async def clear(self) -> int:
+        """
+        Delete all content list blobs
+
+        Returns:
+            int: Number of files removed
+        """
+        with self._lru_lock:
+            self._lru.clear()
+        return await asyncio.to_thread(self._clear_sync)
+
+
+def get_parse_cache_blob_dir(working_dir: str, workspace: str = "") -> Path:
+    """
+    Get the content list blob directory for a working directory and workspace
+
+    Args:
+        working_dir: RAG storage working directory
+        workspace: Optional LightRAG workspace name
+
+    Returns:
+        Path: Directory holding parse cache blobs
+    """
+    base_dir = os.path.join(working_dir, workspace) if workspace else working_dir
+    return Path(base_dir) / "parse_cache_blobs"
@@ -12,15 +12,22 @@ For Office documents (.doc, .docx, .ppt, .pptx), please convert them to PDF form
 from __future__ import annotations
 
 
+import asyncio
 import json
 import argparse
 import base64
+import os
+import re
+import shutil
 import subprocess
 import tempfile
+import threading
 import logging
 from pathlib import Path
 from typing import (
+    Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Union,
@@ -31,6 +38,14 @@ from typing import (
 
 T = TypeVar("T")
 
+# Progress callback signature: (stage, current, total)
+MineruProgressCallback = Callable[[str, int, int], None]
+
+# tqdm progress lines printed by MinerU, e.g. "Layout Predict: 45%|####5  | 9/20 [00:03<00:04]"
+MINERU_PROGRESS_PATTERN = re.compile(
+    r"^(?P<stage>[^|]*?)\s*\d+%\|[^|]*\|\s*(?P<current>\d+)/(?P<total>\d+)"
+)
+
 
 class MineruExecutionError(Exception):
     """catch mineru error"""
@@ -575,17 +590,51 @@ class MineruParser(Parser):
     Note: Office documents are no longer directly supported. Please convert them to PDF first.
     """
 
-    __slots__ = ()
+    __slots__ = ("worker_pool",)
 
     # Class-level logger
     logger = logging.getLogger(__name__)
 
-    def __init__(self) -> None:
-        """Initialize MineruParser"""
+    def __init__(self, worker_pool=None) -> None:
+        """
+        Initialize MineruParser
+
+        Args:
+            worker_pool: Optional MineruWorkerPool; when set, parsing runs on warm
+                worker processes instead of spawning the mineru CLI per document
+        """
         super().__init__()
+        self.worker_pool = worker_pool
+
+    def _execute_mineru(self, **kwargs) -> None:
+        """
+        Run MinerU on the worker pool if one is configured, otherwise via the CLI
+
+        Args:
+            **kwargs: Arguments for _run_mineru_command
+        """
+        if self.worker_pool is not None:
+            # Worker processes do not stream progress back
+            kwargs.pop("progress_callback", None)
+            self.worker_pool.run(**kwargs)
+        else:
+            self._run_mineru_command(**kwargs)
+
+    async def _aexecute_mineru(self, **kwargs) -> None:
+        """
+        Async version of _execute_mineru
+
+        Args:
+            **kwargs: Arguments for _arun_mineru_command
+        """
+        if self.worker_pool is not None:
+            kwargs.pop("progress_callback", None)
+            await asyncio.to_thread(self.worker_pool.run, **kwargs)
+        else:
+            await self._arun_mineru_command(**kwargs)
 
     @staticmethod
-    def _run_mineru_command(
+    def _build_mineru_command(
         input_path: Union[str, Path],
         output_dir: Union[str, Path],
         method: str = "auto",
@@ -598,9 +647,9 @@ class MineruParser(Parser):
         device: Optional[str] = None,
         source: Optional[str] = None,
         vlm_url: Optional[str] = None,
-    ) -> None:
+    ) -> List[str]:
         """
-        Run mineru command line tool
+        Build the mineru command line
 
         Args:
             input_path: Path to input file or directory
@@ -615,6 +664,9 @@ class MineruParser(Parser):
             device: Inference device
             source: Model source
             vlm_url: When the backend is `vlm-sglang-client`, you need to specify the server_url
+
+        Returns:
+            List[str]: Command and arguments
         """
         cmd = [
             "mineru",
@@ -645,14 +697,139 @@ class MineruParser(Parser):
         if vlm_url:
             cmd.extend(["-u", vlm_url])
 
-        output_lines = []
+        return cmd
+
+    @staticmethod
+    def parse_progress_line(line: str) -> Optional[Tuple[str, int, int]]:
+        """
+        Parse a tqdm progress line from MinerU output
+
+        Args:
+            line: Output line, e.g. "Layout Predict: 45%|####5     | 9/20 [00:03<00:04]"
+
+        Returns:
+            Optional[Tuple[str, int, int]]: (stage, current, total), or None if the
+                line is not a progress line
+        """
+        match = MINERU_PROGRESS_PATTERN.search(line)
+        if not match:
+            return None
+        stage = match.group("stage").strip().rstrip(":").strip() or "Processing"
+        return stage, int(match.group("current")), int(match.group("total"))
+
+    @classmethod
+    def _handle_mineru_output_line(
+        cls,
+        line: str,
+        is_stderr: bool,
+        error_lines: List[str],
+        progress_callback: Optional[MineruProgressCallback] = None,
+    ) -> None:
+        """
+        Log one line of mineru output, collect errors, and report progress
+
+        Args:
+            line: Output line (already stripped)
+            is_stderr: Whether the line came from stderr
+            error_lines: List collecting error messages
+            progress_callback: Optional callback receiving (stage, current, total)
+        """
+        progress = cls.parse_progress_line(line)
+        if progress is not None:
+            stage, current, total = progress
+            if progress_callback is not None:
+                try:
+                    progress_callback(stage, current, total)
+                except Exception as e:
+                    logging.debug(f"MinerU progress callback failed: {e}")
+            # tqdm redraws frequently, only log completed stages at INFO
+            if current >= total:
+                logging.info(f"[MinerU] {stage}: {current}/{total}")
+            else:
+                logging.debug(f"[MinerU] {line}")
+            return
+
+        if not is_stderr:
+            # Log mineru output with INFO level, prefixed with [MinerU]
+            logging.info(f"[MinerU] {line}")
+        elif "warning" in line.lower():
+            logging.warning(f"[MinerU] {line}")
+        elif "error" in line.lower():
+            logging.error(f"[MinerU] {line}")
+            error_lines.append(line.split("\n")[0])
+        else:
+            logging.info(f"[MinerU] {line}")
+
+    @staticmethod
+    def _split_output_lines(text: str) -> List[str]:
+        """Split output on both newlines and carriage returns (used by tqdm redraws)"""
+        return [part.strip() for part in re.split(r"[\r\n]+", text) if part.strip()]
+
+    @staticmethod
+    def _split_complete_output(text: str) -> Tuple[str, str]:
+        """Split buffered output into complete lines and a trailing partial line"""
+        last_break = max(text.rfind("\n"), text.rfind("\r"))
+        return text[: last_break + 1], text[last_break + 1 :]
+
+    @classmethod
+    def _run_mineru_command(
+        cls,
+        input_path: Union[str, Path],
+        output_dir: Union[str, Path],
+        method: str = "auto",
+        lang: Optional[str] = None,
+        backend: Optional[str] = None,
+        start_page: Optional[int] = None,
+        end_page: Optional[int] = None,
+        formula: bool = True,
+        table: bool = True,
+        device: Optional[str] = None,
+        source: Optional[str] = None,
+        vlm_url: Optional[str] = None,
+        progress_callback: Optional[MineruProgressCallback] = None,
+    ) -> None:
+        """
+        Run mineru command line tool
+
+        stdout is read on the calling thread and stderr on one helper thread;
+        both log lines as soon as they arrive.
+
+        Args:
+            input_path: Path to input file or directory
+            output_dir: Output directory path
+            method: Parsing method (auto, txt, ocr)
+            lang: Document language for OCR optimization
+            backend: Parsing backend
+            start_page: Starting page number (0-based)
+            end_page: Ending page number (0-based)
+            formula: Enable formula parsing
+            table: Enable table parsing
+            device: Inference device
+            source: Model source
+            vlm_url: When the backend is `vlm-sglang-client`, you need to specify the server_url
+            progress_callback: Optional callback receiving (stage, current, total) page progress
+        """
+        cmd = cls._build_mineru_command(
+            input_path,
+            output_dir,
+            method=method,
+            lang=lang,
+            backend=backend,
+            start_page=start_page,
+            end_page=end_page,
+            formula=formula,
+            table=table,
+            device=device,
+            source=source,
+            vlm_url=vlm_url,
+        )
+
         error_lines = []
 
         try:
             # Prepare subprocess parameters to hide console window on Windows
             import platform
             import threading
-            from queue import Queue, Empty
 
             # Log the command being executed
             logging.info(f"Executing mineru command: {' '.join(cmd)}")
@@ -660,107 +837,41 @@ class MineruParser(Parser):
             subprocess_kwargs = {
                 "stdout": subprocess.PIPE,
                 "stderr": subprocess.PIPE,
-                "text": True,
-                "encoding": "utf-8",
-                "errors": "ignore",
-                "bufsize": 1,  # Line buffered
             }
 
             # Hide console window on Windows
             if platform.system() == "Windows":
                 subprocess_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
 
-            # Function to read output from subprocess and add to queue
-            def enqueue_output(pipe, queue, prefix):
+            def read_stream(pipe, is_stderr):
                 try:
-                    for line in iter(pipe.readline, ""):
-                        if line.strip():  # Only add non-empty lines
-                            queue.put((prefix, line.strip()))
+                    pending = ""
+                    for chunk in iter(lambda: pipe.read1(8192), b""):
+                        pending += chunk.decode("utf-8", errors="ignore")
+                        complete, pending = cls._split_complete_output(pending)
+                        for line in cls._split_output_lines(complete):
+                            cls._handle_mineru_output_line(
+                                line, is_stderr, error_lines, progress_callback
+                            )
+                    for line in cls._split_output_lines(pending):
+                        cls._handle_mineru_output_line(
+                            line, is_stderr, error_lines, progress_callback
+                        )
                     pipe.close()
                 except Exception as e:
-                    queue.put((prefix, f"Error reading {prefix}: {e}"))
+                    logging.warning(f"Error reading mineru output: {e}")
 
             # Start subprocess
             process = subprocess.Popen(cmd, **subprocess_kwargs)
 
-            # Create queues for stdout and stderr
-            stdout_queue = Queue()
-            stderr_queue = Queue()
-
-            # Start threads to read output
-            stdout_thread = threading.Thread(
-                target=enqueue_output, args=(process.stdout, stdout_queue, "STDOUT")
-            )
             stderr_thread = threading.Thread(
-                target=enqueue_output, args=(process.stderr, stderr_queue, "STDERR")
+                target=read_stream, args=(process.stderr, True), daemon=True
             )
-
-            stdout_thread.daemon = True
-            stderr_thread.daemon = True
-            stdout_thread.start()
             stderr_thread.start()
-
-            # Process output in real time
-            while process.poll() is None:
-                # Check stdout queue
-                try:
-                    while True:
-                        prefix, line = stdout_queue.get_nowait()
-                        output_lines.append(line)
-                        # Log mineru output with INFO level, prefixed with [MinerU]
-                        logging.info(f"[MinerU] {line}")
-                except Empty:
-                    pass
-
-                # Check stderr queue
-                try:
-                    while True:
-                        prefix, line = stderr_queue.get_nowait()
-                        # Log mineru errors with WARNING level
-                        if "warning" in line.lower():
-                            logging.warning(f"[MinerU] {line}")
-                        elif "error" in line.lower():
-                            logging.error(f"[MinerU] {line}")
-                            error_message = line.split("\n")[0]
-                            error_lines.append(error_message)
-                        else:
-                            logging.info(f"[MinerU] {line}")
-                except Empty:
-                    pass
-
-                # Small delay to prevent busy waiting
-                import time
-
-                time.sleep(0.1)
-
-            # Process any remaining output after process completion
-            try:
-                while True:
-                    prefix, line = stdout_queue.get_nowait()
-                    output_lines.append(line)
-                    logging.info(f"[MinerU] {line}")
-            except Empty:
-                pass
-
-            try:
-                while True:
-                    prefix, line = stderr_queue.get_nowait()
-                    if "warning" in line.lower():
-                        logging.warning(f"[MinerU] {line}")
-                    elif "error" in line.lower():
-                        logging.error(f"[MinerU] {line}")
-                        error_message = line.split("\n")[0]
-                        error_lines.append(error_message)
-                    else:
-                        logging.info(f"[MinerU] {line}")
-            except Empty:
-                pass
+            read_stream(process.stdout, False)
 
             # Wait for process to complete and get return code
             return_code = process.wait()
-
-            # Wait for threads to finish
-            stdout_thread.join(timeout=5)
             stderr_thread.join(timeout=5)
 
             if return_code != 0 or error_lines:
@@ -786,6 +897,118 @@ class MineruParser(Parser):
             logging.error(error_message)
             raise RuntimeError(error_message) from e
 
+    @classmethod
+    async def _arun_mineru_command(
+        cls,
+        input_path: Union[str, Path],
+        output_dir: Union[str, Path],
+        method: str = "auto",
+        lang: Optional[str] = None,
+        backend: Optional[str] = None,
+        start_page: Optional[int] = None,
+        end_page: Optional[int] = None,
+        formula: bool = True,
+        table: bool = True,
+        device: Optional[str] = None,
+        source: Optional[str] = None,
+        vlm_url: Optional[str] = None,
+        progress_callback: Optional[MineruProgressCallback] = None,
+    ) -> None:
+        """
+        Run mineru command line tool as an asyncio subprocess
+
+        Output is streamed by event loop readers, so no threads are used and
+        lines are handled as soon as they arrive.
+
+        Args:
+            input_path: Path to input file or directory
+            output_dir: Output directory path
+            method: Parsing method (auto, txt, ocr)
+            lang: Document language for OCR optimization
+            backend: Parsing backend
+            start_page: Starting page number (0-based)
+            end_page: Ending page number (0-based)
+            formula: Enable formula parsing
+            table: Enable table parsing
+            device: Inference device
+            source: Model source
+            vlm_url: When the backend is `vlm-sglang-client`, you need to specify the server_url
+            progress_callback: Optional callback receiving (stage, current, total) page progress
+        """
+        cmd = cls._build_mineru_command(
+            input_path,
+            output_dir,
+            method=method,
+            lang=lang,
+            backend=backend,
+            start_page=start_page,
+            end_page=end_page,
+            formula=formula,
+            table=table,
+            device=device,
+            source=source,
+            vlm_url=vlm_url,
+        )
+
+        error_lines = []
+
+        async def read_stream(stream: asyncio.StreamReader, is_stderr: bool):
+            pending = ""
+            while True:
+                chunk = await stream.read(8192)
+                if not chunk:
+                    break
+                pending += chunk.decode("utf-8", errors="ignore")
+                complete, pending = cls._split_complete_output(pending)
+                for line in cls._split_output_lines(complete):
+                    cls._handle_mineru_output_line(
+                        line, is_stderr, error_lines, progress_callback
+                    )
+            for line in cls._split_output_lines(pending):
+                cls._handle_mineru_output_line(
+                    line, is_stderr, error_lines, progress_callback
+                )
+
+        logging.info(f"Executing mineru command: {' '.join(cmd)}")
+
+        subprocess_kwargs = {}
+        import platform
+
+        # Hide console window on Windows
+        if platform.system() == "Windows":
+            subprocess_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **subprocess_kwargs,
+            )
+        except FileNotFoundError:
+            raise RuntimeError(
+                "mineru command not found. Please ensure MinerU 2.0 is properly installed:\n"
+                "pip install -U 'mineru[core]' or uv pip install -U 'mineru[core]'"
+            )
+
+        try:
+            await asyncio.gather(
+                read_stream(process.stdout, False),
+                read_stream(process.stderr, True),
+            )
+            return_code = await process.wait()
+        except asyncio.CancelledError:
+            # Do not leave an orphaned mineru process behind
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+
+        if return_code != 0 or error_lines:
+            logging.info("[MinerU] Command executed failed")
+            raise MineruExecutionError(return_code, error_lines)
+        logging.info("[MinerU] Command executed successfully")
+
     @staticmethod
     def _read_output_files(
         output_dir: Path, file_stem: str, method: str = "auto"
@@ -875,23 +1098,10 @@ class MineruParser(Parser):
             List[Dict[str, Any]]: List of content blocks
         """
         try:
-            # Convert to Path object for easier handling
-            pdf_path = Path(pdf_path)
-            if not pdf_path.exists():
-                raise FileNotFoundError(f"PDF file does not exist: {pdf_path}")
-
-            name_without_suff = pdf_path.stem
-
-            # Prepare output directory
-            if output_dir:
-                base_output_dir = Path(output_dir)
-            else:
-                base_output_dir = pdf_path.parent / "mineru_output"
-
-            base_output_dir.mkdir(parents=True, exist_ok=True)
+            pdf_path, base_output_dir = self._prepare_pdf_parse(pdf_path, output_dir)
 
             # Run mineru command
-            self._run_mineru_command(
+            self._execute_mineru(
                 input_path=pdf_path,
                 output_dir=base_output_dir,
                 method=method,
@@ -900,14 +1110,7 @@ class MineruParser(Parser):
             )
 
             # Read the generated output files
-            backend = kwargs.get("backend", "")
-            if backend.startswith("vlm-"):
-                method = "vlm"
-
-            content_list, _ = self._read_output_files(
-                base_output_dir, name_without_suff, method=method
-            )
-            return content_list
+            return self._read_pdf_output(base_output_dir, pdf_path, method, **kwargs)
 
         except MineruExecutionError:
             raise
@@ -915,183 +1118,519 @@ class MineruParser(Parser):
             logging.error(f"Error in parse_pdf: {str(e)}")
             raise
 
-    def parse_image(
-        self,
-        image_path: Union[str, Path],
-        output_dir: Optional[str] = None,
-        lang: Optional[str] = None,
-        **kwargs,
-    ) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _prepare_pdf_parse(
+        pdf_path: Union[str, Path], output_dir: Optional[str] = None
+    ) -> Tuple[Path, Path]:
         """
-        Parse image document using MinerU 2.0
-
-        Note: MinerU 2.0 natively supports .png, .jpeg, .jpg formats.
-        Other formats (.bmp, .tiff, .tif, etc.) will be automatically converted to .png.
+        Validate the PDF path and create the output directory
 
         Args:
-            image_path: Path to the image file
+            pdf_path: Path to the PDF file
             output_dir: Output directory path
-            lang: Document language for OCR optimization
-            **kwargs: Additional parameters for mineru command
 
         Returns:
-            List[Dict[str, Any]]: List of content blocks
+            Tuple[Path, Path]: (pdf_path, base_output_dir)
         """
-        try:
-            # Convert to Path object for easier handling
-            image_path = Path(image_path)
-            if not image_path.exists():
-                raise FileNotFoundError(f"Image file does not exist: {image_path}")
-
-            # Supported image formats by MinerU 2.0
-            mineru_supported_formats = {".png", ".jpeg", ".jpg"}
-
-            # All supported image formats (including those we can convert)
-            all_supported_formats = {
-                ".png",
-                ".jpeg",
-                ".jpg",
-                ".bmp",
-                ".tiff",
-                ".tif",
-                ".gif",
-                ".webp",
-            }
-
-            ext = image_path.suffix.lower()
-            if ext not in all_supported_formats:
-                raise ValueError(
-                    f"Unsupported image format: {ext}. Supported formats: {', '.join(all_supported_formats)}"
-                )
-
-            # Determine the actual image file to process
-            actual_image_path = image_path
-            temp_converted_file = None
-
-            # If format is not natively supported by MinerU, convert it
-            if ext not in mineru_supported_formats:
-                logging.info(
-                    f"Converting {ext} image to PNG for MinerU compatibility..."
-                )
-
-                try:
-                    from PIL import Image
-                except ImportError:
-                    raise RuntimeError(
-                        "PIL/Pillow is required for image format conversion. "
-                        "Please install it using: pip install Pillow"
-                    )
-
-                # Create temporary directory for conversion
-                temp_dir = Path(tempfile.mkdtemp())
-                temp_converted_file = temp_dir / f"{image_path.stem}_converted.png"
-
-                try:
-                    # Open and convert image
-                    with Image.open(image_path) as img:
-                        # Handle different image modes
-                        if img.mode in ("RGBA", "LA", "P"):
-                            # For images with transparency or palette, convert to RGB first
-                            if img.mode == "P":
-                                img = img.convert("RGBA")
-
-                            # Create white background for transparent images
-                            background = Image.new("RGB", img.size, (255, 255, 255))
-                            if img.mode == "RGBA":
-                                background.paste(
-                                    img, mask=img.split()[-1]
-                                )  # Use alpha channel as mask
-                            else:
-                                background.paste(img)
-                            img = background
-                        elif img.mode not in ("RGB", "L"):
-                            # Convert other modes to RGB
-                            img = img.convert("RGB")
-
-                        # Save as PNG
-                        img.save(temp_converted_file, "PNG", optimize=True)
-                        logging.info(
-                            f"Successfully converted {image_path.name} to PNG ({temp_converted_file.stat().st_size / 1024:.1f} KB)"
-                        )
-
-                        actual_image_path = temp_converted_file
-
-                except Exception as e:
-                    if temp_converted_file and temp_converted_file.exists():
-                        temp_converted_file.unlink()
-                    raise RuntimeError(
-                        f"Failed to convert image {image_path.name}: {str(e)}"
-                    )
-
-            name_without_suff = image_path.stem
-
-            # Prepare output directory
-            if output_dir:
-                base_output_dir = Path(output_dir)
-            else:
-                base_output_dir = image_path.parent / "mineru_output"
-
-            base_output_dir.mkdir(parents=True, exist_ok=True)
-
-            try:
-                # Run mineru command (images are processed with OCR method)
-                self._run_mineru_command(
-                    input_path=actual_image_path,
-                    output_dir=base_output_dir,
-                    method="ocr",  # Images require OCR method
-                    lang=lang,
-                    **kwargs,
-                )
-
-                # Read the generated output files
-                content_list, _ = self._read_output_files(
-                    base_output_dir, name_without_suff, method="ocr"
-                )
-                return content_list
+        # Convert to Path object for easier handling
+        pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file does not exist: {pdf_path}")
+
+        # Prepare output directory
+        if output_dir:
+            base_output_dir = Path(output_dir)
+        else:
+            base_output_dir = pdf_path.parent / "mineru_output"
 
-            except MineruExecutionError:
-                raise
+        base_output_dir.mkdir(parents=True, exist_ok=True)
+        return pdf_path, base_output_dir
 
-            finally:
-                # Clean up temporary converted file if it was created
-                if temp_converted_file and temp_converted_file.exists():
-                    try:
-                        temp_converted_file.unlink()
-                        temp_converted_file.parent.rmdir()  # Remove temp directory if empty
-                    except Exception:
-                        pass  # Ignore cleanup errors
+    @classmethod
+    def _read_pdf_output(
+        cls, base_output_dir: Path, pdf_path: Path, method: str, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Read the content list MinerU generated for a PDF"""
+        backend = kwargs.get("backend") or ""
+        if backend.startswith("vlm-"):
+            method = "vlm"
 
-        except Exception as e:
-            logging.error(f"Error in parse_image: {str(e)}")
-            raise
+        content_list, _ = cls._read_output_files(
+            base_output_dir, pdf_path.stem, method=method
+        )
+        return content_list
 
-    def parse_office_doc(
+    async def aparse_pdf(
         self,
-        doc_path: Union[str, Path],
+        pdf_path: Union[str, Path],
         output_dir: Optional[str] = None,
+        method: str = "auto",
         lang: Optional[str] = None,
         **kwargs,
     ) -> List[Dict[str, Any]]:
         """
-        Parse office document by first converting to PDF, then parsing with MinerU 2.0
-
-        Note: This method requires LibreOffice to be installed separately for PDF conversion.
-        MinerU 2.0 no longer includes built-in Office document conversion.
-
-        Supported formats: .doc, .docx, .ppt, .pptx, .xls, .xlsx
+        Async version of parse_pdf that awaits MinerU without blocking the event loop
 
         Args:
-            doc_path: Path to the document file (.doc, .docx, .ppt, .pptx, .xls, .xlsx)
+            pdf_path: Path to the PDF file
             output_dir: Output directory path
+            method: Parsing method (auto, txt, ocr)
             lang: Document language for OCR optimization
-            **kwargs: Additional parameters for mineru command
+            **kwargs: Additional parameters for mineru command, including
+                progress_callback receiving (stage, current, total)
 
         Returns:
             List[Dict[str, Any]]: List of content blocks
         """
         try:
-            # Convert Office document to PDF using base class method
-            pdf_path = self.convert_office_to_pdf(doc_path, output_dir)
+            pdf_path, base_output_dir = self._prepare_pdf_parse(pdf_path, output_dir)
+
+            await self._aexecute_mineru(
+                input_path=pdf_path,
+                output_dir=base_output_dir,
+                method=method,
+                lang=lang,
+                **kwargs,
+            )
+
+            return await asyncio.to_thread(
+                self._read_pdf_output, base_output_dir, pdf_path, method, **kwargs
+            )
+
+        except MineruExecutionError:
+            raise
+        except Exception as e:
+            logging.error(f"Error in aparse_pdf: {str(e)}")
+            raise
+
+    @staticmethod
+    def estimate_page_count(pdf_path: Union[str, Path]) -> int:
+        """
+        Get the page count of a PDF, estimating from file size if it cannot be read
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            int: Number of pages (at least 1)
+        """
+        try:
+            import pypdfium2
+
+            pdf = pypdfium2.PdfDocument(str(pdf_path))
+            try:
+                return max(1, len(pdf))
+            finally:
+                pdf.close()
+        except Exception:
+            # pypdfium2 not installed or file unreadable: assume ~100 KB per page
+            return max(1, Path(pdf_path).stat().st_size // (100 * 1024))
+
+    @classmethod
+    def plan_pdf_groups(
+        cls,
+        pdf_paths: List[Union[str, Path]],
+        max_files: int = 8,
+        max_pages: int = 200,
+    ) -> List[List[Path]]:
+        """
+        Split PDFs into groups that can be parsed by a single MinerU invocation
+
+        Files are packed in order until a group reaches max_files files or
+        max_pages pages. A PDF that alone reaches max_pages gets its own group so
+        one large document does not hold up many small ones.
+
+        Args:
+            pdf_paths: PDF files to group
+            max_files: Maximum number of files per group
+            max_pages: Maximum total pages per group
+
+        Returns:
+            List[List[Path]]: Groups of PDF paths
+        """
+        groups = []
+        current, current_pages = [], 0
+
+        for pdf_path in map(Path, pdf_paths):
+            pages = cls.estimate_page_count(pdf_path)
+            if pages >= max_pages:
+                groups.append([pdf_path])
+                continue
+            if current and (
+                len(current) >= max_files or current_pages + pages > max_pages
+            ):
+                groups.append(current)
+                current, current_pages = [], 0
+            current.append(pdf_path)
+            current_pages += pages
+
+        if current:
+            groups.append(current)
+        return groups
+
+    def parse_pdf_batch(
+        self,
+        pdf_paths: List[Union[str, Path]],
+        output_dir: Optional[str] = None,
+        method: str = "auto",
+        lang: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Parse several PDFs with a single MinerU invocation
+
+        The PDFs are staged into a temporary input directory and MinerU runs once
+        over it, so model loading is paid once per group. If the grouped run
+        fails, each file is parsed on its own so one bad PDF does not fail the
+        whole group.
+
+        Args:
+            pdf_paths: Paths to the PDF files
+            output_dir: Output directory path
+            method: Parsing method (auto, txt, ocr)
+            lang: Document language for OCR optimization
+            **kwargs: Additional parameters for mineru command
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Content list per input path (as given);
+                files MinerU produced no output for, or that failed to parse
+                individually, are omitted
+        """
+        pdf_paths = [Path(p) for p in pdf_paths]
+        for pdf_path in pdf_paths:
+            if not pdf_path.exists():
+                raise FileNotFoundError(f"PDF file does not exist: {pdf_path}")
+
+        if output_dir:
+            base_output_dir = Path(output_dir)
+        else:
+            base_output_dir = pdf_paths[0].parent / "mineru_output"
+        base_output_dir.mkdir(parents=True, exist_ok=True)
+
+        backend = kwargs.get("backend") or ""
+        read_method = "vlm" if backend.startswith("vlm-") else method
+        results = {}
+
+        with tempfile.TemporaryDirectory(prefix="mineru_group_") as staging_dir:
+            staging_dir = Path(staging_dir)
+            staged_stems = {}
+            used_stems = set()
+            for pdf_path in pdf_paths:
+                # MinerU names outputs after the file stem, keep stems unique
+                stem = pdf_path.stem
+                suffix = 1
+                while stem in used_stems:
+                    stem = f"{pdf_path.stem}_{suffix}"
+                    suffix += 1
+                used_stems.add(stem)
+                staged_path = staging_dir / f"{stem}.pdf"
+                try:
+                    os.link(pdf_path, staged_path)
+                except OSError:
+                    shutil.copyfile(pdf_path, staged_path)
+                staged_stems[pdf_path] = stem
+
+            # MinerU writes into a fresh directory, so output left in
+            # base_output_dir by earlier runs is never mistaken for this run's
+            group_output_dir = Path(
+                tempfile.mkdtemp(prefix=".mineru_group_", dir=base_output_dir)
+            )
+            try:
+                try:
+                    logging.info(
+                        f"Parsing {len(pdf_paths)} PDFs with a single MinerU invocation"
+                    )
+                    self._execute_mineru(
+                        input_path=staging_dir,
+                        output_dir=group_output_dir,
+                        method=method,
+                        lang=lang,
+                        **kwargs,
+                    )
+                except Exception as e:
+                    logging.warning(
+                        f"Grouped MinerU run failed ({e}), parsing files individually"
+                    )
+                    for pdf_path in pdf_paths:
+                        try:
+                            results[str(pdf_path)] = self.parse_pdf(
+                                pdf_path, output_dir, method, lang, **kwargs
+                            )
+                        except Exception as file_error:
+                            logging.error(f"Error parsing {pdf_path}: {file_error}")
+                    return results
+
+                for pdf_path, stem in staged_stems.items():
+                    file_output_dir = group_output_dir / stem
+                    if not file_output_dir.is_dir():
+                        # MinerU skipped the file without failing the group
+                        logging.error(
+                            f"Error parsing {pdf_path}: MinerU produced no output"
+                        )
+                        continue
+                    # Move the output where an individual parse would put it
+                    target_dir = base_output_dir / stem
+                    if target_dir.exists():
+                        shutil.rmtree(target_dir)
+                    os.replace(file_output_dir, target_dir)
+                    content_list, _ = self._read_output_files(
+                        base_output_dir, stem, method=read_method
+                    )
+                    results[str(pdf_path)] = content_list
+            finally:
+                shutil.rmtree(group_output_dir, ignore_errors=True)
+        return results
+
+    def parse_image(
+        self,
+        image_path: Union[str, Path],
+        output_dir: Optional[str] = None,
+        lang: Optional[str] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse image document using MinerU 2.0
+
+        Note: MinerU 2.0 natively supports .png, .jpeg, .jpg formats.
+        Other formats (.bmp, .tiff, .tif, etc.) will be automatically converted to .png.
+
+        Args:
+            image_path: Path to the image file
+            output_dir: Output directory path
+            lang: Document language for OCR optimization
+            **kwargs: Additional parameters for mineru command
+
+        Returns:
+            List[Dict[str, Any]]: List of content blocks
+        """
+        try:
+            image_path, actual_image_path, temp_converted_file, base_output_dir = (
+                self._prepare_image_parse(image_path, output_dir)
+            )
+
+            try:
+                # Run mineru command (images are processed with OCR method)
+                self._execute_mineru(
+                    input_path=actual_image_path,
+                    output_dir=base_output_dir,
+                    method="ocr",  # Images require OCR method
+                    lang=lang,
+                    **kwargs,
+                )
+
+                # Read the generated output files
+                content_list, _ = self._read_output_files(
+                    base_output_dir, image_path.stem, method="ocr"
+                )
+                return content_list
+
+            finally:
+                self._cleanup_converted_image(temp_converted_file)
+
+        except Exception as e:
+            logging.error(f"Error in parse_image: {str(e)}")
+            raise
+
+    @staticmethod
+    def _prepare_image_parse(
+        image_path: Union[str, Path], output_dir: Optional[str] = None
+    ) -> Tuple[Path, Path, Optional[Path], Path]:
+        """
+        Validate an image, convert it to PNG if MinerU cannot read it, and create the output directory
+
+        Args:
+            image_path: Path to the image file
+            output_dir: Output directory path
+
+        Returns:
+            Tuple of (image_path, image path to pass to MinerU, temporary
+            converted file or None, base_output_dir)
+        """
+        # Convert to Path object for easier handling
+        image_path = Path(image_path)
+        if not image_path.exists():
+            raise FileNotFoundError(f"Image file does not exist: {image_path}")
+
+        # Supported image formats by MinerU 2.0
+        mineru_supported_formats = {".png", ".jpeg", ".jpg"}
+
+        # All supported image formats (including those we can convert)
+        all_supported_formats = {
+            ".png",
+            ".jpeg",
+            ".jpg",
+            ".bmp",
+            ".tiff",
+            ".tif",
+            ".gif",
+            ".webp",
+        }
+
+        ext = image_path.suffix.lower()
+        if ext not in all_supported_formats:
+            raise ValueError(
+                f"Unsupported image format: {ext}. Supported formats: {', '.join(all_supported_formats)}"
+            )
+
+        # Determine the actual image file to process
+        actual_image_path = image_path
+        temp_converted_file = None
+
+        # If format is not natively supported by MinerU, convert it
+        if ext not in mineru_supported_formats:
+            logging.info(f"Converting {ext} image to PNG for MinerU compatibility...")
+
+            try:
+                from PIL import Image
+            except ImportError:
+                raise RuntimeError(
+                    "PIL/Pillow is required for image format conversion. "
+                    "Please install it using: pip install Pillow"
+                )
+
+            # Create temporary directory for conversion
+            temp_dir = Path(tempfile.mkdtemp())
+            temp_converted_file = temp_dir / f"{image_path.stem}_converted.png"
+
+            try:
+                # Open and convert image
+                with Image.open(image_path) as img:
+                    # Handle different image modes
+                    if img.mode in ("RGBA", "LA", "P"):
+                        # For images with transparency or palette, convert to RGB first
+                        if img.mode == "P":
+                            img = img.convert("RGBA")
+
+                        # Create white background for transparent images
+                        background = Image.new("RGB", img.size, (255, 255, 255))
+                        if img.mode == "RGBA":
+                            background.paste(
+                                img, mask=img.split()[-1]
+                            )  # Use alpha channel as mask
+                        else:
+                            background.paste(img)
+                        img = background
+                    elif img.mode not in ("RGB", "L"):
+                        # Convert other modes to RGB
+                        img = img.convert("RGB")
+
+                    # Save as PNG
+                    img.save(temp_converted_file, "PNG", optimize=True)
+                    logging.info(
+                        f"Successfully converted {image_path.name} to PNG ({temp_converted_file.stat().st_size / 1024:.1f} KB)"
+                    )
+
+                    actual_image_path = temp_converted_file
+
+            except Exception as e:
+                if temp_converted_file and temp_converted_file.exists():
+                    temp_converted_file.unlink()
+                raise RuntimeError(
+                    f"Failed to convert image {image_path.name}: {str(e)}"
+                )
+
+        # Prepare output directory
+        if output_dir:
+            base_output_dir = Path(output_dir)
+        else:
+            base_output_dir = image_path.parent / "mineru_output"
+
+        base_output_dir.mkdir(parents=True, exist_ok=True)
+        return image_path, actual_image_path, temp_converted_file, base_output_dir
+
+    @staticmethod
+    def _cleanup_converted_image(temp_converted_file: Optional[Path]) -> None:
+        """Remove a temporary PNG created by _prepare_image_parse"""
+        # Clean up temporary converted file if it was created
+        if temp_converted_file and temp_converted_file.exists():
+            try:
+                temp_converted_file.unlink()
+                temp_converted_file.parent.rmdir()  # Remove temp directory if empty
+            except Exception:
+                pass  # Ignore cleanup errors
+
+    async def aparse_image(
+        self,
+        image_path: Union[str, Path],
+        output_dir: Optional[str] = None,
+        lang: Optional[str] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of parse_image that awaits MinerU without blocking the event loop
+
+        Args:
+            image_path: Path to the image file
+            output_dir: Output directory path
+            lang: Document language for OCR optimization
+            **kwargs: Additional parameters for mineru command, including
+                progress_callback receiving (stage, current, total)
+
+        Returns:
+            List[Dict[str, Any]]: List of content blocks
+        """
+        try:
+            # Format conversion uses PIL, keep it off the event loop
+            (
+                image_path,
+                actual_image_path,
+                temp_converted_file,
+                base_output_dir,
+            ) = await asyncio.to_thread(
+                self._prepare_image_parse, image_path, output_dir
+            )
+
+            try:
+                await self._aexecute_mineru(
+                    input_path=actual_image_path,
+                    output_dir=base_output_dir,
+                    method="ocr",  # Images require OCR method
+                    lang=lang,
+                    **kwargs,
+                )
+
+                content_list, _ = await asyncio.to_thread(
+                    self._read_output_files,
+                    base_output_dir,
+                    image_path.stem,
+                    method="ocr",
+                )
+                return content_list
+
+            finally:
+                self._cleanup_converted_image(temp_converted_file)
+
+        except Exception as e:
+            logging.error(f"Error in aparse_image: {str(e)}")
+            raise
+
+    def parse_office_doc(
+        self,
+        doc_path: Union[str, Path],
+        output_dir: Optional[str] = None,
+        lang: Optional[str] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse office document by first converting to PDF, then parsing with MinerU 2.0
+
+        Note: This method requires LibreOffice to be installed separately for PDF conversion.
+        MinerU 2.0 no longer includes built-in Office document conversion.
+
+        Supported formats: .doc, .docx, .ppt, .pptx, .xls, .xlsx
+
+        Args:
+            doc_path: Path to the document file (.doc, .docx, .ppt, .pptx, .xls, .xlsx)
+            output_dir: Output directory path
+            lang: Document language for OCR optimization
+            **kwargs: Additional parameters for mineru command
+
+        Returns:
+            List[Dict[str, Any]]: List of content blocks
+        """
+        try:
+            # Convert Office document to PDF using base class method
+            pdf_path = self.convert_office_to_pdf(doc_path, output_dir)
 
             # Parse the converted PDF
             return self.parse_pdf(
@@ -1186,6 +1725,109 @@ class MineruParser(Parser):
             )
             return self.parse_pdf(file_path, output_dir, method, lang, **kwargs)
 
+    async def aparse_office_doc(
+        self,
+        doc_path: Union[str, Path],
+        output_dir: Optional[str] = None,
+        lang: Optional[str] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of parse_office_doc
+
+        Args:
+            doc_path: Path to the document file (.doc, .docx, .ppt, .pptx, .xls, .xlsx)
+            output_dir: Output directory path
+            lang: Document language for OCR optimization
+            **kwargs: Additional parameters for mineru command
+
+        Returns:
+            List[Dict[str, Any]]: List of content blocks
+        """
+        try:
+            # LibreOffice conversion is blocking, run it in a thread
+            pdf_path = await asyncio.to_thread(
+                self.convert_office_to_pdf, doc_path, output_dir
+            )
+            return await self.aparse_pdf(
+                pdf_path=pdf_path, output_dir=output_dir, lang=lang, **kwargs
+            )
+
+        except Exception as e:
+            logging.error(f"Error in aparse_office_doc: {str(e)}")
+            raise
+
+    async def aparse_text_file(
+        self,
+        text_path: Union[str, Path],
+        output_dir: Optional[str] = None,
+        lang: Optional[str] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of parse_text_file
+
+        Args:
+            text_path: Path to the text file (.txt, .md)
+            output_dir: Output directory path
+            lang: Document language for OCR optimization
+            **kwargs: Additional parameters for mineru command
+
+        Returns:
+            List[Dict[str, Any]]: List of content blocks
+        """
+        try:
+            pdf_path = await asyncio.to_thread(
+                self.convert_text_to_pdf, text_path, output_dir
+            )
+            return await self.aparse_pdf(
+                pdf_path=pdf_path, output_dir=output_dir, lang=lang, **kwargs
+            )
+
+        except Exception as e:
+            logging.error(f"Error in aparse_text_file: {str(e)}")
+            raise
+
+    async def aparse_document(
+        self,
+        file_path: Union[str, Path],
+        method: str = "auto",
+        output_dir: Optional[str] = None,
+        lang: Optional[str] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of parse_document
+
+        Args:
+            file_path: Path to the file to be parsed
+            method: Parsing method (auto, txt, ocr)
+            output_dir: Output directory path
+            lang: Document language for OCR optimization
+            **kwargs: Additional parameters for mineru command
+
+        Returns:
+            List[Dict[str, Any]]: List of content blocks
+        """
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"File does not exist: {file_path}")
+
+        ext = file_path.suffix.lower()
+        if ext in self.IMAGE_FORMATS:
+            return await self.aparse_image(file_path, output_dir, lang, **kwargs)
+        elif ext in self.OFFICE_FORMATS:
+            return await self.aparse_office_doc(file_path, output_dir, lang, **kwargs)
+        elif ext in self.TEXT_FORMATS:
+            return await self.aparse_text_file(file_path, output_dir, lang, **kwargs)
+        else:
+            if ext != ".pdf":
+                logging.warning(
+                    f"Warning: Unsupported file extension '{ext}', "
+                    f"attempting to parse as PDF"
+                )
+            return await self.aparse_pdf(file_path, output_dir, method, lang, **kwargs)
+
     def check_installation(self) -> bool:
         """
         Check if MinerU 2.0 is properly installed
@@ -1220,6 +1862,47 @@ class MineruParser(Parser):
             return False
 
 
+_docling_converter = None
+_docling_converter_lock = threading.Lock()
+_docling_convert_lock = threading.Lock()
+
+
+def get_docling_converter():
+    """
+    Get the process-wide Docling DocumentConverter, creating it on first use
+
+    Docling loads its layout, OCR and table models when a converter first
+    handles a format, so keeping one converter per process lets every later
+    document skip model loading. Picture images are generated so they can be
+    embedded in the exports, matching the docling command line defaults.
+
+    Returns:
+        DocumentConverter: Shared converter for the current process
+    """
+    global _docling_converter
+    with _docling_converter_lock:
+        if _docling_converter is None:
+            from docling.datamodel.base_models import InputFormat
+            from docling.datamodel.pipeline_options import PdfPipelineOptions
+            from docling.document_converter import (
+                DocumentConverter,
+                PdfFormatOption,
+            )
+
+            pipeline_options = PdfPipelineOptions()
+            pipeline_options.generate_picture_images = True
+            pipeline_options.images_scale = 2.0
+            _docling_converter = DocumentConverter(
+                format_options={
+                    InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+                }
+            )
+            logging.info(
+                f"Initialized in-process Docling converter (pid {os.getpid()})"
+            )
+        return _docling_converter
+
+
 class DoclingParser(Parser):
     """
     Docling document parsing utility class.
@@ -1228,12 +1911,24 @@ class DoclingParser(Parser):
     into structured data and generating markdown and JSON output.
     """
 
+    __slots__ = ("inprocess",)
+
     # Define Docling-specific formats
     HTML_FORMATS = {".html", ".htm", ".xhtml"}
 
-    def __init__(self) -> None:
-        """Initialize DoclingParser"""
+    # Docling document item arrays referenced from the body tree
+    ITEM_SECTIONS = ("texts", "groups", "pictures", "tables")
+
+    def __init__(self, inprocess: bool = False) -> None:
+        """
+        Initialize DoclingParser
+
+        Args:
+            inprocess: Convert documents with a DocumentConverter kept in the
+                current process instead of running the docling CLI per document
+        """
         super().__init__()
+        self.inprocess = inprocess
 
     def parse_pdf(
         self,
@@ -1272,8 +1967,8 @@ class DoclingParser(Parser):
 
             base_output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Run docling command
-            self._run_docling_command(
+            # Convert document with docling
+            self._convert_document(
                 input_path=pdf_path,
                 output_dir=base_output_dir,
                 file_stem=name_without_suff,
@@ -1281,9 +1976,7 @@ class DoclingParser(Parser):
             )
 
             # Read the generated output files
-            content_list, _ = self._read_output_files(
-                base_output_dir, name_without_suff
-            )
+            content_list = self._read_output_files(base_output_dir, name_without_suff)
             return content_list
 
         except Exception as e:
@@ -1333,6 +2026,65 @@ class DoclingParser(Parser):
                 f"and HTML formats ({', '.join(self.HTML_FORMATS)})"
             )
 
+    def _convert_document(
+        self,
+        input_path: Union[str, Path],
+        output_dir: Union[str, Path],
+        file_stem: str,
+        **kwargs,
+    ) -> None:
+        """
+        Convert a document to JSON and Markdown under output_dir/file_stem/docling
+
+        Args:
+            input_path: Path to input file
+            output_dir: Output directory path
+            file_stem: File stem for creating subdirectory
+            **kwargs: Additional parameters for docling command
+        """
+        if self.inprocess:
+            self._convert_in_process(input_path, output_dir, file_stem)
+        else:
+            self._run_docling_command(input_path, output_dir, file_stem, **kwargs)
+
+    def _convert_in_process(
+        self,
+        input_path: Union[str, Path],
+        output_dir: Union[str, Path],
+        file_stem: str,
+    ) -> None:
+        """
+        Convert a document with the process-wide DocumentConverter
+
+        Writes the same JSON and Markdown files as the docling command line
+        tool. Pictures are embedded in the JSON, which the content list is
+        built from, and replaced by placeholders in the Markdown.
+
+        Args:
+            input_path: Path to input file
+            output_dir: Output directory path
+            file_stem: File stem for creating subdirectory
+        """
+        from docling_core.types.doc import ImageRefMode
+
+        file_output_dir = Path(output_dir) / file_stem / "docling"
+        file_output_dir.mkdir(parents=True, exist_ok=True)
+
+        converter = get_docling_converter()
+        # Conversions share the converter's models; CPU parallelism comes from
+        # running one converter per worker process
+        with _docling_convert_lock:
+            result = converter.convert(str(input_path))
+
+        document = result.document
+        document.save_as_json(
+            file_output_dir / f"{file_stem}.json", image_mode=ImageRefMode.EMBEDDED
+        )
+        document.save_as_markdown(
+            file_output_dir / f"{file_stem}.md", image_mode=ImageRefMode.PLACEHOLDER
+        )
+        logging.info(f"Docling converted {input_path} in process")
+
     def _run_docling_command(
         self,
         input_path: Union[str, Path],
@@ -1343,6 +2095,9 @@ class DoclingParser(Parser):
         """
         Run docling command line tool
 
+        A single run converts the document once and writes both the JSON and
+        Markdown exports.
+
         Args:
             input_path: Path to input file or directory
             output_dir: Output directory path
@@ -1353,18 +2108,12 @@ class DoclingParser(Parser):
         file_output_dir = Path(output_dir) / file_stem / "docling"
         file_output_dir.mkdir(parents=True, exist_ok=True)
 
-        cmd_json = [
+        cmd = [
             "docling",
             "--output",
             str(file_output_dir),
             "--to",
             "json",
-            str(input_path),
-        ]
-        cmd_md = [
-            "docling",
-            "--output",
-            str(file_output_dir),
             "--to",
             "md",
             str(input_path),
@@ -1386,13 +2135,10 @@ class DoclingParser(Parser):
             if platform.system() == "Windows":
                 docling_subprocess_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
 
-            result_json = subprocess.run(cmd_json, **docling_subprocess_kwargs)
-            result_md = subprocess.run(cmd_md, **docling_subprocess_kwargs)
+            result = subprocess.run(cmd, **docling_subprocess_kwargs)
             logging.info("Docling command executed successfully")
-            if result_json.stdout:
-                logging.debug(f"JSON cmd output: {result_json.stdout}")
-            if result_md.stdout:
-                logging.debug(f"Markdown cmd output: {result_md.stdout}")
+            if result.stdout:
+                logging.debug(f"Docling cmd output: {result.stdout}")
         except subprocess.CalledProcessError as e:
             logging.error(f"Error running docling command: {e}")
             if e.stderr:
@@ -1407,39 +2153,32 @@ class DoclingParser(Parser):
         self,
         output_dir: Path,
         file_stem: str,
-    ) -> Tuple[List[Dict[str, Any]], str]:
+    ) -> List[Dict[str, Any]]:
         """
-        Read the output files generated by docling and convert to MinerU format
+        Read the JSON output generated by docling and convert to MinerU format
+
+        The Markdown export is left on disk and not read: the command line
+        tool embeds every picture in it as base64.
 
         Args:
             output_dir: Output directory
             file_stem: File name without extension
 
         Returns:
-            Tuple containing (content list JSON, Markdown text)
+            List[Dict[str, Any]]: Content list
         """
         # Use subdirectory structure similar to MinerU
         file_subdir = output_dir / file_stem / "docling"
-        md_file = file_subdir / f"{file_stem}.md"
         json_file = file_subdir / f"{file_stem}.json"
 
-        # Read markdown content
-        md_content = ""
-        if md_file.exists():
-            try:
-                with open(md_file, "r", encoding="utf-8") as f:
-                    md_content = f.read()
-            except Exception as e:
-                logging.warning(f"Could not read markdown file {md_file}: {e}")
-
         # Read JSON content and convert format
         content_list = []
         if json_file.exists():
             try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    docling_content = json.load(f)
-                    # Convert docling format to minerU format
-                    content_list = self.read_from_block_recursive(
+                docling_content = self._load_docling_document(json_file, file_subdir)
+                # Convert docling format to minerU format
+                content_list = list(
+                    self.iter_content_blocks(
                         docling_content["body"],
                         "body",
                         file_subdir,
@@ -1447,11 +2186,118 @@ class DoclingParser(Parser):
                         "0",
                         docling_content,
                     )
+                )
             except Exception as e:
                 logging.warning(f"Could not read or convert JSON file {json_file}: {e}")
-        return content_list, md_content
+        return content_list
 
-    def read_from_block_recursive(
+    def _load_docling_document(
+        self, json_file: Path, output_dir: Path
+    ) -> Dict[str, Any]:
+        """
+        Load the parts of a Docling JSON document needed for conversion
+
+        Keeps the body tree, the item arrays it references and the page sizes.
+        Picture images are decoded and written to disk as soon as each picture
+        is read, and their base64 data is dropped, so at most one image is held
+        in memory. With ijson installed the file is streamed; otherwise it is
+        loaded with json and pruned as pictures are written.
+
+        Args:
+            json_file: Docling JSON export
+            output_dir: Docling output subdirectory (images are written below it)
+
+        Returns:
+            Dict[str, Any]: Pruned Docling document
+        """
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+
+        if ijson is None:
+            with open(json_file, "r", encoding="utf-8") as f:
+                docling_content = json.load(f)
+            for index, picture in enumerate(docling_content.get("pictures", [])):
+                self._store_picture(picture, index, output_dir)
+            docling_content["pages"] = {
+                page_no: {"size": page.get("size")}
+                for page_no, page in docling_content.get("pages", {}).items()
+            }
+            return docling_content
+
+        docling_content = {"body": {}, "pages": {}}
+        for section in self.ITEM_SECTIONS:
+            docling_content[section] = []
+
+        builder, target, depth = None, None, 0
+        with open(json_file, "rb") as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if builder is None:
+                    if event != "start_map":
+                        continue
+                    target = self._stream_target(prefix)
+                    if target is None:
+                        continue
+                    builder = ijson.ObjectBuilder()
+
+                builder.event(event, value)
+                if event in ("start_map", "start_array"):
+                    depth += 1
+                elif event in ("end_map", "end_array"):
+                    depth -= 1
+                if depth:
+                    continue
+
+                section, page_no = target
+                item = builder.value
+                builder = None
+                if section == "body":
+                    docling_content["body"] = item
+                elif section == "pages":
+                    docling_content["pages"][page_no] = {"size": item}
+                else:
+                    if section == "pictures":
+                        self._store_picture(
+                            item, len(docling_content["pictures"]), output_dir
+                        )
+                    docling_content[section].append(item)
+        return docling_content
+
+    def _stream_target(self, prefix: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Map an ijson prefix of an object start to the part of the document it holds"""
+        if prefix == "body":
+            return "body", None
+        section, _, rest = prefix.partition(".")
+        if section in self.ITEM_SECTIONS and rest == "item":
+            return section, None
+        if section == "pages" and rest.count(".") == 1 and rest.endswith(".size"):
+            return "pages", rest[: -len(".size")]
+        return None
+
+    def _write_picture(self, block: Dict[str, Any], num: str, output_dir: Path) -> str:
+        """Decode a picture's base64 data URI to images/image_{num}.png"""
+        base64_uri = block["image"]["uri"]
+        base64_str = base64_uri.split(",")[1]
+        # Create images directory within the docling subdirectory
+        image_dir = output_dir / "images"
+        image_dir.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
+        image_path = image_dir / f"image_{num}.png"
+        with open(image_path, "wb") as f:
+            f.write(base64.b64decode(base64_str))
+        return str(image_path.resolve())  # Convert to absolute path
+
+    def _store_picture(
+        self, block: Dict[str, Any], index: int, output_dir: Path
+    ) -> None:
+        """Write a picture to disk and replace its image data with the file path"""
+        try:
+            block["img_path"] = self._write_picture(block, str(index), output_dir)
+        except Exception as e:
+            block["img_error"] = str(e)
+        block.pop("image", None)
+
+    def iter_content_blocks(
         self,
         block,
         type: str,
@@ -1459,38 +2305,120 @@ class DoclingParser(Parser):
         cnt: int,
         num: str,
         docling_content: Dict[str, Any],
-    ) -> List[Dict[str, Any]]:
-        content_list = []
-        if not block.get("children"):
-            cnt += 1
-            content_list.append(self.read_from_block(block, type, output_dir, cnt, num))
-        else:
-            if type not in ["groups", "body"]:
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Walk a Docling block tree depth-first and yield content_list entries
+
+        Uses an explicit stack, so deeply nested groups cannot exhaust the
+        recursion limit. Blocks are yielded in document order.
+
+        Args:
+            block: Root block (usually the document body)
+            type: Item section of the root block ("body", "groups", "texts", ...)
+            output_dir: Docling output subdirectory
+            cnt: Traversal counter used to estimate pages without provenance
+            num: Index of the root block within its section
+            docling_content: Docling document holding the referenced items
+
+        Yields:
+            Dict[str, Any]: Content blocks in MinerU format
+        """
+        pages = docling_content.get("pages")
+        stack = [(block, type, cnt, num)]
+        while stack:
+            block, type, cnt, num = stack.pop()
+            children = block.get("children")
+            if not children or type not in ("groups", "body"):
                 cnt += 1
-                content_list.append(
-                    self.read_from_block(block, type, output_dir, cnt, num)
-                )
-            members = block["children"]
-            for member in members:
+                yield self.read_from_block(block, type, output_dir, cnt, num, pages)
+                if not children:
+                    continue
+
+            members = []
+            for member in children:
                 cnt += 1
-                member_tag = member["$ref"]
-                member_type = member_tag.split("/")[1]
-                member_num = member_tag.split("/")[2]
+                _, member_type, member_num = member["$ref"].split("/")
                 member_block = docling_content[member_type][int(member_num)]
-                content_list.extend(
-                    self.read_from_block_recursive(
-                        member_block,
-                        member_type,
-                        output_dir,
-                        cnt,
-                        member_num,
-                        docling_content,
-                    )
-                )
-        return content_list
+                members.append((member_block, member_type, cnt, member_num))
+            # Push in reverse so the first child is processed next
+            stack.extend(reversed(members))
+
+    def read_from_block_recursive(
+        self,
+        block,
+        type: str,
+        output_dir: Path,
+        cnt: int,
+        num: str,
+        docling_content: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        return list(
+            self.iter_content_blocks(block, type, output_dir, cnt, num, docling_content)
+        )
+
+    @staticmethod
+    def _block_location(
+        block: Dict[str, Any], pages: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[int], Optional[List[float]]]:
+        """
+        Get page index and bounding box from a block's Docling provenance
+
+        Bounding boxes follow the MinerU content_list convention: [x0, y0, x1, y1]
+        with a top-left origin, scaled to 0-1000 of the page width and height.
+
+        Args:
+            block: Docling text, picture or table item
+            pages: Docling "pages" mapping of page number to page size
+
+        Returns:
+            Tuple of (0-based page index, bounding box); either is None when the
+            block has no provenance (e.g. Office and HTML documents)
+        """
+        prov = block.get("prov") or []
+        if not prov or prov[0].get("page_no") is None:
+            return None, None
+
+        page_no = prov[0]["page_no"]
+        page_idx = max(0, page_no - 1)
+
+        box = prov[0].get("bbox")
+        size = ((pages or {}).get(str(page_no)) or {}).get("size") or {}
+        width, height = size.get("width"), size.get("height")
+        if not box or not width or not height:
+            return page_idx, None
+
+        left, top, right, bottom = box["l"], box["t"], box["r"], box["b"]
+        if box.get("coord_origin", "TOPLEFT") == "BOTTOMLEFT":
+            top, bottom = height - top, height - bottom
+        bbox = [
+            round(min(left, right) / width * 1000, 2),
+            round(min(top, bottom) / height * 1000, 2),
+            round(max(left, right) / width * 1000, 2),
+            round(max(top, bottom) / height * 1000, 2),
+        ]
+        return page_idx, bbox
 
     def read_from_block(
-        self, block, type: str, output_dir: Path, cnt: int, num: str
+        self,
+        block,
+        type: str,
+        output_dir: Path,
+        cnt: int,
+        num: str,
+        pages: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        page_idx, bbox = self._block_location(block, pages)
+        if page_idx is None:
+            # No provenance: approximate the page from the traversal position
+            page_idx = cnt // 10
+
+        content = self._convert_block(block, type, output_dir, num, page_idx)
+        if bbox is not None:
+            content["bbox"] = bbox
+        return content
+
+    def _convert_block(
+        self, block, type: str, output_dir: Path, num: str, page_idx: int
     ) -> Dict[str, Any]:
         if type == "texts":
             if block["label"] == "formula":
@@ -1499,37 +2427,34 @@ class DoclingParser(Parser):
                     "img_path": "",
                     "text": block["orig"],
                     "text_format": "unkown",
-                    "page_idx": cnt // 10,
+                    "page_idx": page_idx,
                 }
             else:
                 return {
                     "type": "text",
                     "text": block["orig"],
-                    "page_idx": cnt // 10,
+                    "page_idx": page_idx,
                 }
         elif type == "pictures":
             try:
-                base64_uri = block["image"]["uri"]
-                base64_str = base64_uri.split(",")[1]
-                # Create images directory within the docling subdirectory
-                image_dir = output_dir / "images"
-                image_dir.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
-                image_path = image_dir / f"image_{num}.png"
-                with open(image_path, "wb") as f:
-                    f.write(base64.b64decode(base64_str))
+                image_path = block.get("img_path")
+                if image_path is None:
+                    if "img_error" in block:
+                        raise ValueError(block["img_error"])
+                    image_path = self._write_picture(block, num, output_dir)
                 return {
                     "type": "image",
-                    "img_path": str(image_path.resolve()),  # Convert to absolute path
+                    "img_path": image_path,
                     "image_caption": block.get("caption", ""),
                     "image_footnote": block.get("footnote", ""),
-                    "page_idx": cnt // 10,
+                    "page_idx": page_idx,
                 }
             except Exception as e:
                 logging.warning(f"Failed to process image {num}: {e}")
                 return {
                     "type": "text",
                     "text": f"[Image processing failed: {block.get('caption', '')}]",
-                    "page_idx": cnt // 10,
+                    "page_idx": page_idx,
                 }
         else:
             try:
@@ -1539,14 +2464,14 @@ class DoclingParser(Parser):
                     "table_caption": block.get("caption", ""),
                     "table_footnote": block.get("footnote", ""),
                     "table_body": block.get("data", []),
-                    "page_idx": cnt // 10,
+                    "page_idx": page_idx,
                 }
             except Exception as e:
                 logging.warning(f"Failed to process table {num}: {e}")
                 return {
                     "type": "text",
                     "text": f"[Table processing failed: {block.get('caption', '')}]",
-                    "page_idx": cnt // 10,
+                    "page_idx": page_idx,
                 }
 
     def parse_office_doc(
@@ -1589,8 +2514,8 @@ class DoclingParser(Parser):
 
             base_output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Run docling command
-            self._run_docling_command(
+            # Convert document with docling
+            self._convert_document(
                 input_path=doc_path,
                 output_dir=base_output_dir,
                 file_stem=name_without_suff,
@@ -1598,9 +2523,7 @@ class DoclingParser(Parser):
             )
 
             # Read the generated output files
-            content_list, _ = self._read_output_files(
-                base_output_dir, name_without_suff
-            )
+            content_list = self._read_output_files(base_output_dir, name_without_suff)
             return content_list
 
         except Exception as e:
@@ -1647,8 +2570,8 @@ class DoclingParser(Parser):
 
             base_output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Run docling command
-            self._run_docling_command(
+            # Convert document with docling
+            self._convert_document(
                 input_path=html_path,
                 output_dir=base_output_dir,
                 file_stem=name_without_suff,
@@ -1656,9 +2579,7 @@ class DoclingParser(Parser):
             )
 
             # Read the generated output files
-            content_list, _ = self._read_output_files(
-                base_output_dir, name_without_suff
-            )
+            content_list = self._read_output_files(base_output_dir, name_without_suff)
             return content_list
 
         except Exception as e:
@@ -1672,6 +2593,15 @@ class DoclingParser(Parser):
         Returns:
             bool: True if installation is valid, False otherwise
         """
+        if self.inprocess:
+            try:
+                import docling.document_converter  # noqa: F401
+
+                return True
+            except ImportError:
+                logging.debug("Docling Python package is not installed.")
+                return False
+
         try:
             # Prepare subprocess parameters to hide console window on Windows
             import platform
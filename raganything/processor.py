@@ -8,67 +8,280 @@ import os
 import time
 import hashlib
 import json
-from typing import Dict, List, Any, Tuple, Optional
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Any, Tuple, Optional
 from pathlib import Path
 
 from raganything.base import DocStatus
+from raganything.image_filter import (
+    TrivialImageConfig,
+    classify_trivial_image,
+    has_image_context,
+)
+from raganything.modalprocessors import DocumentContext
+from raganything.prompt import PROMPTS
+from raganything.scheduler import PRIORITY_BULK, model_call_context
 from raganything.parser import MineruParser, DoclingParser, MineruExecutionError
 from raganything.utils import (
+    compute_file_content_hash,
     separate_content,
     insert_text_content,
     insert_text_content_with_multimodal_content,
     get_processor_for_type,
 )
 import asyncio
+from lightrag.base import BaseGraphStorage
+from lightrag.constants import GRAPH_FIELD_SEP
+from lightrag.kg.shared_storage import get_storage_keyed_lock
 from lightrag.utils import compute_mdhash_id
 
+# Parser kwargs that change the parse output and therefore the parse cache entry
+PARSE_CACHE_RELEVANT_KWARGS = [
+    "lang",
+    "device",
+    "start_page",
+    "end_page",
+    "formula",
+    "table",
+    "backend",
+    "source",
+]
+
+
+@dataclass
+class MultimodalChunkRecord:
+    """Described multimodal item, formatted and hashed once for all storage stages"""
+
+    __slots__ = (
+        "content_type",
+        "description",
+        "entity_info",
+        "chunk_order_index",
+        "page_idx",
+        "file_path",
+        "content",
+        "chunk_id",
+        "tokens",
+    )
+
+    content_type: str
+    description: str
+    entity_info: Dict[str, Any]
+    chunk_order_index: int
+    page_idx: int
+    file_path: str
+    content: str
+    """Chunk content rendered with the content type's template."""
+    chunk_id: str
+    tokens: int
+
+
+# Parse cache entries are content-addressed starting from version 2.0
+PARSE_CACHE_VERSION = "2.0"
+
+# Key prefix for (size, mtime, inode) -> content hash entries in the parse cache
+FINGERPRINT_KEY_PREFIX = "fingerprint:"
+
 
 class ProcessorMixin:
     """ProcessorMixin class containing document processing functionality for RAGAnything"""
 
-    def _generate_cache_key(
-        self, file_path: Path, parse_method: str = None, **kwargs
-    ) -> str:
+    def _get_doc_parser(self):
+        """
+        Get the document parser for the configured parser type
+
+        Reuses the instance's parser (and its MinerU worker pool, if any) and only
+        creates a new one when config.parser has changed since it was built.
+
+        Returns:
+            MineruParser or DoclingParser instance
         """
-        Generate cache key based on file path and parsing configuration
+        expected_type = (
+            DoclingParser if self.config.parser == "docling" else MineruParser
+        )
+        if not isinstance(getattr(self, "doc_parser", None), expected_type):
+            self.doc_parser = self._create_doc_parser()
+        return self.doc_parser
+
+    async def _call_doc_parser(
+        self,
+        doc_parser,
+        method_name: str,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Call a parser method, awaiting its async variant when the parser has one
+
+        Parsers with async methods (aparse_pdf, aparse_image, ...) run their
+        subprocess on the event loop; others run in a worker thread.
 
         Args:
-            file_path: Path to the file
-            parse_method: Parse method used
-            **kwargs: Additional parser parameters
+            doc_parser: Parser instance
+            method_name: Name of the sync parser method, e.g. "parse_pdf"
+            progress_callback: Optional callback receiving (stage, current, total)
+            **kwargs: Arguments for the parser method
 
         Returns:
-            str: Cache key for the file and configuration
+            List[Dict[str, Any]]: Parsed content list
         """
+        async_method = getattr(doc_parser, f"a{method_name}", None)
+        if async_method is not None:
+            return await async_method(progress_callback=progress_callback, **kwargs)
+        return await asyncio.to_thread(getattr(doc_parser, method_name), **kwargs)
 
-        # Get file modification time
-        mtime = file_path.stat().st_mtime
+    def _build_parse_config(self, parse_method: str = None, **kwargs) -> Dict[str, Any]:
+        """
+        Build the parsing configuration that a cached parse result depends on
 
-        # Create configuration dict for cache key
-        config_dict = {
-            "file_path": str(file_path.absolute()),
-            "mtime": mtime,
+        Args:
+            parse_method: Parse method used
+            **kwargs: Additional parser parameters
+
+        Returns:
+            Dict[str, Any]: Parser name, parse method and relevant parser kwargs
+        """
+        parse_config = {
             "parser": self.config.parser,
             "parse_method": parse_method or self.config.parse_method,
         }
 
         # Add relevant kwargs to config
-        relevant_kwargs = {
-            k: v
-            for k, v in kwargs.items()
-            if k
-            in [
-                "lang",
-                "device",
-                "start_page",
-                "end_page",
-                "formula",
-                "table",
-                "backend",
-                "source",
-            ]
+        parse_config.update(
+            {k: v for k, v in kwargs.items() if k in PARSE_CACHE_RELEVANT_KWARGS}
+        )
+        return parse_config
+
+    def _record_parse_cache_event(self, event: str) -> None:
+        """Increment a parse cache counter (hits, misses, fingerprint_hits, files_hashed)"""
+        self.parse_cache_stats[event] = self.parse_cache_stats.get(event, 0) + 1
+
+    def get_parse_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get parse cache counters for this instance
+
+        Returns:
+            Dict with hit/miss counts, hit rate, and how many content hashes were
+            served from the (size, mtime, inode) fast path versus recomputed
+        """
+        hits = self.parse_cache_stats.get("hits", 0)
+        misses = self.parse_cache_stats.get("misses", 0)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "fingerprint_hits": self.parse_cache_stats.get("fingerprint_hits", 0),
+            "files_hashed": self.parse_cache_stats.get("files_hashed", 0),
+        }
+
+    def get_description_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get description cache counters for this instance
+
+        Returns:
+            Dict keyed by modality with hit/miss counts and hit rate (empty
+            when the description cache is disabled)
+        """
+        if getattr(self, "description_cache", None) is None:
+            return {}
+        return self.description_cache.get_stats()
+
+    async def _flush_description_cache(self) -> None:
+        """Persist description cache entries written while processing a document"""
+        if getattr(self, "description_cache", None) is None:
+            return
+        await self.description_cache.flush()
+        for modality, stats in self.description_cache.get_stats().items():
+            self.logger.debug(
+                f"Description cache {modality}: {stats['hits']} hits, "
+                f"{stats['misses']} misses ({stats['hit_rate']:.0%})"
+            )
+
+    async def _get_file_content_hash(self, file_path: Path) -> str:
+        """
+        Get the content hash of a file, reusing a previous hash when possible
+
+        A (size, mtime, inode) fingerprint of the file is checked against the
+        fingerprint index first; the file bytes are only streamed through the hash
+        function when the fingerprint is unknown or has changed.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            str: Content hash of the file
+        """
+        stat = file_path.stat()
+        abs_path = str(file_path.absolute())
+        fingerprint = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "inode": stat.st_ino,
         }
-        config_dict.update(relevant_kwargs)
+        index_key = (
+            f"{FINGERPRINT_KEY_PREFIX}{hashlib.md5(abs_path.encode()).hexdigest()}"
+        )
+
+        entry = self._file_fingerprint_index.get(abs_path)
+        if entry is None and self.parse_cache is not None:
+            try:
+                entry = await self.parse_cache.get_by_id(index_key)
+            except Exception as e:
+                self.logger.debug(f"Error reading file fingerprint index: {e}")
+
+        if (
+            entry
+            and entry.get("content_hash")
+            and all(entry.get(k) == v for k, v in fingerprint.items())
+        ):
+            self._file_fingerprint_index[abs_path] = entry
+            self._record_parse_cache_event("fingerprint_hits")
+            return entry["content_hash"]
+
+        # Fingerprint unknown or stale: hash file contents off the event loop
+        content_hash = await asyncio.to_thread(compute_file_content_hash, file_path)
+        self._record_parse_cache_event("files_hashed")
+
+        entry = {**fingerprint, "content_hash": content_hash, "file_path": abs_path}
+        self._file_fingerprint_index[abs_path] = entry
+        if self.parse_cache is not None:
+            try:
+                # Persisted together with the next parse cache flush
+                await self.parse_cache.upsert({index_key: entry})
+            except Exception as e:
+                self.logger.debug(f"Error updating file fingerprint index: {e}")
+
+        return content_hash
+
+    def _generate_cache_key(
+        self,
+        file_path: Path,
+        parse_method: str = None,
+        content_hash: str = None,
+        **kwargs,
+    ) -> str:
+        """
+        Generate content-addressed cache key based on file contents and parsing configuration
+
+        The key does not depend on the file's path or modification time, so identical
+        files uploaded under different names or copied between hosts share one entry.
+
+        Args:
+            file_path: Path to the file
+            parse_method: Parse method used
+            content_hash: Precomputed content hash of the file (computed if not given)
+            **kwargs: Additional parser parameters
+
+        Returns:
+            str: Cache key for the file and configuration
+        """
+        if content_hash is None:
+            content_hash = compute_file_content_hash(file_path)
+
+        # Create configuration dict for cache key
+        config_dict = {"content_hash": content_hash}
+        config_dict.update(self._build_parse_config(parse_method, **kwargs))
 
         # Generate hash from config
         config_str = json.dumps(config_dict, sort_keys=True)
@@ -122,8 +335,8 @@ class ProcessorMixin:
         Get cached parsing result if available and valid
 
         Args:
-            cache_key: Cache key to look up
-            file_path: Path to the file for mtime check
+            cache_key: Content-addressed cache key to look up
+            file_path: Path to the file being parsed
             parse_method: Parse method used
             **kwargs: Additional parser parameters
 
@@ -138,45 +351,29 @@ class ProcessorMixin:
             if not cached_data:
                 return None
 
-            # Check file modification time
-            current_mtime = file_path.stat().st_mtime
-            cached_mtime = cached_data.get("mtime", 0)
-
-            if current_mtime != cached_mtime:
-                self.logger.debug(f"Cache invalid - file modified: {cache_key}")
-                return None
-
             # Check parsing configuration
             cached_config = cached_data.get("parse_config", {})
-            current_config = {
-                "parser": self.config.parser,
-                "parse_method": parse_method or self.config.parse_method,
-            }
-
-            # Add relevant kwargs to current config
-            relevant_kwargs = {
-                k: v
-                for k, v in kwargs.items()
-                if k
-                in [
-                    "lang",
-                    "device",
-                    "start_page",
-                    "end_page",
-                    "formula",
-                    "table",
-                    "backend",
-                    "source",
-                ]
-            }
-            current_config.update(relevant_kwargs)
+            current_config = self._build_parse_config(parse_method, **kwargs)
 
             if cached_config != current_config:
                 self.logger.debug(f"Cache invalid - config changed: {cache_key}")
                 return None
 
-            content_list = cached_data.get("content_list", [])
             doc_id = cached_data.get("doc_id")
+            blob_key = cached_data.get("content_list_blob")
+            blob_store = getattr(self, "parse_cache_blobs", None)
+
+            if blob_key is not None:
+                # Content list is stored out of line, load it on demand
+                if blob_store is None:
+                    self.logger.debug(
+                        f"Cache entry stored out of line but blob store is disabled: {cache_key}"
+                    )
+                    return None
+                content_list = await blob_store.get(blob_key) or []
+            else:
+                # Entries written before out-of-line storage keep content inline
+                content_list = cached_data.get("content_list", [])
 
             if content_list and doc_id:
                 self.logger.debug(
@@ -201,6 +398,7 @@ class ProcessorMixin:
         doc_id: str,
         file_path: Path,
         parse_method: str = None,
+        content_hash: str = None,
         **kwargs,
     ) -> None:
         """
@@ -210,53 +408,35 @@ class ProcessorMixin:
             cache_key: Cache key to store under
             content_list: Content list to cache
             doc_id: Content-based document ID
-            file_path: Path to the file for mtime storage
+            file_path: Path to the parsed file
             parse_method: Parse method used
+            content_hash: Content hash of the parsed file
             **kwargs: Additional parser parameters
         """
         if not hasattr(self, "parse_cache") or self.parse_cache is None:
             return
 
         try:
-            # Get file modification time
-            file_mtime = file_path.stat().st_mtime
-
-            # Create parsing configuration
-            parse_config = {
-                "parser": self.config.parser,
-                "parse_method": parse_method or self.config.parse_method,
+            cache_entry = {
+                "doc_id": doc_id,
+                "content_hash": content_hash,
+                "source_file": file_path.name,
+                "parse_config": self._build_parse_config(parse_method, **kwargs),
+                "cached_at": time.time(),
+                "cache_version": PARSE_CACHE_VERSION,
             }
 
-            # Add relevant kwargs to config
-            relevant_kwargs = {
-                k: v
-                for k, v in kwargs.items()
-                if k
-                in [
-                    "lang",
-                    "device",
-                    "start_page",
-                    "end_page",
-                    "formula",
-                    "table",
-                    "backend",
-                    "source",
-                ]
-            }
-            parse_config.update(relevant_kwargs)
-
-            cache_data = {
-                cache_key: {
-                    "content_list": content_list,
-                    "doc_id": doc_id,
-                    "mtime": file_mtime,
-                    "parse_config": parse_config,
-                    "cached_at": time.time(),
-                    "cache_version": "1.0",
-                }
-            }
-            await self.parse_cache.upsert(cache_data)
-            # Ensure data is persisted to disk
+            blob_store = getattr(self, "parse_cache_blobs", None)
+            if blob_store is not None:
+                # Keep the cache entry small; the content list goes to a compressed blob
+                await blob_store.put(cache_key, content_list)
+                cache_entry["content_list_blob"] = cache_key
+                cache_entry["content_list_count"] = len(content_list)
+            else:
+                cache_entry["content_list"] = content_list
+
+            await self.parse_cache.upsert({cache_key: cache_entry})
+            # Flush to disk (the SQLite backend batches these into periodic checkpoints)
             await self.parse_cache.index_done_callback()
             self.logger.info(f"Stored parsing result in cache: {cache_key}")
         except Exception as e:
@@ -278,7 +458,8 @@ class ProcessorMixin:
             output_dir: Output directory (defaults to config.parser_output_dir)
             parse_method: Parse method (defaults to config.parse_method)
             display_stats: Whether to display content statistics (defaults to config.display_content_stats)
-            **kwargs: Additional parameters for parser (e.g., lang, device, start_page, end_page, formula, table, backend, source)
+            **kwargs: Additional parameters for parser (e.g., lang, device, start_page, end_page, formula, table, backend, source),
+                plus optional progress_callback receiving (stage, current, total) page progress from MinerU
 
         Returns:
             tuple[List[Dict[str, Any]], str]: (content_list, doc_id)
@@ -297,14 +478,20 @@ class ProcessorMixin:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Generate cache key based on file and configuration
-        cache_key = self._generate_cache_key(file_path, parse_method, **kwargs)
+        # Generate content-addressed cache key based on file bytes and configuration
+        content_hash = await self._get_file_content_hash(file_path)
+        cache_key = self._generate_cache_key(
+            file_path, parse_method, content_hash=content_hash, **kwargs
+        )
 
         # Check cache first
         cached_result = await self._get_cached_result(
             cache_key, file_path, parse_method, **kwargs
         )
-        if cached_result is not None:
+        if cached_result is None:
+            self._record_parse_cache_event("misses")
+        else:
+            self._record_parse_cache_event("hits")
             content_list, doc_id = cached_result
             self.logger.info(f"Using cached parsing result for: {file_path}")
             if display_stats:
@@ -313,13 +500,14 @@ class ProcessorMixin:
                 )
             return content_list, doc_id
 
+        # Progress reporting is not a parser option, keep it out of parser kwargs
+        progress_callback = kwargs.pop("progress_callback", None)
+
         # Choose appropriate parsing method based on file extension
         ext = file_path.suffix.lower()
 
         try:
-            doc_parser = (
-                DoclingParser() if self.config.parser == "docling" else MineruParser()
-            )
+            doc_parser = self._get_doc_parser()
 
             # Log parser and method information
             self.logger.info(
@@ -328,8 +516,10 @@ class ProcessorMixin:
 
             if ext in [".pdf"]:
                 self.logger.info("Detected PDF file, using parser for PDF...")
-                content_list = await asyncio.to_thread(
-                    doc_parser.parse_pdf,
+                content_list = await self._call_doc_parser(
+                    doc_parser,
+                    "parse_pdf",
+                    progress_callback,
                     pdf_path=file_path,
                     output_dir=output_dir,
                     method=parse_method,
@@ -348,8 +538,10 @@ class ProcessorMixin:
                 self.logger.info("Detected image file, using parser for images...")
                 # Use the selected parser's image parsing capability
                 if hasattr(doc_parser, "parse_image"):
-                    content_list = await asyncio.to_thread(
-                        doc_parser.parse_image,
+                    content_list = await self._call_doc_parser(
+                        doc_parser,
+                        "parse_image",
+                        progress_callback,
                         image_path=file_path,
                         output_dir=output_dir,
                         **kwargs,
@@ -376,8 +568,10 @@ class ProcessorMixin:
                 self.logger.info(
                     "Detected Office or HTML document, using parser for Office/HTML..."
                 )
-                content_list = await asyncio.to_thread(
-                    doc_parser.parse_office_doc,
+                content_list = await self._call_doc_parser(
+                    doc_parser,
+                    "parse_office_doc",
+                    progress_callback,
                     doc_path=file_path,
                     output_dir=output_dir,
                     **kwargs,
@@ -387,8 +581,10 @@ class ProcessorMixin:
                 self.logger.info(
                     f"Using generic parser for {ext} file (method={parse_method})..."
                 )
-                content_list = await asyncio.to_thread(
-                    doc_parser.parse_document,
+                content_list = await self._call_doc_parser(
+                    doc_parser,
+                    "parse_document",
+                    progress_callback,
                     file_path=file_path,
                     method=parse_method,
                     output_dir=output_dir,
@@ -415,7 +611,13 @@ class ProcessorMixin:
 
         # Store result in cache
         await self._store_cached_result(
-            cache_key, content_list, doc_id, file_path, parse_method, **kwargs
+            cache_key,
+            content_list,
+            doc_id,
+            file_path,
+            parse_method,
+            content_hash=content_hash,
+            **kwargs,
         )
 
         # Display content statistics if requested
@@ -444,6 +646,7 @@ class ProcessorMixin:
         doc_id: str,
         pipeline_status: Optional[Any] = None,
         pipeline_status_lock: Optional[Any] = None,
+        document_context: Optional[DocumentContext] = None,
     ):
         """
         Process multimodal content (using specialized processors)
@@ -454,6 +657,7 @@ class ProcessorMixin:
             doc_id: Document ID for proper chunk association
             pipeline_status: Pipeline status object
             pipeline_status_lock: Pipeline status lock
+            document_context: Per-document context source for context extraction
         """
 
         if not multimodal_items:
@@ -493,6 +697,14 @@ class ProcessorMixin:
             self.logger.debug(f"Error checking document status for {doc_id}: {e}")
             # Continue with processing if cache check fails
 
+        # Classify trivial images (icons, separators, blank crops) before the VLM stage
+        (
+            multimodal_items,
+            trivial_images,
+            trivial_count,
+        ) = await self._filter_trivial_images(multimodal_items)
+        status_updates = {"trivial_images_filtered": trivial_count}
+
         # Use ProcessorMixin's own batch processing that can handle multiple content types
         log_message = "Starting multimodal content processing..."
         self.logger.info(log_message)
@@ -506,11 +718,15 @@ class ProcessorMixin:
             await self._ensure_lightrag_initialized()
 
             await self._process_multimodal_content_batch_type_aware(
-                multimodal_items=multimodal_items, file_path=file_path, doc_id=doc_id
+                multimodal_items=multimodal_items,
+                file_path=file_path,
+                doc_id=doc_id,
+                document_context=document_context,
+                trivial_images=trivial_images,
             )
 
             # Mark multimodal content as processed and update final status
-            await self._mark_multimodal_processing_complete(doc_id)
+            await self._mark_multimodal_processing_complete(doc_id, status_updates)
 
             log_message = "Multimodal content processing complete"
             self.logger.info(log_message)
@@ -521,17 +737,110 @@ class ProcessorMixin:
 
         except Exception as e:
             self.logger.error(f"Error in multimodal processing: {e}")
-            # Fallback to individual processing if batch processing fails
+            # Fallback to individual processing if batch processing fails;
+            # trivial images are not sent to the model here either
             self.logger.warning("Falling back to individual multimodal processing")
             await self._process_multimodal_content_individual(
-                multimodal_items, file_path, doc_id
+                [
+                    item
+                    for i, item in enumerate(multimodal_items)
+                    if i not in trivial_images
+                ],
+                file_path,
+                doc_id,
+                document_context,
             )
 
             # Mark multimodal content as processed even after fallback
-            await self._mark_multimodal_processing_complete(doc_id)
+            await self._mark_multimodal_processing_complete(doc_id, status_updates)
+
+    async def _filter_trivial_images(
+        self, multimodal_items: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Dict[int, str], int]:
+        """
+        Classify trivial images ahead of the vision model stage
+
+        Args:
+            multimodal_items: List of multimodal items
+
+        Returns:
+            Tuple of (items to process, {index in items: reason} for trivial
+            images that get a template description, number of trivial images)
+        """
+        config = getattr(self, "config", None)
+        if config is None or not config.enable_trivial_image_filter:
+            return multimodal_items, {}, 0
+
+        # Captioned or footnoted images are always described
+        image_indices = [
+            i
+            for i, item in enumerate(multimodal_items)
+            if item.get("type") == "image"
+            and item.get("img_path")
+            and not has_image_context(item)
+        ]
+        if not image_indices:
+            return multimodal_items, {}, 0
+
+        filter_config = TrivialImageConfig(
+            min_file_bytes=config.trivial_image_min_bytes,
+            min_dimension=config.trivial_image_min_dimension,
+            min_thickness=config.trivial_image_min_thickness,
+            max_color_stddev=config.trivial_image_max_color_stddev,
+            min_ink_ratio=config.trivial_image_min_ink_ratio,
+        )
+        reasons = await asyncio.gather(
+            *[
+                asyncio.to_thread(
+                    classify_trivial_image,
+                    multimodal_items[i]["img_path"],
+                    filter_config,
+                )
+                for i in image_indices
+            ]
+        )
+        trivial = {
+            i: reason for i, reason in zip(image_indices, reasons) if reason is not None
+        }
+        if not trivial:
+            return multimodal_items, {}, 0
+
+        self.logger.info(
+            f"Filtered {len(trivial)}/{len(image_indices)} trivial images "
+            f"(action: {config.trivial_image_action})"
+        )
+
+        if config.trivial_image_action == "template":
+            return multimodal_items, trivial, len(trivial)
+
+        if config.trivial_image_action != "skip":
+            self.logger.warning(
+                f"Unknown trivial image action '{config.trivial_image_action}', "
+                "skipping trivial images"
+            )
+        kept = [item for i, item in enumerate(multimodal_items) if i not in trivial]
+        return kept, {}, len(trivial)
+
+    def _trivial_image_description(
+        self, item: Dict[str, Any], reason: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the template description and entity for a trivial image"""
+        description = PROMPTS["trivial_image_description"].format(
+            reason=reason.replace("_", " ")
+        )
+        entity_info = {
+            "entity_name": f"image_{compute_mdhash_id(str(item))}",
+            "entity_type": "image",
+            "summary": description,
+        }
+        return description, entity_info
 
     async def _process_multimodal_content_individual(
-        self, multimodal_items: List[Dict[str, Any]], file_path: str, doc_id: str
+        self,
+        multimodal_items: List[Dict[str, Any]],
+        file_path: str,
+        doc_id: str,
+        document_context: Optional[DocumentContext] = None,
     ):
         """
         Process multimodal content individually (fallback method)
@@ -540,6 +849,7 @@ class ProcessorMixin:
             multimodal_items: List of multimodal items
             file_path: File path (for reference)
             doc_id: Document ID for proper chunk association
+            document_context: Per-document context source for context extraction
         """
         file_name = os.path.basename(file_path)
 
@@ -585,6 +895,7 @@ class ProcessorMixin:
                         doc_id=doc_id,  # Pass doc_id for proper association
                         chunk_order_index=existing_chunks_count
                         + i,  # Proper order index
+                        document_context=document_context,
                     )
 
                     # Collect chunk results for batch processing
@@ -608,6 +919,8 @@ class ProcessorMixin:
                 self.logger.debug("Exception details:", exc_info=True)
                 continue
 
+        await self._flush_description_cache()
+
         # Update doc_status to include multimodal chunks in the standard chunks_list
         if multimodal_chunk_ids:
             try:
@@ -685,7 +998,12 @@ class ProcessorMixin:
         await self._mark_multimodal_processing_complete(doc_id)
 
     async def _process_multimodal_content_batch_type_aware(
-        self, multimodal_items: List[Dict[str, Any]], file_path: str, doc_id: str
+        self,
+        multimodal_items: List[Dict[str, Any]],
+        file_path: str,
+        doc_id: str,
+        document_context: Optional[DocumentContext] = None,
+        trivial_images: Optional[Dict[int, str]] = None,
     ):
         """
         Type-aware batch processing that selects correct processors based on content type.
@@ -695,6 +1013,9 @@ class ProcessorMixin:
             multimodal_items: List of multimodal items with different types
             file_path: File path for citation
             doc_id: Document ID for proper association
+            document_context: Per-document context source for context extraction
+            trivial_images: {item index: reason} for images that get a template
+                description instead of a model call
         """
         if not multimodal_items:
             self.logger.debug("No multimodal content to process")
@@ -709,13 +1030,16 @@ class ProcessorMixin:
         except Exception:
             existing_chunks_count = 0
 
-        # Use LightRAG's concurrency control
+        # Use LightRAG's concurrency control per document; when enabled, the
+        # shared scheduler also caps model calls across all documents
         semaphore = asyncio.Semaphore(getattr(self.lightrag, "max_parallel_insert", 2))
 
         # Progress tracking variables
         total_items = len(multimodal_items)
         completed_count = 0
+        reused_count = 0
         progress_lock = asyncio.Lock()
+        modal_dedup = getattr(self, "modal_dedup", None)
 
         # Log processing start
         self.logger.info(f"Starting to process {total_items} multimodal content items")
@@ -725,111 +1049,131 @@ class ProcessorMixin:
             item: Dict[str, Any], index: int, file_path: str
         ):
             """Process single item using the correct processor for its type"""
-            nonlocal completed_count
-            async with semaphore:
-                try:
-                    content_type = item.get("type", "unknown")
+            nonlocal completed_count, reused_count
+            try:
+                content_type = item.get("type", "unknown")
 
-                    # Select the correct processor based on content type
-                    processor = get_processor_for_type(
-                        self.modal_processors, content_type
-                    )
+                # Select the correct processor based on content type
+                processor = get_processor_for_type(self.modal_processors, content_type)
 
-                    if not processor:
-                        self.logger.warning(
-                            f"No processor found for type: {content_type}"
-                        )
-                        return None
+                if not processor:
+                    self.logger.warning(f"No processor found for type: {content_type}")
+                    return None
 
-                    item_info = {
-                        "page_idx": item.get("page_idx", 0),
-                        "index": index,
-                        "type": content_type,
-                    }
+                item_info = {
+                    "page_idx": item.get("page_idx", 0),
+                    "index": index,
+                    "type": content_type,
+                }
 
-                    # Call the correct processor's description generation method
+                # Call the correct processor's description generation method;
+                # only the model call holds a slot, so occurrences waiting for
+                # a repeated item's representative do not block other items
+                async def generate_description():
+                    async with semaphore:
+                        return await processor.generate_description_only(
+                            modal_content=item,
+                            content_type=content_type,
+                            item_info=item_info,
+                            entity_name=None,  # Let LLM auto-generate
+                            document_context=document_context,
+                        )
+
+                trivial_reason = trivial_images.get(index) if trivial_images else None
+                if trivial_reason is not None:
+                    description, entity_info = self._trivial_image_description(
+                        item, trivial_reason
+                    )
+                elif modal_dedup is not None:
+                    # Repeated images/tables reuse one representative's description
                     (
                         description,
                         entity_info,
-                    ) = await processor.generate_description_only(
-                        modal_content=item,
-                        content_type=content_type,
-                        item_info=item_info,
-                        entity_name=None,  # Let LLM auto-generate
-                    )
+                        reused,
+                    ) = await modal_dedup.describe(item, generate_description)
+                    if reused:
+                        async with progress_lock:
+                            reused_count += 1
+                else:
+                    description, entity_info = await generate_description()
+
+                # Update progress (non-blocking)
+                async with progress_lock:
+                    completed_count += 1
+                    if (
+                        completed_count % max(1, total_items // 10) == 0
+                        or completed_count == total_items
+                    ):
+                        progress_percent = (completed_count / total_items) * 100
+                        self.logger.info(
+                            f"Multimodal chunk generation progress: {completed_count}/{total_items} ({progress_percent:.1f}%)"
+                        )
 
-                    # Update progress (non-blocking)
-                    async with progress_lock:
-                        completed_count += 1
-                        if (
-                            completed_count % max(1, total_items // 10) == 0
-                            or completed_count == total_items
-                        ):
-                            progress_percent = (completed_count / total_items) * 100
-                            self.logger.info(
-                                f"Multimodal chunk generation progress: {completed_count}/{total_items} ({progress_percent:.1f}%)"
-                            )
-
-                    return {
-                        "index": index,
-                        "content_type": content_type,
-                        "description": description,
-                        "entity_info": entity_info,
-                        "original_item": item,
-                        "item_info": item_info,
-                        "chunk_order_index": existing_chunks_count + index,
-                        "processor": processor,  # Keep reference to the processor used
-                        "file_path": file_path,  # Add file_path to the result
-                    }
+                return self._build_multimodal_chunk_record(
+                    item,
+                    content_type,
+                    description,
+                    entity_info,
+                    chunk_order_index=existing_chunks_count + index,
+                    file_path=file_path,
+                )
 
-                except Exception as e:
-                    # Update progress even on error (non-blocking)
-                    async with progress_lock:
-                        completed_count += 1
-                        if (
-                            completed_count % max(1, total_items // 10) == 0
-                            or completed_count == total_items
-                        ):
-                            progress_percent = (completed_count / total_items) * 100
-                            self.logger.info(
-                                f"Multimodal chunk generation progress: {completed_count}/{total_items} ({progress_percent:.1f}%)"
-                            )
+            except Exception as e:
+                # Update progress even on error (non-blocking)
+                async with progress_lock:
+                    completed_count += 1
+                    if (
+                        completed_count % max(1, total_items // 10) == 0
+                        or completed_count == total_items
+                    ):
+                        progress_percent = (completed_count / total_items) * 100
+                        self.logger.info(
+                            f"Multimodal chunk generation progress: {completed_count}/{total_items} ({progress_percent:.1f}%)"
+                        )
 
-                    self.logger.error(
-                        f"Error generating description for {content_type} item {index}: {e}"
-                    )
-                    return None
+                self.logger.error(
+                    f"Error generating description for {content_type} item {index}: {e}"
+                )
+                return None
 
-        # Process all items concurrently with correct processors
-        tasks = [
-            asyncio.create_task(
-                process_single_item_with_correct_processor(item, i, file_path)
-            )
-            for i, item in enumerate(multimodal_items)
-        ]
+        # Process all items concurrently with correct processors; tasks inherit
+        # this document as the owner of their scheduled model calls
+        with model_call_context(owner=doc_id, priority=PRIORITY_BULK):
+            tasks = [
+                asyncio.create_task(
+                    process_single_item_with_correct_processor(item, i, file_path)
+                )
+                for i, item in enumerate(multimodal_items)
+            ]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Filter successful results
-        multimodal_data_list = []
+        records: List[MultimodalChunkRecord] = []
         for result in results:
             if isinstance(result, Exception):
                 self.logger.error(f"Task failed: {result}")
                 continue
             if result is not None:
-                multimodal_data_list.append(result)
+                records.append(result)
+
+        await self._flush_description_cache()
 
-        if not multimodal_data_list:
+        if not records:
             self.logger.warning("No valid multimodal descriptions generated")
             return
 
         self.logger.info(
-            f"Generated descriptions for {len(multimodal_data_list)}/{len(multimodal_items)} multimodal items using correct processors"
+            f"Generated descriptions for {len(records)}/{len(multimodal_items)} multimodal items using correct processors"
         )
+        if reused_count:
+            self.logger.info(
+                f"Reused descriptions of repeated content for {reused_count} items"
+            )
 
         # Stage 2: Convert to LightRAG chunks format
         lightrag_chunks = self._convert_to_lightrag_chunks_type_aware(
-            multimodal_data_list, file_path, doc_id
+            records, file_path, doc_id
         )
 
         # Stage 3: Store chunks to LightRAG storage
@@ -837,7 +1181,7 @@ class ProcessorMixin:
 
         # Stage 3.5: Store multimodal main entities to entities_vdb and full_entities
         await self._store_multimodal_main_entities(
-            multimodal_data_list, lightrag_chunks, file_path, doc_id
+            records, lightrag_chunks, file_path, doc_id
         )
 
         # Track chunk IDs for doc_status update
@@ -850,7 +1194,7 @@ class ProcessorMixin:
 
         # Stage 5: Add belongs_to relations (multimodal-specific)
         enhanced_chunk_results = await self._batch_add_belongs_to_relations_type_aware(
-            chunk_results, multimodal_data_list
+            chunk_results, records
         )
 
         # Stage 6: Use LightRAG's batch merge
@@ -861,44 +1205,71 @@ class ProcessorMixin:
         # Stage 7: Update doc_status with integrated chunks_list
         await self._update_doc_status_with_chunks_type_aware(doc_id, chunk_ids)
 
-    def _convert_to_lightrag_chunks_type_aware(
-        self, multimodal_data_list: List[Dict[str, Any]], file_path: str, doc_id: str
-    ) -> Dict[str, Any]:
-        """Convert multimodal data to LightRAG standard chunks format"""
+    def _build_multimodal_chunk_record(
+        self,
+        item: Dict[str, Any],
+        content_type: str,
+        description: str,
+        entity_info: Dict[str, Any],
+        chunk_order_index: int,
+        file_path: str,
+    ) -> MultimodalChunkRecord:
+        """
+        Render, hash and count the chunk of a described multimodal item
 
-        chunks = {}
+        Args:
+            item: Original multimodal item
+            content_type: Type of content (image, table, equation, generic)
+            description: Enhanced description generated by the processor
+            entity_info: Entity info generated by the processor
+            chunk_order_index: Order of the chunk within the document
+            file_path: File path for citation
 
-        for data in multimodal_data_list:
-            description = data["description"]
-            entity_info = data["entity_info"]
-            chunk_order_index = data["chunk_order_index"]
-            content_type = data["content_type"]
-            original_item = data["original_item"]
+        Returns:
+            MultimodalChunkRecord: Record used by every later storage stage
+        """
+        content = self._apply_chunk_template(content_type, item, description)
+        return MultimodalChunkRecord(
+            content_type=content_type,
+            description=description,
+            entity_info=entity_info,
+            chunk_order_index=chunk_order_index,
+            page_idx=item.get("page_idx", 0),
+            file_path=file_path,
+            content=content,
+            chunk_id=compute_mdhash_id(content, prefix="chunk-"),
+            tokens=len(self.lightrag.tokenizer.encode(content)),
+        )
 
-            # Apply the appropriate chunk template based on content type
-            formatted_chunk_content = self._apply_chunk_template(
-                content_type, original_item, description
-            )
+    def _convert_to_lightrag_chunks_type_aware(
+        self, records: List[MultimodalChunkRecord], file_path: str, doc_id: str
+    ) -> Dict[str, Any]:
+        """Convert multimodal records to LightRAG standard chunks format"""
 
-            # Generate chunk_id
-            chunk_id = compute_mdhash_id(formatted_chunk_content, prefix="chunk-")
+        chunks = {}
+        file_name = os.path.basename(file_path)
 
-            # Calculate tokens
-            tokens = len(self.lightrag.tokenizer.encode(formatted_chunk_content))
+        for record in records:
+            # Identical occurrences (e.g. a repeated logo with a reused
+            # description) still get a chunk each
+            if record.chunk_id in chunks:
+                record.chunk_id = compute_mdhash_id(
+                    f"{record.content}\n{record.chunk_order_index}", prefix="chunk-"
+                )
 
             # Build LightRAG standard chunk format
-            chunks[chunk_id] = {
-                "content": formatted_chunk_content,  # Now uses the templated content
-                "tokens": tokens,
+            chunks[record.chunk_id] = {
+                "content": record.content,  # Now uses the templated content
+                "tokens": record.tokens,
                 "full_doc_id": doc_id,
-                "chunk_order_index": chunk_order_index,
-                "file_path": os.path.basename(file_path),
+                "chunk_order_index": record.chunk_order_index,
+                "file_path": file_name,
                 "llm_cache_list": [],  # LightRAG will populate this field
                 # Multimodal-specific metadata
                 "is_multimodal": True,
-                "modal_entity_name": entity_info["entity_name"],
-                "original_type": data["content_type"],
-                "page_idx": data["item_info"].get("page_idx", 0),
+                "modal_entity_name": record.entity_info["entity_name"],
+                "original_type": record.content_type,
+                "page_idx": record.page_idx,
             }
 
         self.logger.debug(
@@ -1000,7 +1371,7 @@ class ProcessorMixin:
 
     async def _store_multimodal_main_entities(
         self,
-        multimodal_data_list: List[Dict[str, Any]],
+        records: List[MultimodalChunkRecord],
         lightrag_chunks: Dict[str, Any],
         file_path: str,
         doc_id: str = None,
@@ -1009,43 +1380,44 @@ class ProcessorMixin:
         Store multimodal main entities to entities_vdb and full_entities.
         This ensures that entities like "TableName (table)" are properly indexed.
 
+        Repeated content reuses one entity, so an entity can belong to several
+        chunks of this and other documents: its source chunks and file paths
+        are merged with the existing node's, as LightRAG does for extracted
+        entities, so deleting one document does not drop the others' sources.
+
         Args:
-            multimodal_data_list: List of processed multimodal data with entity info
+            records: Multimodal chunk records with entity info
             lightrag_chunks: Chunks in LightRAG format (already formatted with templates)
             file_path: File path for the entities
             doc_id: Document ID for full_entities storage
         """
-        if not multimodal_data_list:
+        if not records:
             return
 
         # Create entities_vdb entries for all multimodal main entities
         entities_to_store = {}
+        file_name = os.path.basename(file_path)
 
-        for data in multimodal_data_list:
-            entity_info = data["entity_info"]
+        for record in records:
+            entity_info = record.entity_info
             entity_name = entity_info["entity_name"]
-            description = data["description"]
-            content_type = data["content_type"]
-            original_item = data["original_item"]
-
-            # Apply the same chunk template to get the formatted content
-            formatted_chunk_content = self._apply_chunk_template(
-                content_type, original_item, description
-            )
-
-            # Generate chunk_id using the formatted content (same as in _convert_to_lightrag_chunks)
-            chunk_id = compute_mdhash_id(formatted_chunk_content, prefix="chunk-")
 
             # Generate entity_id using LightRAG's standard format
             entity_id = compute_mdhash_id(entity_name, prefix="ent-")
 
+            existing = entities_to_store.get(entity_id)
+            if existing is not None:
+                # Another occurrence of the same content in this document
+                existing["source_id"].append(record.chunk_id)
+                continue
+
             # Create entity data in LightRAG format
             entity_data = {
                 "entity_name": entity_name,
-                "entity_type": entity_info.get("entity_type", content_type),
-                "content": entity_info.get("summary", description),
-                "source_id": chunk_id,
-                "file_path": os.path.basename(file_path),
+                "entity_type": entity_info.get("entity_type", record.content_type),
+                "content": entity_info.get("summary", record.description),
+                "source_id": [record.chunk_id],
+                "file_path": [file_name],
             }
 
             entities_to_store[entity_id] = entity_data
@@ -1053,27 +1425,11 @@ class ProcessorMixin:
         if entities_to_store:
             try:
                 # Store entities in knowledge graph
-                for entity_id, entity_data in entities_to_store.items():
-                    entity_name = entity_data["entity_name"]
+                await self._upsert_multimodal_main_entity_nodes(entities_to_store)
 
-                    # Create node data for knowledge graph
-                    node_data = {
-                        "entity_id": entity_name,
-                        "entity_type": entity_data["entity_type"],
-                        "description": entity_data["content"],
-                        "source_id": entity_data["source_id"],
-                        "file_path": entity_data["file_path"],
-                        "created_at": int(time.time()),
-                    }
-
-                    # Store in knowledge graph
-                    await self.lightrag.chunk_entity_relation_graph.upsert_node(
-                        entity_name, node_data
-                    )
-
-                # Store in entities_vdb
+                # Store in entities_vdb; the index is flushed with the other
+                # storages at the end of the document (_insert_done)
                 await self.lightrag.entities_vdb.upsert(entities_to_store)
-                await self.lightrag.entities_vdb.index_done_callback()
 
                 # NEW: Store multimodal main entities in full_entities storage
                 if doc_id and self.lightrag.full_entities:
@@ -1089,6 +1445,85 @@ class ProcessorMixin:
                 self.logger.error(f"Error storing multimodal main entities: {e}")
                 raise
 
+    async def _upsert_multimodal_main_entity_nodes(
+        self, entities_to_store: Dict[str, Dict[str, Any]]
+    ):
+        """
+        Upsert main entity nodes, merging their sources with existing nodes
+
+        The source_id and file_path lists of each entity are joined with those
+        of the stored node, under LightRAG's graph lock for the entity names so
+        concurrent documents do not overwrite each other's sources. The merged
+        strings are written back into entities_to_store for the vector store.
+
+        Args:
+            entities_to_store: Entity data by entity ID, with source_id and
+                file_path given as lists
+        """
+        entity_names = [data["entity_name"] for data in entities_to_store.values()]
+        workspace = getattr(self.lightrag, "workspace", "")
+        namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
+
+        async with get_storage_keyed_lock(
+            entity_names, namespace=namespace, enable_logging=False
+        ):
+            existing_nodes = (
+                await self.lightrag.chunk_entity_relation_graph.get_nodes_batch(
+                    entity_names
+                )
+            )
+            for entity_data in entities_to_store.values():
+                node = existing_nodes.get(entity_data["entity_name"]) or {}
+                for key in ("source_id", "file_path"):
+                    values = [
+                        value
+                        for value in (node.get(key) or "").split(GRAPH_FIELD_SEP)
+                        if value
+                    ] + entity_data[key]
+                    entity_data[key] = GRAPH_FIELD_SEP.join(dict.fromkeys(values))
+
+            created_at = int(time.time())
+            nodes = [
+                (
+                    entity_data["entity_name"],
+                    {
+                        "entity_id": entity_data["entity_name"],
+                        "entity_type": entity_data["entity_type"],
+                        "description": entity_data["content"],
+                        "source_id": entity_data["source_id"],
+                        "file_path": entity_data["file_path"],
+                        "created_at": created_at,
+                    },
+                )
+                for entity_data in entities_to_store.values()
+            ]
+            await self._upsert_graph_nodes(nodes)
+
+    async def _upsert_graph_nodes(self, nodes: List[Tuple[str, Dict[str, Any]]]):
+        """
+        Upsert knowledge graph nodes in one batch call when the backend has one
+
+        Backends that do not override LightRAG's serial default are called
+        concurrently with one upsert_node per node instead.
+
+        Args:
+            nodes: List of (node_id, node_data) tuples
+        """
+        if not nodes:
+            return
+
+        graph = self.lightrag.chunk_entity_relation_graph
+        batch_upsert = getattr(type(graph), "upsert_nodes_batch", None)
+        if batch_upsert is not None and batch_upsert is not getattr(
+            BaseGraphStorage, "upsert_nodes_batch", None
+        ):
+            await graph.upsert_nodes_batch(nodes)
+            return
+
+        await asyncio.gather(
+            *[graph.upsert_node(node_id, node_data) for node_id, node_data in nodes]
+        )
+
     async def _store_multimodal_entities_to_full_entities(
         self, entities_to_store: Dict[str, Any], doc_id: str
     ):
@@ -1134,9 +1569,8 @@ class ProcessorMixin:
                     "update_time": int(time.time()),
                 }
 
-            # Store updated data
+            # Store updated data; flushed at the end of the document (_insert_done)
             await self.lightrag.full_entities.upsert({doc_id: doc_entities_data})
-            await self.lightrag.full_entities.index_done_callback()
 
             self.logger.debug(
                 f"Added {len(entities_to_store)} multimodal main entities to full_entities for doc {doc_id}"
@@ -1178,26 +1612,18 @@ class ProcessorMixin:
         return chunk_results
 
     async def _batch_add_belongs_to_relations_type_aware(
-        self, chunk_results: List[Tuple], multimodal_data_list: List[Dict[str, Any]]
+        self, chunk_results: List[Tuple], records: List[MultimodalChunkRecord]
     ) -> List[Tuple]:
         """Add belongs_to relations for multimodal entities"""
         # Create mapping from chunk_id to modal_entity_name
         chunk_to_modal_entity = {}
         chunk_to_file_path = {}
 
-        for data in multimodal_data_list:
-            description = data["description"]
-            content_type = data["content_type"]
-            original_item = data["original_item"]
-
-            # Use the same template formatting as in _convert_to_lightrag_chunks_type_aware
-            formatted_chunk_content = self._apply_chunk_template(
-                content_type, original_item, description
+        for record in records:
+            chunk_to_modal_entity[record.chunk_id] = record.entity_info["entity_name"]
+            chunk_to_file_path[record.chunk_id] = (
+                record.file_path or "multimodal_content"
             )
-            chunk_id = compute_mdhash_id(formatted_chunk_content, prefix="chunk-")
-
-            chunk_to_modal_entity[chunk_id] = data["entity_info"]["entity_name"]
-            chunk_to_file_path[chunk_id] = data.get("file_path", "multimodal_content")
 
         enhanced_chunk_results = []
         belongs_to_count = 0
@@ -1314,8 +1740,16 @@ class ProcessorMixin:
                 f"Error updating doc_status with multimodal chunks: {e}"
             )
 
-    async def _mark_multimodal_processing_complete(self, doc_id: str):
-        """Mark multimodal content processing as complete in the document status."""
+    async def _mark_multimodal_processing_complete(
+        self, doc_id: str, status_updates: Optional[Dict[str, Any]] = None
+    ):
+        """Mark multimodal content processing as complete in the document status.
+
+        Args:
+            doc_id: Document ID
+            status_updates: Extra fields to record in the document status
+                (e.g. trivial_images_filtered)
+        """
         try:
             current_doc_status = await self.lightrag.doc_status.get_by_id(doc_id)
             if current_doc_status:
@@ -1323,6 +1757,7 @@ class ProcessorMixin:
                     {
                         doc_id: {
                             **current_doc_status,
+                            **(status_updates or {}),
                             "multimodal_processed": True,
                             "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S+00:00"),
                         }
@@ -1395,6 +1830,7 @@ class ProcessorMixin:
                 "fully_processed": fully_processed,
                 "chunks_count": doc_status.get("chunks_count", 0),
                 "chunks_list": doc_status.get("chunks_list", []),
+                "trivial_images_filtered": doc_status.get("trivial_images_filtered", 0),
                 "status": doc_status.get("status", ""),
                 "updated_at": doc_status.get("updated_at", ""),
                 "raw_status": doc_status,
@@ -1462,13 +1898,14 @@ class ProcessorMixin:
         # Step 2: Separate text and multimodal content
         text_content, multimodal_items = separate_content(content_list)
 
-        # Step 2.5: Set content source for context extraction in multimodal processing
-        if hasattr(self, "set_content_source_for_context") and multimodal_items:
+        # Step 2.5: Build this document's context source for multimodal processing
+        document_context = None
+        if multimodal_items:
             self.logger.info(
-                "Setting content source for context-aware multimodal processing..."
+                "Building content source for context-aware multimodal processing..."
             )
-            self.set_content_source_for_context(
-                content_list, self.config.content_format
+            document_context = self.create_document_context(
+                content_list, self.config.content_format, doc_id
             )
 
         # Step 3: Insert pure text content with all parameters
@@ -1485,7 +1922,12 @@ class ProcessorMixin:
 
         # Step 4: Process multimodal content (using specialized processors)
         if multimodal_items:
-            await self._process_multimodal_content(multimodal_items, file_path, doc_id)
+            await self._process_multimodal_content(
+                multimodal_items,
+                file_path,
+                doc_id,
+                document_context=document_context,
+            )
         else:
             # If no multimodal content, mark multimodal processing as complete
             # This ensures the document status properly reflects completion of all processing
@@ -1789,13 +2231,14 @@ class ProcessorMixin:
         # Step 1: Separate text and multimodal content
         text_content, multimodal_items = separate_content(content_list)
 
-        # Step 1.5: Set content source for context extraction in multimodal processing
-        if hasattr(self, "set_content_source_for_context") and multimodal_items:
+        # Step 1.5: Build this document's context source for multimodal processing
+        document_context = None
+        if multimodal_items:
             self.logger.info(
-                "Setting content source for context-aware multimodal processing..."
+                "Building content source for context-aware multimodal processing..."
             )
-            self.set_content_source_for_context(
-                content_list, self.config.content_format
+            document_context = self.create_document_context(
+                content_list, self.config.content_format, doc_id
             )
 
         # Step 2: Insert pure text content with all parameters
@@ -1812,7 +2255,12 @@ class ProcessorMixin:
 
         # Step 3: Process multimodal content (using specialized processors)
         if multimodal_items:
-            await self._process_multimodal_content(multimodal_items, file_path, doc_id)
+            await self._process_multimodal_content(
+                multimodal_items,
+                file_path,
+                doc_id,
+                document_context=document_context,
+            )
         else:
             # If no multimodal content, mark multimodal processing as complete
             # This ensures the document status properly reflects completion of all processing
@@ -280,6 +280,10 @@ Footnotes: {footnotes}
 
 Visual Analysis: {enhanced_caption}"""
 
+PROMPTS["trivial_image_description"] = (
+    "Decorative image ({reason}) with no content to analyze."
+)
+
 PROMPTS["table_chunk"] = """Table Analysis:
 Image Path: {table_img_path}
 Caption: {table_caption}
@@ -4,20 +4,81 @@ Query functionality for RAGAnything
 Contains all query-related methods for both text and multimodal queries
 """
 
+import asyncio
 import json
 import hashlib
+import os
 import re
-from typing import Dict, List, Any
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional
 from pathlib import Path
 from lightrag import QueryParam
-from lightrag.utils import always_get_an_event_loop
+from lightrag.prompt import PROMPTS as LIGHTRAG_PROMPTS
+from lightrag.utils import always_get_an_event_loop, compute_mdhash_id
 from raganything.prompt import PROMPTS
+from raganything.image_prep import detect_base64_image_mime_type
+from raganything.scheduler import (
+    MODEL_TEXT,
+    MODEL_VISION,
+    PRIORITY_INTERACTIVE,
+    model_call_context,
+)
 from raganything.utils import (
     get_processor_for_type,
     encode_image_to_base64,
-    validate_image_file,
+    compute_file_content_hash,
+)
+
+# Image paths in retrieved context that are sent to the VLM
+VLM_IMAGE_PATH_PATTERN = re.compile(
+    r"Image Path:\s*([^\r\n]*?\.(?:jpg|jpeg|png|gif|bmp|webp|tiff|tif))"
 )
 
+# Larger image files are left as paths in the prompt
+VLM_MAX_IMAGE_FILE_BYTES = 50 * 1024 * 1024
+
+
+def _elapsed_ms(start: float) -> float:
+    """Milliseconds since a time.perf_counter() reading"""
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+@dataclass
+class VLMQueryContext:
+    """Per-request state of a VLM enhanced query
+
+    Each call to ``aquery_vlm_enhanced`` creates its own context, so
+    concurrent queries on one RAGAnything instance never share images.
+    """
+
+    query: str
+    """User query."""
+
+    images_base64: List[str] = field(default_factory=list)
+    """Encoded images, in the order of their [VLM_IMAGE_n] markers."""
+
+    image_paths: List[str] = field(default_factory=list)
+    """Source paths of the encoded images."""
+
+    images_found: int = 0
+    """Distinct image paths referenced in the retrieved context."""
+
+    images_dropped: int = 0
+    """Valid images left out because of the image count or byte budget."""
+
+    image_bytes: int = 0
+    """Total size of the encoded images sent to the VLM."""
+
+    def get_metadata(self) -> Dict[str, int]:
+        """Image counts reported with the query response"""
+        return {
+            "images_found": self.images_found,
+            "images_sent": len(self.images_base64),
+            "images_dropped": self.images_dropped,
+            "image_bytes": self.image_bytes,
+        }
+
 
 class QueryMixin:
     """QueryMixin class containing query functionality for RAGAnything"""
@@ -108,6 +169,9 @@ class QueryMixin:
                 - vlm_enhanced: bool, default True when vision_model_func is available.
                   If True, will parse image paths in retrieved context and replace them
                   with base64 encoded images for VLM processing.
+                - return_metadata: bool, default False. If True, returns
+                  (result, metadata) where metadata holds the VLM image counts
+                  (empty for text queries).
 
         Returns:
             str: Query result
@@ -119,6 +183,7 @@ class QueryMixin:
 
         # Check if VLM enhanced query should be used
         vlm_enhanced = kwargs.pop("vlm_enhanced", None)
+        return_metadata = kwargs.pop("return_metadata", False)
 
         # Auto-determine VLM enhanced based on availability
         if vlm_enhanced is None:
@@ -133,7 +198,9 @@ class QueryMixin:
             and hasattr(self, "vision_model_func")
             and self.vision_model_func
         ):
-            return await self.aquery_vlm_enhanced(query, mode=mode, **kwargs)
+            return await self.aquery_vlm_enhanced(
+                query, mode=mode, return_metadata=return_metadata, **kwargs
+            )
         elif vlm_enhanced and (
             not hasattr(self, "vision_model_func") or not self.vision_model_func
         ):
@@ -151,6 +218,8 @@ class QueryMixin:
         result = await self.lightrag.aquery(query, param=query_param)
 
         self.logger.info("Text query completed")
+        if return_metadata:
+            return result, {}
         return result
 
     async def aquery_with_multimodal(
@@ -170,9 +239,16 @@ class QueryMixin:
                 - Other fields depend on type (e.g., img_path, table_data, latex, etc.)
             mode: Query mode ("local", "global", "hybrid", "naive", "mix", "bypass")
             **kwargs: Other query parameters, will be passed to QueryParam
+                - pipelined: bool, defaults to config.multimodal_query_pipelined.
+                  If True, retrieval for the base query runs while the
+                  multimodal content is described (see
+                  _aquery_multimodal_pipelined).
+                - return_metadata: bool, default False. If True, returns
+                  (result, metadata) where metadata holds a latency breakdown
+                  in milliseconds and, for VLM answers, the image counts.
 
         Returns:
-            str: Query result
+            str: Query result, or (result, metadata) if return_metadata is True
 
         Examples:
             # Pure text query
@@ -202,15 +278,33 @@ class QueryMixin:
         self.logger.info(f"Executing multimodal query: {query[:100]}...")
         self.logger.info(f"Query mode: {mode}")
 
+        pipelined = kwargs.pop("pipelined", None)
+        if pipelined is None:
+            pipelined = self.config.multimodal_query_pipelined
+
         # If no multimodal content, fallback to pure text query
         if not multimodal_content:
             self.logger.info("No multimodal content provided, executing text query")
             return await self.aquery(query, mode=mode, **kwargs)
 
+        return_metadata = kwargs.pop("return_metadata", False)
+        start = time.perf_counter()
+
+        # Bypass mode has no retrieval to overlap, and streamed answers keep
+        # LightRAG's own generation path
+        if pipelined and (mode == "bypass" or kwargs.get("stream")):
+            self.logger.info(
+                "Pipelined multimodal query does not apply to bypass or streamed queries"
+            )
+            pipelined = False
+
         # Generate cache key for multimodal query
         cache_key = self._generate_multimodal_cache_key(
             query, multimodal_content, mode, **kwargs
         )
+        if pipelined:
+            # Pipelined answers are built from a different context
+            cache_key += ":pipelined"
 
         # Check cache if available and enabled
         cached_result = None
@@ -233,21 +327,41 @@ class QueryMixin:
                             self.logger.info(
                                 f"Multimodal query cache hit: {cache_key[:16]}..."
                             )
+                            if return_metadata:
+                                return result_content, {
+                                    "cache_hit": True,
+                                    "pipelined": pipelined,
+                                    "latency_ms": {
+                                        "total": _elapsed_ms(start),
+                                    },
+                                }
                             return result_content
                 except Exception as e:
                     self.logger.debug(f"Error accessing multimodal query cache: {e}")
 
-        # Process multimodal content to generate enhanced query text
-        enhanced_query = await self._process_multimodal_query_content(
-            query, multimodal_content
-        )
+        if pipelined:
+            result, metadata = await self._aquery_multimodal_pipelined(
+                query, multimodal_content, mode, **kwargs
+            )
+        else:
+            # Process multimodal content to generate enhanced query text
+            descriptions_start = time.perf_counter()
+            enhanced_query = await self._process_multimodal_query_content(
+                query, multimodal_content
+            )
+            latency = {"descriptions": _elapsed_ms(descriptions_start)}
 
-        self.logger.info(
-            f"Generated enhanced query length: {len(enhanced_query)} characters"
-        )
+            self.logger.info(
+                f"Generated enhanced query length: {len(enhanced_query)} characters"
+            )
 
-        # Execute enhanced query
-        result = await self.aquery(enhanced_query, mode=mode, **kwargs)
+            # Execute enhanced query
+            query_start = time.perf_counter()
+            result, metadata = await self.aquery(
+                enhanced_query, mode=mode, return_metadata=True, **kwargs
+            )
+            latency["query"] = _elapsed_ms(query_start)
+            metadata["latency_ms"] = latency
 
         # Save to cache if available and enabled
         if (
@@ -290,20 +404,155 @@ class QueryMixin:
             except Exception as e:
                 self.logger.debug(f"Error persisting multimodal query cache: {e}")
 
-        self.logger.info("Multimodal query completed")
+        metadata["pipelined"] = pipelined
+        metadata["latency_ms"]["total"] = _elapsed_ms(start)
+        self.logger.info(f"Multimodal query completed: {metadata['latency_ms']}")
+        if return_metadata:
+            return result, metadata
         return result
 
-    async def aquery_vlm_enhanced(self, query: str, mode: str = "mix", **kwargs) -> str:
+    async def _aquery_multimodal_pipelined(
+        self,
+        query: str,
+        multimodal_content: List[Dict[str, Any]],
+        mode: str,
+        **kwargs,
+    ):
+        """
+        Multimodal query with retrieval overlapped with description generation
+
+        Retrieval for the base query (keyword extraction included) starts
+        immediately. Once the multimodal content is described, a vector search
+        on the descriptions adds context for the enhanced query, and the
+        answer is generated once from the merged context with LightRAG's
+        response prompt.
+
+        Args:
+            query: Base query text
+            multimodal_content: List of multimodal content
+            mode: Query mode used for base query retrieval
+            **kwargs: Other query parameters, will be passed to QueryParam
+                - vlm_enhanced: bool, default True when vision_model_func is
+                  available. If True and the merged context references
+                  images, the answer is generated by the VLM.
+
+        Returns:
+            Tuple of (result, metadata) where metadata["latency_ms"] holds the
+            time spent on base retrieval, descriptions, enhanced retrieval and
+            generation
+        """
+        vlm_enhanced = kwargs.pop("vlm_enhanced", None)
+        latency: Dict[str, float] = {}
+
+        async def timed(stage: str, coro):
+            stage_start = time.perf_counter()
+            try:
+                return await coro
+            finally:
+                latency[stage] = _elapsed_ms(stage_start)
+
+        base_retrieval = asyncio.create_task(
+            timed(
+                "base_retrieval",
+                self.lightrag.aquery(
+                    query,
+                    param=QueryParam(mode=mode, only_need_context=True, **kwargs),
+                ),
+            )
+        )
+        try:
+            descriptions = await timed(
+                "descriptions",
+                self._describe_multimodal_query_content(multimodal_content),
+            )
+            enhanced_query = self._build_enhanced_query(query, descriptions)
+
+            # Keywords were already extracted for the base query; the
+            # descriptions only need a vector search
+            enhanced_context = None
+            if descriptions:
+                enhanced_context = await timed(
+                    "enhanced_retrieval",
+                    self.lightrag.aquery(
+                        "\n".join(descriptions),
+                        param=QueryParam(
+                            mode="naive", only_need_context=True, **kwargs
+                        ),
+                    ),
+                )
+            base_context = await base_retrieval
+        finally:
+            base_retrieval.cancel()
+
+        contexts = [
+            context
+            for context in (base_context, enhanced_context)
+            if isinstance(context, str)
+            and context.strip()
+            and context != LIGHTRAG_PROMPTS["fail_response"]
+        ]
+        if not contexts:
+            self.logger.info("No context retrieved for pipelined multimodal query")
+            return LIGHTRAG_PROMPTS["fail_response"], {"latency_ms": latency}
+
+        system_prompt = LIGHTRAG_PROMPTS["rag_response"].format(
+            response_type=kwargs.get("response_type") or "Multiple Paragraphs",
+            user_prompt=kwargs.get("user_prompt") or "n/a",
+            context_data="\n\n".join(contexts),
+        )
+
+        metadata: Dict[str, Any] = {}
+        if vlm_enhanced is None:
+            vlm_enhanced = getattr(self, "vision_model_func", None) is not None
+        if vlm_enhanced and getattr(self, "vision_model_func", None):
+            vlm_context = VLMQueryContext(query=enhanced_query)
+            prompt = "\n\n".join([system_prompt, "---User Query---", enhanced_query])
+            vlm_prompt, images_found = await self._process_image_paths_for_vlm(
+                prompt, vlm_context
+            )
+            metadata.update(vlm_context.get_metadata())
+            if images_found:
+                messages = self._build_vlm_messages_with_images(
+                    vlm_prompt, enhanced_query, vlm_context
+                )
+                result = await timed(
+                    "generation", self._call_vlm_with_multimodal_content(messages)
+                )
+                metadata["latency_ms"] = latency
+                return result, metadata
+
+        llm_model_func = self.llm_model_func or self.lightrag.llm_model_func
+        if getattr(self, "model_scheduler", None) is not None:
+            llm_model_func = self.model_scheduler.wrap(llm_model_func, MODEL_TEXT)
+
+        with model_call_context(priority=PRIORITY_INTERACTIVE):
+            result = await timed(
+                "generation",
+                llm_model_func(
+                    enhanced_query,
+                    system_prompt=system_prompt,
+                    history_messages=kwargs.get("conversation_history") or [],
+                ),
+            )
+
+        metadata["latency_ms"] = latency
+        return result, metadata
+
+    async def aquery_vlm_enhanced(
+        self, query: str, mode: str = "mix", return_metadata: bool = False, **kwargs
+    ):
         """
         VLM enhanced query - replaces image paths in retrieved context with base64 encoded images for VLM processing
 
         Args:
             query: User query
             mode: Underlying LightRAG query mode
+            return_metadata: Also return image metadata (images found, sent,
+                dropped by the image budget, and bytes sent)
             **kwargs: Other query parameters
 
         Returns:
-            str: VLM query result
+            str: VLM query result, or (result, metadata) if return_metadata is True
         """
         # Ensure VLM is available
         if not hasattr(self, "vision_model_func") or not self.vision_model_func:
@@ -317,9 +566,8 @@ class QueryMixin:
 
         self.logger.info(f"Executing VLM enhanced query: {query[:100]}...")
 
-        # Clear previous image cache
-        if hasattr(self, "_current_images_base64"):
-            delattr(self, "_current_images_base64")
+        # Images are collected per request so concurrent queries stay isolated
+        vlm_context = VLMQueryContext(query=query)
 
         # 1. Get original retrieval prompt (without generating final answer)
         query_param = QueryParam(mode=mode, only_need_prompt=True, **kwargs)
@@ -329,24 +577,31 @@ class QueryMixin:
 
         # 2. Extract and process image paths
         enhanced_prompt, images_found = await self._process_image_paths_for_vlm(
-            raw_prompt
+            raw_prompt, vlm_context
         )
 
         if not images_found:
             self.logger.info("No valid images found, falling back to normal query")
             # Fallback to normal query
             query_param = QueryParam(mode=mode, **kwargs)
-            return await self.lightrag.aquery(query, param=query_param)
+            result = await self.lightrag.aquery(query, param=query_param)
+            if return_metadata:
+                return result, vlm_context.get_metadata()
+            return result
 
         self.logger.info(f"Processed {images_found} images for VLM")
 
         # 3. Build VLM message format
-        messages = self._build_vlm_messages_with_images(enhanced_prompt, query)
+        messages = self._build_vlm_messages_with_images(
+            enhanced_prompt, query, vlm_context
+        )
 
         # 4. Call VLM for question answering
         result = await self._call_vlm_with_multimodal_content(messages)
 
         self.logger.info("VLM enhanced query completed")
+        if return_metadata:
+            return result, vlm_context.get_metadata()
         return result
 
     async def _process_multimodal_query_content(
@@ -363,10 +618,42 @@ class QueryMixin:
             str: Enhanced query text
         """
         self.logger.info("Starting multimodal query content processing...")
+        descriptions = await self._describe_multimodal_query_content(multimodal_content)
+        enhanced_query = self._build_enhanced_query(base_query, descriptions)
 
+        self.logger.info("Multimodal query content processing completed")
+        return enhanced_query
+
+    def _build_enhanced_query(self, base_query: str, descriptions: List[str]) -> str:
+        """
+        Combine the base query with descriptions of its multimodal content
+
+        Args:
+            base_query: Base query text
+            descriptions: Description lines from _describe_multimodal_query_content
+
+        Returns:
+            str: Enhanced query text
+        """
         enhanced_parts = [f"User query: {base_query}"]
+        enhanced_parts.extend(descriptions)
+        return "\n".join(enhanced_parts) + PROMPTS["QUERY_ENHANCEMENT_SUFFIX"]
 
-        for i, content in enumerate(multimodal_content):
+    async def _describe_multimodal_query_content(
+        self, multimodal_content: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Describe each multimodal query item
+
+        Args:
+            multimodal_content: List of multimodal content
+
+        Returns:
+            List[str]: One "Related <type> content: ..." line per item that
+                could be described, in input order
+        """
+
+        async def describe_item(i: int, content: Dict[str, Any]):
             content_type = content.get("type", "unknown")
             self.logger.info(
                 f"Processing {i+1}/{len(multimodal_content)} multimodal content: {content_type}"
@@ -381,26 +668,23 @@ class QueryMixin:
                     description = await self._generate_query_content_description(
                         processor, content, content_type
                     )
-                    enhanced_parts.append(
-                        f"\nRelated {content_type} content: {description}"
-                    )
-                else:
-                    # If no appropriate processor, use basic description
-                    basic_desc = str(content)[:200]
-                    enhanced_parts.append(
-                        f"\nRelated {content_type} content: {basic_desc}"
-                    )
+                    return f"\nRelated {content_type} content: {description}"
+
+                # If no appropriate processor, use basic description
+                basic_desc = str(content)[:200]
+                return f"\nRelated {content_type} content: {basic_desc}"
 
             except Exception as e:
                 self.logger.error(f"Error processing multimodal content: {str(e)}")
                 # Continue processing other content
-                continue
-
-        enhanced_query = "\n".join(enhanced_parts)
-        enhanced_query += PROMPTS["QUERY_ENHANCEMENT_SUFFIX"]
+                return None
 
-        self.logger.info("Multimodal query content processing completed")
-        return enhanced_query
+        # Describe all items concurrently; model calls are still limited by the
+        # shared scheduler, and results keep the input order
+        descriptions = await asyncio.gather(
+            *[describe_item(i, content) for i, content in enumerate(multimodal_content)]
+        )
+        return [part for part in descriptions if part is not None]
 
     async def _generate_query_content_description(
         self, processor, content: Dict[str, Any], content_type: str
@@ -417,32 +701,110 @@ class QueryMixin:
             str: Content description
         """
         try:
-            if content_type == "image":
-                return await self._describe_image_for_query(processor, content)
-            elif content_type == "table":
-                return await self._describe_table_for_query(processor, content)
-            elif content_type == "equation":
-                return await self._describe_equation_for_query(processor, content)
-            else:
-                return await self._describe_generic_for_query(
+            # Repeated attachments are answered from the description cache
+            description_cache = getattr(self, "description_cache", None)
+            cache_key = None
+            if description_cache is not None:
+                cache_key = await self._query_description_cache_key(
                     processor, content, content_type
                 )
+            modality = f"query_{content_type}"
+            if cache_key is not None:
+                cached = await description_cache.get(cache_key, modality)
+                if cached is not None:
+                    return cached
+
+            # Query-time descriptions are served ahead of bulk ingest calls
+            with model_call_context(priority=PRIORITY_INTERACTIVE):
+                if content_type == "image":
+                    description = await self._describe_image_for_query(
+                        processor, content
+                    )
+                    if description is None:
+                        # Not described by the model; never cached
+                        return self._describe_image_from_metadata(content)
+                elif content_type == "table":
+                    description = await self._describe_table_for_query(
+                        processor, content
+                    )
+                elif content_type == "equation":
+                    description = await self._describe_equation_for_query(
+                        processor, content
+                    )
+                else:
+                    description = await self._describe_generic_for_query(
+                        processor, content, content_type
+                    )
+
+            if cache_key is not None and isinstance(description, str) and description:
+                await description_cache.put(cache_key, modality, description)
+                # Persisted off the request path
+                description_cache.schedule_flush()
+            return description
 
         except Exception as e:
             self.logger.error(f"Error generating {content_type} description: {str(e)}")
             return f"{content_type} content: {str(content)[:100]}"
 
+    async def _query_description_cache_key(
+        self, processor, content: Dict[str, Any], content_type: str
+    ) -> Optional[str]:
+        """
+        Build the description cache key for a query attachment
+
+        Images are keyed by a hash of the file contents, other content by its
+        fields. Query prompt templates and the model are part of the key.
+
+        Args:
+            processor: Multimodal processor
+            content: Content data
+            content_type: Content type
+
+        Returns:
+            Optional[str]: Cache key, or None if the content cannot be hashed
+                (e.g. a missing image file) or the model identity is unknown
+        """
+        model_name = getattr(processor, "model_name", "")
+        if not model_name:
+            return None
+
+        fingerprint_data = dict(content)
+        if content_type == "image":
+            image_path = content.get("img_path")
+            if not image_path or not Path(image_path).is_file():
+                return None
+            try:
+                fingerprint_data["img_path"] = await asyncio.to_thread(
+                    compute_file_content_hash, image_path
+                )
+            except OSError:
+                return None
+
+        template_version = compute_mdhash_id(
+            "\x1f".join(
+                str(PROMPTS[key]) for key in sorted(PROMPTS) if key.startswith("QUERY_")
+            )
+        )
+        key_data = [
+            f"query_{content_type}",
+            template_version,
+            json.dumps(
+                fingerprint_data, sort_keys=True, ensure_ascii=False, default=str
+            ),
+            model_name,
+        ]
+        return compute_mdhash_id(json.dumps(key_data), prefix="qdesc-")
+
     async def _describe_image_for_query(
         self, processor, content: Dict[str, Any]
-    ) -> str:
-        """Generate image description for query"""
+    ) -> Optional[str]:
+        """Generate image description for query, None if the image cannot be sent"""
         image_path = content.get("img_path")
-        captions = content.get("image_caption", content.get("img_caption", []))
-        footnotes = content.get("image_footnote", content.get("img_footnote", []))
-
         if image_path and Path(image_path).exists():
             # If image exists, use vision model to generate description
-            image_base64 = processor._encode_image_to_base64(image_path)
+            image_base64 = await asyncio.to_thread(
+                processor._encode_image_to_base64, image_path
+            )
             if image_base64:
                 prompt = PROMPTS["QUERY_IMAGE_DESCRIPTION"]
                 description = await processor.modal_caption_func(
@@ -451,8 +813,14 @@ class QueryMixin:
                     system_prompt=PROMPTS["QUERY_IMAGE_ANALYST_SYSTEM"],
                 )
                 return description
+        return None
+
+    def _describe_image_from_metadata(self, content: Dict[str, Any]) -> str:
+        """Describe a query image from its path, captions and footnotes"""
+        image_path = content.get("img_path")
+        captions = content.get("image_caption", content.get("img_caption", []))
+        footnotes = content.get("image_footnote", content.get("img_footnote", []))
 
-        # If image doesn't exist or processing failed, use existing information
         parts = []
         if image_path:
             parts.append(f"Image path: {image_path}")
@@ -516,84 +884,168 @@ class QueryMixin:
 
         return description
 
-    async def _process_image_paths_for_vlm(self, prompt: str) -> tuple[str, int]:
+    async def _process_image_paths_for_vlm(
+        self, prompt: str, vlm_context: VLMQueryContext
+    ) -> tuple[str, int]:
         """
         Process image paths in prompt, keeping original paths and adding VLM markers
 
+        Distinct images are ranked by their first position in the prompt,
+        which follows LightRAG's retrieval ranking, and only the top ones
+        that fit the image budget (vlm_max_images, vlm_max_image_bytes) are
+        encoded and attached. Images are validated and encoded concurrently
+        in worker threads, then the prompt is rewritten in a single pass.
+
         Args:
             prompt: Original prompt
+            vlm_context: Request context that receives the encoded images
 
         Returns:
             tuple: (processed prompt, image count)
         """
-        enhanced_prompt = prompt
-        images_processed = 0
+        matches = list(VLM_IMAGE_PATH_PATTERN.finditer(prompt))
+        self.logger.info(f"Found {len(matches)} image path matches in prompt")
+        if not matches:
+            return prompt, 0
 
-        # Initialize image cache
-        self._current_images_base64 = []
+        image_paths = list(dict.fromkeys(m.group(1).strip() for m in matches))
+        vlm_context.images_found = len(image_paths)
+        selected = await self._select_vlm_images(image_paths, vlm_context)
 
-        # Enhanced regex pattern for matching image paths
-        # Matches only the path ending with image file extensions
-        image_path_pattern = (
-            r"Image Path:\s*([^\r\n]*?\.(?:jpg|jpeg|png|gif|bmp|webp|tiff|tif))"
-        )
+        # Rewrite the prompt, numbering markers in order of appearance; each
+        # selected image is attached once, at its first occurrence
+        marker_by_path = {}
+        parts = []
+        last_end = 0
+        for match in matches:
+            image_path = match.group(1).strip()
+            parts.append(prompt[last_end : match.start()])
+            if image_path in selected and image_path not in marker_by_path:
+                vlm_context.images_base64.append(selected[image_path])
+                vlm_context.image_paths.append(image_path)
+                marker_by_path[image_path] = len(vlm_context.images_base64)
+                # Keep original path info and add VLM marker
+                parts.append(
+                    f"Image Path: {image_path}\n"
+                    f"[VLM_IMAGE_{marker_by_path[image_path]}]"
+                )
+            else:
+                parts.append(match.group(0))  # Keep original
+            last_end = match.end()
+        parts.append(prompt[last_end:])
 
-        # First, let's see what matches we find
-        matches = re.findall(image_path_pattern, prompt)
-        self.logger.info(f"Found {len(matches)} image path matches in prompt")
+        if vlm_context.images_dropped:
+            self.logger.info(
+                f"Image budget: sending {len(selected)} of {len(image_paths)} images "
+                f"({vlm_context.images_dropped} dropped, {vlm_context.image_bytes} bytes)"
+            )
 
-        def replace_image_path(match):
-            nonlocal images_processed
+        return "".join(parts), len(vlm_context.images_base64)
 
-            image_path = match.group(1).strip()
-            self.logger.debug(f"Processing image path: '{image_path}'")
+    async def _select_vlm_images(
+        self, image_paths: List[str], vlm_context: VLMQueryContext
+    ) -> Dict[str, str]:
+        """
+        Encode the highest-ranked images that fit the image budget
 
-            # Validate path format (basic check)
-            if not image_path or len(image_path) < 3:
-                self.logger.warning(f"Invalid image path format: {image_path}")
-                return match.group(0)  # Keep original
+        Images are encoded in batches of the remaining image allowance, so
+        lower-ranked images are only read when higher-ranked ones are invalid.
 
-            # Use utility function to validate image file
-            self.logger.debug(f"Calling validate_image_file for: {image_path}")
-            is_valid = validate_image_file(image_path)
-            self.logger.debug(f"Validation result for {image_path}: {is_valid}")
+        Args:
+            image_paths: Distinct image paths, most relevant first
+            vlm_context: Request context that receives budget counters
 
-            if not is_valid:
-                self.logger.warning(f"Image validation failed for: {image_path}")
-                return match.group(0)  # Keep original if validation fails
+        Returns:
+            Dict[str, str]: Selected image path -> base64 encoded image
+        """
+        max_images = getattr(self.config, "vlm_max_images", 0)
+        max_bytes = getattr(self.config, "vlm_max_image_bytes", 0)
+
+        selected = {}
+        position = 0
+        while position < len(image_paths):
+            if max_images:
+                remaining = max_images - len(selected)
+                if remaining <= 0:
+                    break
+            else:
+                remaining = len(image_paths)
+            batch = image_paths[position : position + remaining]
+            position += len(batch)
 
-            try:
-                # Encode image to base64 using utility function
-                self.logger.debug(f"Attempting to encode image: {image_path}")
-                image_base64 = encode_image_to_base64(image_path)
-                if image_base64:
-                    images_processed += 1
-                    # Save base64 to instance variable for later use
-                    self._current_images_base64.append(image_base64)
-
-                    # Keep original path info and add VLM marker
-                    result = f"Image Path: {image_path}\n[VLM_IMAGE_{images_processed}]"
-                    self.logger.debug(
-                        f"Successfully processed image {images_processed}: {image_path}"
-                    )
-                    return result
-                else:
-                    self.logger.error(f"Failed to encode image: {image_path}")
-                    return match.group(0)  # Keep original if encoding failed
+            # Load the batch concurrently, off the event loop
+            encoded = await asyncio.gather(
+                *[asyncio.to_thread(self._load_vlm_image, path) for path in batch]
+            )
+            for image_path, image_base64 in zip(batch, encoded):
+                if not image_base64:
+                    continue
+                image_bytes = len(image_base64) * 3 // 4
+                if max_bytes and vlm_context.image_bytes + image_bytes > max_bytes:
+                    vlm_context.images_dropped += 1
+                    continue
+                selected[image_path] = image_base64
+                vlm_context.image_bytes += image_bytes
+
+        # Images beyond the count budget are never read
+        vlm_context.images_dropped += len(image_paths) - position
+        return selected
+
+    def _load_vlm_image(self, image_path: str) -> str:
+        """
+        Validate and encode an image referenced in the retrieved context
 
-            except Exception as e:
-                self.logger.error(f"Failed to process image {image_path}: {e}")
-                return match.group(0)  # Keep original
+        Runs in a worker thread. Encoded images are cached by path,
+        modification time and size, so unchanged images are not read again.
 
-        # Execute replacement
-        enhanced_prompt = re.sub(
-            image_path_pattern, replace_image_path, enhanced_prompt
-        )
+        Args:
+            image_path: Image path from the prompt
 
-        return enhanced_prompt, images_processed
+        Returns:
+            str: Base64 encoded image, empty string if invalid or unreadable
+        """
+        if len(image_path) < 3:
+            self.logger.warning(f"Invalid image path format: {image_path}")
+            return ""
+
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            self.logger.warning(f"Image file not found: {image_path}")
+            return ""
+        if stat.st_size > VLM_MAX_IMAGE_FILE_BYTES:
+            self.logger.warning(
+                f"Image file too large ({stat.st_size} bytes): {image_path}"
+            )
+            return ""
+
+        cache = getattr(self, "vlm_image_cache", None)
+        cache_key = (image_path, stat.st_mtime_ns, stat.st_size)
+        if cache is not None:
+            image_base64 = cache.get(cache_key)
+            if image_base64 is not None:
+                return image_base64
+
+        try:
+            # Share prepared images with ingest when a preparer is set
+            image_preparer = getattr(self, "image_preparer", None)
+            if image_preparer is not None:
+                prepared = image_preparer.prepare(image_path)
+                image_base64 = prepared.base64 if prepared else ""
+            else:
+                image_base64 = encode_image_to_base64(image_path)
+        except Exception as e:
+            self.logger.error(f"Failed to process image {image_path}: {e}")
+            return ""
+
+        if not image_base64:
+            self.logger.error(f"Failed to encode image: {image_path}")
+        elif cache is not None:
+            cache.put(cache_key, image_base64)
+        return image_base64
 
     def _build_vlm_messages_with_images(
-        self, enhanced_prompt: str, user_query: str
+        self, enhanced_prompt: str, user_query: str, vlm_context: VLMQueryContext
     ) -> List[Dict]:
         """
         Build VLM message format, using markers to correspond images with text positions
@@ -601,11 +1053,12 @@ class QueryMixin:
         Args:
             enhanced_prompt: Enhanced prompt with image markers
             user_query: User query
+            vlm_context: Request context holding the encoded images
 
         Returns:
             List[Dict]: VLM message format
         """
-        images_base64 = getattr(self, "_current_images_base64", [])
+        images_base64 = vlm_context.images_base64
 
         if not images_base64:
             # Pure text mode
@@ -638,11 +1091,13 @@ class QueryMixin:
 
                     # Insert corresponding image
                     if 0 <= image_num < len(images_base64):
+                        image_base64 = images_base64[image_num]
+                        mime_type = detect_base64_image_mime_type(image_base64)
                         content_parts.append(
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/jpeg;base64,{images_base64[image_num]}"
+                                    "url": f"data:{mime_type};base64,{image_base64}"
                                 },
                             }
                         )
@@ -682,18 +1137,25 @@ class QueryMixin:
             content = user_message["content"]
             system_prompt = messages[0]["content"]
 
-            if isinstance(content, str):
-                # Pure text mode
-                result = await self.vision_model_func(
-                    content, system_prompt=system_prompt
-                )
-            else:
-                # Multimodal mode - pass complete messages directly to VLM
-                result = await self.vision_model_func(
-                    "",  # Empty prompt since we're using messages format
-                    messages=messages,
+            vision_model_func = self.vision_model_func
+            if getattr(self, "model_scheduler", None) is not None:
+                vision_model_func = self.model_scheduler.wrap(
+                    vision_model_func, MODEL_VISION
                 )
 
+            with model_call_context(priority=PRIORITY_INTERACTIVE):
+                if isinstance(content, str):
+                    # Pure text mode
+                    result = await vision_model_func(
+                        content, system_prompt=system_prompt
+                    )
+                else:
+                    # Multimodal mode - pass complete messages directly to VLM
+                    result = await vision_model_func(
+                        "",  # Empty prompt since we're using messages format
+                        messages=messages,
+                    )
+
             return result
 
         except Exception as e:
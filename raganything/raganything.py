@@ -33,6 +33,14 @@ from raganything.processor import ProcessorMixin
 from raganything.batch import BatchMixin
 from raganything.utils import get_processor_supports
 from raganything.parser import MineruParser, DoclingParser
+from raganything.mineru_pool import get_mineru_worker_pool
+from raganything.parse_cache import (
+    ParseCacheBlobStore,
+    SQLiteParseCache,
+    get_description_cache_db_path,
+    get_parse_cache_blob_dir,
+    get_parse_cache_db_path,
+)
 
 # Import specialized processors
 from raganything.modalprocessors import (
@@ -42,6 +50,16 @@ from raganything.modalprocessors import (
     GenericModalProcessor,
     ContextExtractor,
     ContextConfig,
+    DocumentContext,
+    DescriptionCache,
+)
+from raganything.modal_dedup import ModalDeduplicator
+from raganything.image_prep import EncodedImageCache, ImagePreparer
+from raganything.scheduler import (
+    MODEL_TEXT,
+    MODEL_VISION,
+    ModelCallScheduler,
+    get_model_scheduler,
 )
 
 
@@ -90,7 +108,33 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
     """Context extractor for providing surrounding content to modal processors."""
 
     parse_cache: Optional[Any] = field(default=None, init=False)
-    """Parse result cache storage using LightRAG KV storage."""
+    """Parse result cache storage (SQLite or LightRAG KV storage)."""
+
+    parse_cache_blobs: Optional[ParseCacheBlobStore] = field(default=None, init=False)
+    """Out-of-line storage for cached content lists (None stores them inline)."""
+
+    parse_cache_stats: Dict[str, int] = field(default_factory=dict, init=False)
+    """Parse cache hit/miss and file hashing counters."""
+
+    description_cache: Optional[DescriptionCache] = field(default=None, init=False)
+    """Cache of modal description responses (None when disabled)."""
+
+    modal_dedup: Optional[ModalDeduplicator] = field(default=None, init=False)
+    """Reuses descriptions of repeated images and tables (None when disabled)."""
+
+    image_preparer: Optional[ImagePreparer] = field(default=None, init=False)
+    """Resizes and re-encodes images for vision model calls (None when disabled)."""
+
+    vlm_image_cache: Optional[EncodedImageCache] = field(default=None, init=False)
+    """Encoded images referenced by VLM enhanced queries, keyed by path and mtime."""
+
+    model_scheduler: Optional[ModelCallScheduler] = field(default=None, init=False)
+    """Process-wide scheduler for multimodal model calls (None when disabled)."""
+
+    _file_fingerprint_index: Dict[str, Dict[str, Any]] = field(
+        default_factory=dict, init=False
+    )
+    """In-memory (size, mtime, inode) -> content hash index keyed by absolute path."""
 
     _parser_installation_checked: bool = field(default=False, init=False)
     """Flag to track if parser installation has been checked."""
@@ -108,9 +152,7 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
         self.logger = logger
 
         # Set up document parser
-        self.doc_parser = (
-            DoclingParser() if self.config.parser == "docling" else MineruParser()
-        )
+        self.doc_parser = self._create_doc_parser()
 
         # Register close method for cleanup
         atexit.register(self.close)
@@ -147,6 +189,89 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
             # Use print instead of logger since logger might be cleaned up already
             print(f"Warning: Failed to finalize RAGAnything storages: {e}")
 
+    def _create_doc_parser(self):
+        """Create document parser according to config.parser"""
+        if self.config.parser == "docling":
+            return DoclingParser(inprocess=self.config.docling_inprocess)
+
+        worker_pool = None
+        if self.config.mineru_worker_pool_size > 0:
+            worker_pool = get_mineru_worker_pool(
+                self.config.mineru_worker_pool_size,
+                self.config.mineru_worker_max_tasks,
+            )
+        return MineruParser(worker_pool=worker_pool)
+
+    def _create_parse_cache(self):
+        """Create parse cache storage according to config.parse_cache_storage"""
+        if self.config.parse_cache_storage == "sqlite":
+            return SQLiteParseCache(
+                get_parse_cache_db_path(
+                    self.lightrag.working_dir, self.lightrag.workspace
+                ),
+                fsync_batch_size=self.config.parse_cache_fsync_batch,
+                compaction_threshold=self.config.parse_cache_compaction_threshold,
+                blob_store=self.parse_cache_blobs,
+            )
+
+        if self.config.parse_cache_storage != "kv":
+            self.logger.warning(
+                f"Unknown parse cache storage '{self.config.parse_cache_storage}', "
+                "falling back to LightRAG KV storage"
+            )
+
+        # Use LightRAG's KV storage
+        return self.lightrag.key_string_value_json_storage_cls(
+            namespace="parse_cache",
+            workspace=self.lightrag.workspace,
+            global_config=self.lightrag.__dict__,
+            embedding_func=self.embedding_func,
+        )
+
+    def _create_description_cache(self) -> Optional[DescriptionCache]:
+        """Create description cache according to config.description_cache_storage"""
+        if not self.config.enable_description_cache:
+            return None
+
+        if self.config.description_cache_storage == "sqlite":
+            return DescriptionCache(
+                SQLiteParseCache(
+                    get_description_cache_db_path(
+                        self.lightrag.working_dir, self.lightrag.workspace
+                    ),
+                    fsync_batch_size=self.config.parse_cache_fsync_batch,
+                    compaction_threshold=self.config.parse_cache_compaction_threshold,
+                    table="modal_description_cache",
+                )
+            )
+
+        if self.config.description_cache_storage != "kv":
+            self.logger.warning(
+                "Unknown description cache storage "
+                f"'{self.config.description_cache_storage}', "
+                "falling back to LightRAG KV storage"
+            )
+
+        return DescriptionCache(
+            self.lightrag.key_string_value_json_storage_cls(
+                namespace="modal_description_cache",
+                workspace=self.lightrag.workspace,
+                global_config=self.lightrag.__dict__,
+                embedding_func=self.embedding_func,
+            )
+        )
+
+    def _create_parse_cache_blob_store(self) -> Optional[ParseCacheBlobStore]:
+        """Create content list blob store if out-of-line parse cache storage is enabled"""
+        if not self.config.parse_cache_out_of_line:
+            return None
+        return ParseCacheBlobStore(
+            get_parse_cache_blob_dir(
+                self.lightrag.working_dir, self.lightrag.workspace
+            ),
+            lru_size=self.config.parse_cache_blob_lru_size,
+        )
+
     def _create_context_config(self) -> ContextConfig:
         """Create context configuration from RAGAnything config"""
         return ContextConfig(
@@ -170,6 +295,55 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
             config=context_config, tokenizer=self.lightrag.tokenizer
         )
 
+    def _create_model_scheduler(self) -> Optional[ModelCallScheduler]:
+        """Get the process-wide model call scheduler limited by this instance's config
+
+        Instances share the scheduler, so the lowest limits configured by any
+        of them apply to all.
+        """
+        if not self.config.model_scheduler_enabled:
+            return None
+
+        scheduler = get_model_scheduler()
+        scheduler.limit(
+            MODEL_VISION,
+            max_concurrency=self.config.vision_max_concurrency,
+            requests_per_minute=self.config.vision_requests_per_minute,
+        )
+        scheduler.limit(
+            MODEL_TEXT,
+            max_concurrency=self.config.text_max_concurrency,
+            requests_per_minute=self.config.text_requests_per_minute,
+        )
+        return scheduler
+
+    def _create_modal_dedup(self) -> Optional[ModalDeduplicator]:
+        """Create the deduplicator for repeated images and tables if enabled"""
+        if not self.config.enable_modal_dedup:
+            return None
+        return ModalDeduplicator(
+            image_hash_threshold=self.config.modal_dedup_image_threshold,
+            dedup_tables=self.config.modal_dedup_tables,
+        )
+
+    def _create_image_preparer(self) -> Optional[ImagePreparer]:
+        """Create the image preparer for vision model calls if enabled"""
+        if not self.config.enable_vlm_image_preparation:
+            return None
+        return ImagePreparer(
+            max_side=self.config.vlm_image_max_side,
+            image_format=self.config.vlm_image_format,
+            quality=self.config.vlm_image_quality,
+            cache_size=self.config.vlm_image_cache_size,
+            reencode_min_bytes=self.config.vlm_image_reencode_min_bytes,
+        )
+
+    def _schedule_model_func(self, func: Optional[Callable], kind: str):
+        """Route a model function through the model call scheduler if enabled"""
+        if self.model_scheduler is None or func is None:
+            return func
+        return self.model_scheduler.wrap(func, kind)
+
     def _initialize_processors(self):
         """Initialize multimodal processors with appropriate model functions"""
         if self.lightrag is None:
@@ -180,35 +354,61 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
         # Create context extractor
         self.context_extractor = self._create_context_extractor()
 
+        # Share one scheduler for model calls across documents and instances
+        self.model_scheduler = self._create_model_scheduler()
+        self.modal_dedup = self._create_modal_dedup()
+        self.image_preparer = self._create_image_preparer()
+        self.vlm_image_cache = EncodedImageCache(self.config.vlm_query_image_cache_size)
+        text_model_func = self._schedule_model_func(self.llm_model_func, MODEL_TEXT)
+        # Models are only known by name if configured
+        text_model_name = self.config.text_model_name
+        if self.vision_model_func:
+            image_model_func = self._schedule_model_func(
+                self.vision_model_func, MODEL_VISION
+            )
+            image_model_name = self.config.vision_model_name
+        else:
+            image_model_func = text_model_func
+            image_model_name = text_model_name
+
         # Create different multimodal processors based on configuration
         self.modal_processors = {}
 
         if self.config.enable_image_processing:
             self.modal_processors["image"] = ImageModalProcessor(
                 lightrag=self.lightrag,
-                modal_caption_func=self.vision_model_func or self.llm_model_func,
+                modal_caption_func=image_model_func,
                 context_extractor=self.context_extractor,
+                description_cache=self.description_cache,
+                image_preparer=self.image_preparer,
+                model_name=image_model_name,
             )
 
         if self.config.enable_table_processing:
             self.modal_processors["table"] = TableModalProcessor(
                 lightrag=self.lightrag,
-                modal_caption_func=self.llm_model_func,
+                modal_caption_func=text_model_func,
                 context_extractor=self.context_extractor,
+                description_cache=self.description_cache,
+                model_name=text_model_name,
             )
 
         if self.config.enable_equation_processing:
             self.modal_processors["equation"] = EquationModalProcessor(
                 lightrag=self.lightrag,
-                modal_caption_func=self.llm_model_func,
+                modal_caption_func=text_model_func,
                 context_extractor=self.context_extractor,
+                description_cache=self.description_cache,
+                model_name=text_model_name,
             )
 
         # Always include generic processor as fallback
         self.modal_processors["generic"] = GenericModalProcessor(
             lightrag=self.lightrag,
-            modal_caption_func=self.llm_model_func,
+            modal_caption_func=text_model_func,
             context_extractor=self.context_extractor,
+            description_cache=self.description_cache,
+            model_name=text_model_name,
         )
 
         self.logger.info("Multimodal processors initialized with context support")
@@ -263,16 +463,16 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
                         self.logger.info(
                             "Initializing parse cache for pre-provided LightRAG instance"
                         )
-                        self.parse_cache = (
-                            self.lightrag.key_string_value_json_storage_cls(
-                                namespace="parse_cache",
-                                workspace=self.lightrag.workspace,
-                                global_config=self.lightrag.__dict__,
-                                embedding_func=self.embedding_func,
-                            )
-                        )
+                        self.parse_cache_blobs = self._create_parse_cache_blob_store()
+                        self.parse_cache = self._create_parse_cache()
                         await self.parse_cache.initialize()
 
+                    # Initialize description cache if not already done
+                    if self.description_cache is None:
+                        self.description_cache = self._create_description_cache()
+                        if self.description_cache is not None:
+                            await self.description_cache.initialize()
+
                     # Initialize processors if not already done
                     if not self.modal_processors:
                         self._initialize_processors()
@@ -324,15 +524,16 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
                 await self.lightrag.initialize_storages()
                 await initialize_pipeline_status()
 
-                # Initialize parse cache storage using LightRAG's KV storage
-                self.parse_cache = self.lightrag.key_string_value_json_storage_cls(
-                    namespace="parse_cache",
-                    workspace=self.lightrag.workspace,
-                    global_config=self.lightrag.__dict__,
-                    embedding_func=self.embedding_func,
-                )
+                # Initialize parse cache storage
+                self.parse_cache_blobs = self._create_parse_cache_blob_store()
+                self.parse_cache = self._create_parse_cache()
                 await self.parse_cache.initialize()
 
+                # Initialize description cache storage
+                self.description_cache = self._create_description_cache()
+                if self.description_cache is not None:
+                    await self.description_cache.initialize()
+
                 # Initialize processors after LightRAG is ready
                 self._initialize_processors()
 
@@ -381,6 +582,11 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
                 tasks.append(self.parse_cache.finalize())
                 self.logger.debug("Scheduled parse cache finalization")
 
+            # Finalize description cache if it exists
+            if self.description_cache is not None:
+                tasks.append(self.description_cache.finalize())
+                self.logger.debug("Scheduled description cache finalization")
+
             # Finalize LightRAG storages if LightRAG is initialized
             if self.lightrag is not None:
                 tasks.append(self.lightrag.finalize_storages())
@@ -428,11 +634,32 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
                 "parser": self.config.parser,
                 "parse_method": self.config.parse_method,
                 "display_content_stats": self.config.display_content_stats,
+                "mineru_worker_pool_size": self.config.mineru_worker_pool_size,
+                "mineru_worker_max_tasks": self.config.mineru_worker_max_tasks,
+                "mineru_group_max_files": self.config.mineru_group_max_files,
+                "mineru_group_max_pages": self.config.mineru_group_max_pages,
+                "docling_inprocess": self.config.docling_inprocess,
             },
             "multimodal_processing": {
                 "enable_image_processing": self.config.enable_image_processing,
                 "enable_table_processing": self.config.enable_table_processing,
                 "enable_equation_processing": self.config.enable_equation_processing,
+                "enable_description_cache": self.config.enable_description_cache,
+                "description_cache_storage": self.config.description_cache_storage,
+                "text_model_name": self.config.text_model_name,
+                "vision_model_name": self.config.vision_model_name,
+                "enable_modal_dedup": self.config.enable_modal_dedup,
+                "modal_dedup_image_threshold": self.config.modal_dedup_image_threshold,
+                "modal_dedup_tables": self.config.modal_dedup_tables,
+                "enable_trivial_image_filter": self.config.enable_trivial_image_filter,
+                "trivial_image_action": self.config.trivial_image_action,
+                "enable_vlm_image_preparation": self.config.enable_vlm_image_preparation,
+                "vlm_image_max_side": self.config.vlm_image_max_side,
+                "vlm_image_format": self.config.vlm_image_format,
+                "vlm_image_reencode_min_bytes": self.config.vlm_image_reencode_min_bytes,
+                "vlm_max_images": self.config.vlm_max_images,
+                "vlm_max_image_bytes": self.config.vlm_max_image_bytes,
+                "multimodal_query_pipelined": self.config.multimodal_query_pipelined,
             },
             "context_extraction": {
                 "context_window": self.config.context_window,
@@ -442,6 +669,20 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
                 "include_captions": self.config.include_captions,
                 "filter_content_types": self.config.context_filter_content_types,
             },
+            "parse_cache": {
+                "storage": self.config.parse_cache_storage,
+                "fsync_batch": self.config.parse_cache_fsync_batch,
+                "compaction_threshold": self.config.parse_cache_compaction_threshold,
+                "out_of_line": self.config.parse_cache_out_of_line,
+                "blob_lru_size": self.config.parse_cache_blob_lru_size,
+            },
+            "model_scheduler": {
+                "enabled": self.config.model_scheduler_enabled,
+                "vision_max_concurrency": self.config.vision_max_concurrency,
+                "text_max_concurrency": self.config.text_max_concurrency,
+                "vision_requests_per_minute": self.config.vision_requests_per_minute,
+                "text_requests_per_minute": self.config.text_requests_per_minute,
+            },
             "batch_processing": {
                 "max_concurrent_files": self.config.max_concurrent_files,
                 "supported_file_extensions": self.config.supported_file_extensions,
@@ -488,9 +729,14 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
             )
             return
 
+        # Build the context index once and share it across processors
+        document_context = self.create_document_context(content_source, content_format)
+
         for processor_name, processor in self.modal_processors.items():
             try:
-                processor.set_content_source(content_source, content_format)
+                processor.set_content_source(
+                    content_source, content_format, document_context.context_index
+                )
                 self.logger.debug(f"Set content source for {processor_name} processor")
             except Exception as e:
                 self.logger.error(
@@ -501,6 +747,38 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
             f"Content source set for context extraction (format: {content_format})"
         )
 
+    def create_document_context(
+        self, content_source, content_format: str = "auto", doc_id: str = None
+    ) -> DocumentContext:
+        """Create the context extraction state for a single document
+
+        Unlike set_content_source_for_context, nothing is stored on the shared
+        modal processors; the returned context is passed through multimodal
+        processing, so several documents can be processed concurrently.
+
+        Args:
+            content_source: Source content for context extraction (e.g., MinerU content list)
+            content_format: Format of content source ("minerU", "text_chunks", "auto")
+            doc_id: Document ID the context belongs to
+
+        Returns:
+            DocumentContext: Content source with its prebuilt context index
+        """
+        context_index = None
+        if (
+            self.context_extractor is not None
+            and isinstance(content_source, list)
+            and content_format in ("minerU", "auto")
+        ):
+            context_index = self.context_extractor.build_index(content_source)
+
+        return DocumentContext(
+            content_source=content_source,
+            content_format=content_format,
+            context_index=context_index,
+            doc_id=doc_id,
+        )
+
     def update_context_config(self, **context_kwargs):
         """Update context extraction configuration
 
@@ -520,9 +798,17 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
         if self.lightrag and self.modal_processors:
             try:
                 self.context_extractor = self._create_context_extractor()
-                # Update all processors with new context extractor
+                # Update all processors with new context extractor, rebuilding
+                # their context index for the new configuration
+                context_index = None
                 for processor_name, processor in self.modal_processors.items():
                     processor.context_extractor = self.context_extractor
+                    if processor.context_index is not None:
+                        if context_index is None:
+                            context_index = self.context_extractor.build_index(
+                                processor.content_source
+                            )
+                        processor.context_index = context_index
 
                 self.logger.info(
                     "Context configuration updated and applied to all processors"
@@ -565,4 +851,19 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
                     "enabled": True,
                 }
 
+        if self.model_scheduler is not None:
+            base_info["model_scheduler"] = self.model_scheduler.get_metrics()
+
+        if self.description_cache is not None:
+            base_info["description_cache"] = self.description_cache.get_stats()
+
+        if self.modal_dedup is not None:
+            base_info["modal_dedup"] = self.modal_dedup.get_stats()
+
+        if self.image_preparer is not None:
+            base_info["image_preparer"] = self.image_preparer.get_stats()
+
+        if self.vlm_image_cache is not None:
+            base_info["vlm_image_cache"] = self.vlm_image_cache.get_stats()
+
         return base_info
@@ -0,0 +1,456 @@
+"""
+Model call scheduler for RAGAnything
+
+Contains a process-wide scheduler for multimodal LLM/VLM calls. Vision and
+text models have separate concurrency limits and token-bucket rate limits,
+interactive query calls are served before bulk ingest calls, and queued calls
+from different documents are served round-robin so one large document cannot
+starve the others.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+from lightrag.utils import logger
+
+MODEL_VISION = "vision"
+MODEL_TEXT = "text"
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 1
+PRIORITY_NAMES = {PRIORITY_INTERACTIVE: "interactive", PRIORITY_BULK: "bulk"}
+
+_current_priority: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "raganything_model_call_priority", default=PRIORITY_BULK
+)
+_current_owner: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "raganything_model_call_owner", default=None
+)
+
+
+@contextmanager
+def model_call_context(owner: Optional[str] = None, priority: Optional[int] = None):
+    """
+    Set the owner and priority of model calls made in the current context
+
+    Tasks created inside the block inherit the values, so wrapping an
+    ``asyncio.gather`` applies them to every call made by the gathered tasks.
+
+    Args:
+        owner: Owner used for fair sharing (typically the document ID)
+        priority: PRIORITY_INTERACTIVE or PRIORITY_BULK
+    """
+    owner_token = _current_owner.set(owner) if owner is not None else None
+    priority_token = _current_priority.set(priority) if priority is not None else None
+    try:
+        yield
+    finally:
+        if priority_token is not None:
+            _current_priority.reset(priority_token)
+        if owner_token is not None:
+            _current_owner.reset(owner_token)
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers reserve a token and are told how long to wait for it, so
+    reservations are served in call order without holding a lock while
+    waiting. A non-positive rate disables limiting.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens added per second (<= 0 for unlimited)
+            capacity: Maximum number of stored tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve one token and return the seconds to wait before using it"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class _ModelLane:
+    """Concurrency, rate limit, queues and metrics for one model kind"""
+
+    def __init__(self, max_concurrency: int, requests_per_minute: float):
+        self.max_concurrency = max(1, max_concurrency)
+        self.bucket = TokenBucket(requests_per_minute / 60.0, self.max_concurrency)
+        self.limited = False  # Limits were set by a RAGAnything instance
+        self.in_flight = 0
+        # priority -> owner -> waiting futures; owners rotate for round-robin
+        self.queues: Dict[int, "OrderedDict[Any, deque]"] = {}
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.completed = 0
+        self.failed = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self.rate_limit_wait_total = 0.0
+        self.by_priority: Dict[int, Dict[str, float]] = {}
+
+
+class ModelCallScheduler:
+    """
+    Process-wide scheduler for multimodal model calls
+
+    Every call acquires a slot for its model kind ("vision" or "text"). Free
+    slots go to the highest-priority queue first; within a priority class
+    they rotate between owners (documents), and each owner's calls are served
+    in order. Once a slot is granted, the call also takes a token from the
+    kind's token bucket, so bursts stay within the provider's request rate.
+
+    The scheduler is meant to be shared by every RAGAnything instance in the
+    process, see ``get_model_scheduler``. Instances apply their limits with
+    ``limit``, which never raises limits set by another instance.
+    """
+
+    def __init__(
+        self,
+        vision_max_concurrency: int = 4,
+        text_max_concurrency: int = 4,
+        vision_requests_per_minute: float = 0,
+        text_requests_per_minute: float = 0,
+    ):
+        """
+        Initialize model call scheduler
+
+        Args:
+            vision_max_concurrency: Maximum concurrent vision model calls
+            text_max_concurrency: Maximum concurrent text model calls
+            vision_requests_per_minute: Vision model rate limit (0 for unlimited)
+            text_requests_per_minute: Text model rate limit (0 for unlimited)
+        """
+        self._lock = threading.Lock()
+        self._lanes: Dict[str, _ModelLane] = {
+            MODEL_VISION: _ModelLane(
+                vision_max_concurrency, vision_requests_per_minute
+            ),
+            MODEL_TEXT: _ModelLane(text_max_concurrency, text_requests_per_minute),
+        }
+
+    def configure(
+        self,
+        kind: str,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+    ) -> None:
+        """
+        Update the limits of a model kind
+
+        Args:
+            kind: MODEL_VISION or MODEL_TEXT
+            max_concurrency: New maximum concurrent calls
+            requests_per_minute: New rate limit (0 for unlimited)
+        """
+        with self._lock:
+            lane = self._lanes[kind]
+            previous = self._limits_locked(lane)
+            self._set_limits_locked(
+                lane,
+                previous[0] if max_concurrency is None else max_concurrency,
+                previous[1] if requests_per_minute is None else requests_per_minute,
+            )
+            current = self._limits_locked(lane)
+            waiters = self._grant_locked(lane)
+        self._wake(lane, waiters)
+        self._log_limits(kind, previous, current)
+
+    def limit(
+        self, kind: str, max_concurrency: int, requests_per_minute: float
+    ) -> None:
+        """
+        Apply a RAGAnything instance's limits to a model kind
+
+        The first call sets the limits. Later calls, from other instances
+        sharing the scheduler, only lower them: the lower concurrency and the
+        lower rate limit win, where a rate limit of 0 (unlimited) is higher
+        than any other. Requested limits that are not applied are logged.
+
+        Args:
+            kind: MODEL_VISION or MODEL_TEXT
+            max_concurrency: Maximum concurrent calls
+            requests_per_minute: Rate limit (0 for unlimited)
+        """
+        requested = (max(1, max_concurrency), float(max(0, requests_per_minute)))
+        with self._lock:
+            lane = self._lanes[kind]
+            previous = self._limits_locked(lane)
+            concurrency, rate = requested
+            if lane.limited:
+                concurrency = min(concurrency, previous[0])
+                if previous[1] and (not rate or rate > previous[1]):
+                    rate = previous[1]
+            lane.limited = True
+            self._set_limits_locked(lane, concurrency, rate)
+            current = self._limits_locked(lane)
+            waiters = self._grant_locked(lane)
+        self._wake(lane, waiters)
+        self._log_limits(kind, previous, current)
+        if current != requested:
+            logger.warning(
+                f"Model scheduler keeps lower {kind} limits set by another "
+                f"instance: {self._format_limits(current)} instead of "
+                f"{self._format_limits(requested)}"
+            )
+
+    @staticmethod
+    def _limits_locked(lane: _ModelLane) -> tuple:
+        """(max_concurrency, requests_per_minute) of a lane"""
+        return lane.max_concurrency, round(lane.bucket.rate * 60.0, 6)
+
+    @staticmethod
+    def _set_limits_locked(
+        lane: _ModelLane, max_concurrency: int, requests_per_minute: float
+    ) -> None:
+        lane.max_concurrency = max(1, max_concurrency)
+        lane.bucket.capacity = float(lane.max_concurrency)
+        lane.bucket.rate = max(0, requests_per_minute) / 60.0
+
+    @staticmethod
+    def _format_limits(limits: tuple) -> str:
+        max_concurrency, requests_per_minute = limits
+        rate = f"{requests_per_minute:g}/min" if requests_per_minute else "unlimited"
+        return f"max_concurrency={max_concurrency}, rate={rate}"
+
+    def _log_limits(self, kind: str, previous: tuple, current: tuple) -> None:
+        if current != previous:
+            logger.info(
+                f"Model scheduler {kind} limits changed: "
+                f"{self._format_limits(previous)} -> {self._format_limits(current)}"
+            )
+
+    @property
+    def max_in_flight(self) -> int:
+        """Total number of model calls that can run at once across all kinds"""
+        return sum(lane.max_concurrency for lane in self._lanes.values())
+
+    def _grant_locked(self, lane: _ModelLane) -> list:
+        """Hand free slots to waiters; returns the futures to wake"""
+        granted = []
+        while lane.in_flight < lane.max_concurrency and lane.queue_depth:
+            for priority in sorted(lane.queues):
+                owners = lane.queues[priority]
+                if owners:
+                    break
+            else:
+                break
+
+            owner, waiters = next(iter(owners.items()))
+            future = waiters.popleft()
+            lane.queue_depth -= 1
+            if waiters:
+                owners.move_to_end(owner)
+            else:
+                del owners[owner]
+
+            if future.done():
+                # Cancelled while queued
+                continue
+            lane.in_flight += 1
+            granted.append(future)
+        return granted
+
+    def _wake(self, lane: _ModelLane, futures: list) -> None:
+        """Resolve granted futures on their own event loops"""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for future in futures:
+            loop = future.get_loop()
+            if loop is running:
+                self._resolve(lane, future)
+            else:
+                loop.call_soon_threadsafe(self._resolve, lane, future)
+
+    def _resolve(self, lane: _ModelLane, future: asyncio.Future) -> None:
+        if future.done():
+            # Waiter was cancelled after its slot was granted
+            self._release(lane)
+        else:
+            future.set_result(True)
+
+    def _release(self, lane: _ModelLane) -> None:
+        with self._lock:
+            lane.in_flight -= 1
+            waiters = self._grant_locked(lane)
+        self._wake(lane, waiters)
+
+    async def _acquire(self, lane: _ModelLane, owner: Any, priority: int) -> None:
+        future = asyncio.get_running_loop().create_future()
+        with self._lock:
+            lane.queues.setdefault(priority, OrderedDict()).setdefault(
+                owner, deque()
+            ).append(future)
+            lane.queue_depth += 1
+            lane.max_queue_depth = max(lane.max_queue_depth, lane.queue_depth)
+            waiters = self._grant_locked(lane)
+        self._wake(lane, waiters)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = future.done() and not future.cancelled()
+                if not granted:
+                    waiting = lane.queues.get(priority, {}).get(owner)
+                    if waiting is not None and future in waiting:
+                        waiting.remove(future)
+                        lane.queue_depth -= 1
+                        if not waiting:
+                            del lane.queues[priority][owner]
+            if granted:
+                self._release(lane)
+            raise
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        kind: str,
+        owner: Optional[str] = None,
+        priority: Optional[int] = None,
+    ):
+        """
+        Hold a model call slot for the duration of the block
+
+        Args:
+            kind: MODEL_VISION or MODEL_TEXT
+            owner: Owner for fair sharing (defaults to the current context's owner)
+            priority: Priority class (defaults to the current context's priority)
+        """
+        lane = self._lanes[kind]
+        owner = owner if owner is not None else _current_owner.get()
+        priority = priority if priority is not None else _current_priority.get()
+
+        start = time.monotonic()
+        await self._acquire(lane, owner, priority)
+        try:
+            queued = time.monotonic() - start
+            delay = lane.bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            waited = time.monotonic() - start
+
+            with self._lock:
+                lane.wait_time_total += waited
+                lane.wait_time_max = max(lane.wait_time_max, waited)
+                lane.rate_limit_wait_total += waited - queued
+                stats = lane.by_priority.setdefault(
+                    priority, {"calls": 0, "wait_time_total": 0.0}
+                )
+                stats["calls"] += 1
+                stats["wait_time_total"] += waited
+
+            try:
+                yield
+            except BaseException:
+                with self._lock:
+                    lane.failed += 1
+                raise
+            else:
+                with self._lock:
+                    lane.completed += 1
+        finally:
+            self._release(lane)
+
+    def wrap(self, func: Callable, kind: str) -> Callable:
+        """
+        Wrap an async model function so every call goes through the scheduler
+
+        Args:
+            func: Async model function (e.g. vision_model_func or llm_model_func)
+            kind: MODEL_VISION or MODEL_TEXT
+
+        Returns:
+            Callable: Scheduled async function with the same signature
+        """
+        if func is None or getattr(func, "_raganything_scheduled_kind", None) == kind:
+            return func
+
+        @wraps(func)
+        async def scheduled(*args, **kwargs):
+            async with self.slot(kind):
+                return await func(*args, **kwargs)
+
+        scheduled._raganything_scheduled_kind = kind
+        return scheduled
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get queue depth and wait time metrics per model kind
+
+        Returns:
+            Dict[str, Any]: Metrics keyed by model kind
+        """
+        metrics = {}
+        with self._lock:
+            for kind, lane in self._lanes.items():
+                calls = sum(s["calls"] for s in lane.by_priority.values())
+                metrics[kind] = {
+                    "max_concurrency": lane.max_concurrency,
+                    "requests_per_minute": lane.bucket.rate * 60.0,
+                    "in_flight": lane.in_flight,
+                    "queue_depth": lane.queue_depth,
+                    "max_queue_depth": lane.max_queue_depth,
+                    "queued_owners": sum(len(o) for o in lane.queues.values()),
+                    "completed": lane.completed,
+                    "failed": lane.failed,
+                    "mean_wait_time": lane.wait_time_total / calls if calls else 0.0,
+                    "max_wait_time": lane.wait_time_max,
+                    "rate_limit_wait_time": lane.rate_limit_wait_total,
+                    "by_priority": {
+                        PRIORITY_NAMES.get(priority, str(priority)): {
+                            "calls": stats["calls"],
+                            "mean_wait_time": stats["wait_time_total"] / stats["calls"],
+                        }
+                        for priority, stats in sorted(lane.by_priority.items())
+                    },
+                }
+        return metrics
+
+
+_model_scheduler: Optional[ModelCallScheduler] = None
+_model_scheduler_lock = threading.Lock()
+
+
+def get_model_scheduler() -> ModelCallScheduler:
+    """
+    Get the process-wide model call scheduler, creating it on first use
+
+    Returns:
+        ModelCallScheduler: Scheduler shared by all RAGAnything instances
+    """
+    global _model_scheduler
+    with _model_scheduler_lock:
+        if _model_scheduler is None:
+            _model_scheduler = ModelCallScheduler()
+            logger.debug("Created process-wide model call scheduler")
+        return _model_scheduler
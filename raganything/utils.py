@@ -5,10 +5,14 @@ Contains helper functions for content separation, text insertion, and other util
 """
 
 import base64
-from typing import Dict, List, Any, Tuple
+import hashlib
+from typing import Dict, List, Any, Tuple, Union
 from pathlib import Path
 from lightrag.utils import logger
 
+# Read size used when streaming file contents through a hash function
+FILE_HASH_CHUNK_SIZE = 1024 * 1024
+
 
 def separate_content(
     content_list: List[Dict[str, Any]],
@@ -56,6 +60,32 @@ def separate_content(
     return text_content, multimodal_items
 
 
+def compute_file_content_hash(
+    file_path: Union[str, Path], chunk_size: int = FILE_HASH_CHUNK_SIZE
+) -> str:
+    """
+    Compute a content hash of a file by streaming its bytes through BLAKE2b
+
+    The file is read in fixed-size chunks so memory usage stays constant
+    regardless of file size.
+
+    Args:
+        file_path: Path to the file
+        chunk_size: Number of bytes read per iteration
+
+    Returns:
+        str: Hex digest of the file contents
+    """
+    hasher = hashlib.blake2b(digest_size=32)
+    with open(file_path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
 def encode_image_to_base64(image_path: str) -> str:
     """
     Encode image file to base64 string
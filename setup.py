@@ -63,7 +63,12 @@ extras_require = {
     "image": ["Pillow>=10.0.0"],  # For image format conversion (BMP, TIFF, GIF, WebP)
     "text": ["reportlab>=4.0.0"],  # For text file to PDF conversion (TXT, MD)
     "office": [],  # Office document processing requires LibreOffice (external program)
-    "all": ["Pillow>=10.0.0", "reportlab>=4.0.0"],  # All optional features
+    "docling": ["ijson>=3.1"],  # Streaming Docling JSON conversion (large documents)
+    "all": [
+        "Pillow>=10.0.0",
+        "reportlab>=4.0.0",
+        "ijson>=3.1",
+    ],  # All optional features
     "markdown": [
         "markdown>=3.4.0",
         "weasyprint>=60.0",